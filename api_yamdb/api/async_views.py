@@ -0,0 +1,64 @@
+"""
+Асинхронные (ASGI) варианты эндпоинтов чтения.
+
+Django 3.2 не умеет асинхронно работать с ORM и выполняет синхронные
+представления под ASGI в одном общем потоке. Здесь запросы чтения
+выполняет то же DRF-представление (ViewSet.as_view(actions)), но в пуле
+потоков, поэтому чтения идут параллельно, а ответы совпадают с WSGI.
+"""
+
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections
+from django.urls import URLPattern
+
+
+def with_connections(sync_view):
+    """
+    Представление для потока пула. Сигналы request_started/finished
+    ASGI-обработчик отправляет в другом потоке, поэтому соединения
+    с базой этого потока закрываются (или возвращаются в пул)
+    здесь же, как в close_old_connections по этим сигналам.
+    """
+
+    def view(request, *args, **kwargs):
+        close_old_connections()
+        try:
+            return sync_view(request, *args, **kwargs)
+        finally:
+            close_old_connections()
+
+    return view
+
+
+def async_read_view(sync_view):
+    """Асинхронная обертка DRF-представления вьюсета."""
+
+    run_in_pool = sync_to_async(
+        with_connections(sync_view), thread_sensitive=False
+    )
+    run_sync = sync_to_async(sync_view)
+
+    async def view(request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD', 'OPTIONS'):
+            # Запись выполняется в общем потоке, как у синхронных
+            # представлений под ASGI.
+            return await run_sync(request, *args, **kwargs)
+        return await run_in_pool(request, *args, **kwargs)
+
+    view.csrf_exempt = True
+    view.cls = sync_view.cls
+    view.actions = sync_view.actions
+    return view
+
+
+def async_read_urls(urls, viewsets):
+    """Заменяет маршруты вьюсетов viewsets асинхронными вариантами."""
+
+    return [
+        URLPattern(
+            url.pattern, async_read_view(url.callback),
+            url.default_args, url.name,
+        )
+        if getattr(url.callback, 'cls', None) in viewsets else url
+        for url in urls
+    ]
@@ -0,0 +1,53 @@
+from django.conf import settings
+from django.db import transaction
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from api.cache import CACHE_KEY_PREFIX, get_cache
+
+# Не попадают в кэш и не перезаписываются при сохранении request.user.
+DEFERRED_USER_FIELDS = ('password', 'confirmation_code')
+
+
+def _user_key(user_id):
+    return f'{CACHE_KEY_PREFIX}:user:{user_id}'
+
+
+def forget_user(user_id):
+    """Удаляет пользователя из кэша после фиксации транзакции."""
+
+    transaction.on_commit(lambda: get_cache().delete(_user_key(user_id)))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT-аутентификация, которая хранит пользователя в кэше
+    USER_CACHE_TIMEOUT секунд вместо запроса к базе на каждый запрос.
+    Запись сбрасывается при сохранении и удалении пользователя.
+    """
+
+    def get_user(self, validated_token):
+        if jwt_settings.USER_ID_CLAIM not in validated_token:
+            return super().get_user(validated_token)
+        user_id = validated_token[jwt_settings.USER_ID_CLAIM]
+        cache = get_cache()
+        key = _user_key(user_id)
+        user = cache.get(key)
+        if user is not None:
+            return user
+
+        try:
+            user = self.user_model.objects.defer(
+                *DEFERRED_USER_FIELDS
+            ).get(**{jwt_settings.USER_ID_FIELD: user_id})
+        except self.user_model.DoesNotExist:
+            raise AuthenticationFailed(
+                'Пользователь не найден.', code='user_not_found'
+            )
+        if not user.is_active:
+            raise AuthenticationFailed(
+                'Пользователь неактивен.', code='user_inactive'
+            )
+        cache.set(key, user, settings.USER_CACHE_TIMEOUT)
+        return user
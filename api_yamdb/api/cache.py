@@ -0,0 +1,108 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+CACHE_KEY_PREFIX = 'api-cache'
+
+
+def get_cache():
+    """Бэкенд кэша ответов API, выбранный в настройках."""
+
+    return caches[settings.API_CACHE_ALIAS]
+
+
+def _version_key(prefix):
+    return f'{CACHE_KEY_PREFIX}:version:{prefix}'
+
+
+def _stats_key(prefix, event):
+    return f'{CACHE_KEY_PREFIX}:stats:{prefix}:{event}'
+
+
+def get_versions(prefixes):
+    """
+    Версии ресурсов - время их последнего изменения в наносекундах.
+    Новая версия отменяет старые ключи кэша и ETag.
+    """
+
+    cache = get_cache()
+    keys = {_version_key(prefix): prefix for prefix in prefixes}
+    versions = cache.get_many(keys)
+    missing = [key for key in keys if key not in versions]
+    if missing:
+        now = time.time_ns()
+        for key in missing:
+            cache.add(key, now, None)
+        versions.update(cache.get_many(missing))
+        for key in missing:
+            versions.setdefault(key, now)
+    return {keys[key]: version for key, version in versions.items()}
+
+
+def invalidate(*prefixes):
+    """Обновляет версии ресурсов после фиксации транзакции."""
+
+    def bump():
+        now = time.time_ns()
+        get_cache().set_many(
+            {_version_key(prefix): now for prefix in prefixes}, None
+        )
+
+    transaction.on_commit(bump)
+
+
+def _request_digest(request, versions):
+    params = '&'.join(
+        f'{name}={value}'
+        for name, values in sorted(request.query_params.lists())
+        for value in values
+    )
+    stamp = ','.join(
+        f'{prefix}={versions[prefix]}' for prefix in sorted(versions)
+    )
+    media_type = getattr(request, 'accepted_media_type', '')
+    return hashlib.md5(
+        f'{media_type} {request.get_host()}{request.path}?{params}#{stamp}'
+        .encode()
+    ).hexdigest()
+
+
+def make_key(prefix, request, versions):
+    """Ключ ответа: эндпоинт, версии, адрес и отсортированные параметры."""
+
+    return f'{CACHE_KEY_PREFIX}:{prefix}:{_request_digest(request, versions)}'
+
+
+def make_etag(request, versions):
+    """Строгий ETag ответа по версиям ресурсов и адресу запроса."""
+
+    return f'"{_request_digest(request, versions)}"'
+
+
+def count(prefix, event):
+    """Увеличивает счетчик попаданий/промахов кэша."""
+
+    cache = get_cache()
+    key = _stats_key(prefix, event)
+    if cache.add(key, 1, None):
+        return
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, None)
+
+
+def get_stats(prefixes):
+    """Возвращает {эндпоинт: {'hits': n, 'misses': m}}."""
+
+    cache = get_cache()
+    return {
+        prefix: {
+            'hits': cache.get(_stats_key(prefix, 'hits'), 0),
+            'misses': cache.get(_stats_key(prefix, 'misses'), 0),
+        }
+        for prefix in prefixes
+    }
@@ -0,0 +1,46 @@
+from django.conf import settings
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.checks import Tags, Warning, register
+
+from api.cache import get_cache
+
+
+@register(Tags.caches)
+def check_api_cache_shared(app_configs, **kwargs):
+    """
+    Версии ресурсов (ETag, Last-Modified, ключи кэша ответов) хранятся
+    в кэше API_CACHE_ALIAS. В LocMemCache каждый процесс видит только
+    свои изменения и отвечает 304 на устаревшие данные других процессов.
+    """
+
+    if settings.DEBUG or not isinstance(get_cache(), LocMemCache):
+        return []
+    return [Warning(
+        f'Кэш API_CACHE_ALIAS = {settings.API_CACHE_ALIAS!r} хранится '
+        'в памяти процесса.',
+        hint='При нескольких процессах сервера укажите общий кэш '
+             '(Memcached, Redis, база данных), иначе ETag и кэш ответов '
+             'не видят изменений из других процессов.',
+        id='api.W001',
+    )]
+
+
+@register(Tags.caches)
+def check_replica_pin_shared(app_configs, **kwargs):
+    """
+    Чтение с default после записи (REPLICA_PIN_SECONDS) отмечается
+    в кэше API_CACHE_ALIAS. В LocMemCache запись в одном процессе
+    не переключает на default чтения того же клиента в других.
+    """
+
+    if (settings.DEBUG or not settings.DATABASE_REPLICAS
+            or not isinstance(get_cache(), LocMemCache)):
+        return []
+    return [Warning(
+        'Чтение с default после записи отмечается в памяти процесса '
+        f'(API_CACHE_ALIAS = {settings.API_CACHE_ALIAS!r}).',
+        hint='При нескольких процессах сервера укажите общий кэш, иначе '
+             'клиент может не увидеть свою запись, если следующий '
+             'запрос попадет в другой процесс.',
+        id='api.W002',
+    )]
@@ -1,18 +1,73 @@
+from django.conf import settings
+from django.db.models import Exists, OuterRef
 from django_filters import rest_framework as filters
+from rest_framework.filters import BaseFilterBackend
 
-from reviews.models import Title
+from api import cache as api_cache
+from reviews.models import Category, Genre, GenreTitle, Title
+from reviews.search import get_search_backend
 
 
-class TitleFilter(filters.FilterSet):
-    """Фильтр выборки произведений по определенным полям."""
+def split_slugs(values):
+    """Слаги из повторяющихся параметров и списков через запятую."""
+
+    return [
+        slug for value in values for slug in value.split(',') if slug
+    ]
+
+
+def resolve_slugs(model, cache_prefix, slugs, lookup):
+    """
+    Переводит слаги в id по уникальному индексу slug.
+    Возвращает {слаг: [id]}; результат кэшируется до изменения модели.
+    """
 
-    category = filters.CharFilter(
-        field_name='category__slug',
-        lookup_expr='icontains'
+    cache = api_cache.get_cache()
+    version = api_cache.get_versions((cache_prefix,))[cache_prefix]
+    keys = {
+        f'{api_cache.CACHE_KEY_PREFIX}:slugs:{cache_prefix}:{version}:'
+        f'{lookup}:{slug}': slug
+        for slug in slugs
+    }
+    cached = cache.get_many(keys)
+    resolved = {keys[key]: ids for key, ids in cached.items()}
+    missing = [slug for slug in slugs if slug not in resolved]
+    if lookup == 'exact' and missing:
+        found = dict(
+            model.objects.filter(slug__in=missing).values_list('slug', 'pk')
+        )
+        for slug in missing:
+            resolved[slug] = [found[slug]] if slug in found else []
+    elif missing:
+        for slug in missing:
+            resolved[slug] = list(
+                model.objects.filter(
+                    slug__startswith=slug
+                ).values_list('pk', flat=True)
+            )
+    cache.set_many(
+        {key: resolved[slug] for key, slug in keys.items()
+         if slug in missing},
+        settings.API_CACHE_TIMEOUT,
     )
-    genre = filters.CharFilter(
-        field_name='genre__slug',
-        lookup_expr='icontains'
+    return resolved
+
+
+class TitleFilter(filters.FilterSet):
+    """
+    Фильтр выборки произведений по определенным полям.
+    Слаги категории и жанров сначала переводятся в id
+    (точное совпадение или по началу слага, см. TITLE_SLUG_LOOKUP),
+    затем произведения фильтруются по внешним ключам.
+    Несколько жанров: ?genre=a,b или ?genre=a&genre=b,
+    ?genre_mode=all требует все жанры, по умолчанию любой из них.
+    """
+
+    category = filters.CharFilter(method='filter_category')
+    genre = filters.CharFilter(method='filter_genre')
+    genre_mode = filters.ChoiceFilter(
+        choices=(('any', 'any'), ('all', 'all')),
+        method='filter_genre_mode',
     )
     name = filters.CharFilter(
         field_name='name',
@@ -26,3 +81,53 @@ class TitleFilter(filters.FilterSet):
     class Meta:
         model = Title
         fields = ('category', 'genre', 'name', 'year')
+
+    @property
+    def slug_lookup(self):
+        return settings.TITLE_SLUG_LOOKUP
+
+    def filter_category(self, queryset, name, value):
+        if self.slug_lookup == 'icontains':
+            return queryset.filter(category__slug__icontains=value)
+        slugs = split_slugs(self.data.getlist(name))
+        resolved = resolve_slugs(
+            Category, 'categories', slugs, self.slug_lookup
+        )
+        return queryset.filter(category_id__in=[
+            pk for ids in resolved.values() for pk in ids
+        ])
+
+    def filter_genre(self, queryset, name, value):
+        if self.slug_lookup == 'icontains':
+            return queryset.filter(genre__slug__icontains=value)
+        slugs = split_slugs(self.data.getlist(name))
+        resolved = resolve_slugs(Genre, 'genres', slugs, self.slug_lookup)
+        if self.data.get('genre_mode') == 'all':
+            groups = [resolved[slug] for slug in slugs]
+        else:
+            groups = [[pk for ids in resolved.values() for pk in ids]]
+        for ids in groups:
+            queryset = queryset.filter(Exists(
+                GenreTitle.objects.filter(
+                    title=OuterRef('pk'), genre_id__in=ids
+                )
+            ))
+        return queryset
+
+    def filter_genre_mode(self, queryset, name, value):
+        return queryset
+
+
+class TitleSearchFilter(BaseFilterBackend):
+    """
+    Полнотекстовый поиск по названию и описанию произведения
+    (?search=...), результаты упорядочены по релевантности.
+    """
+
+    search_param = 'search'
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, '').strip()
+        if not query:
+            return queryset
+        return get_search_backend().search(queryset, query)
@@ -1,9 +1,207 @@
-from rest_framework import filters, mixins, viewsets
+import hashlib
+import time
 
+from django.conf import settings
+from django.http import Http404
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework import filters, mixins, permissions, viewsets
+from rest_framework.response import Response
+
+from api import cache
 from api.permissions import AdminOrReadOnly
+from api_yamdb.routers import primary_reads, reading_replicas, replica_reads
+
+
+class ReplicaReadMixin:
+    """
+    Безопасные запросы читают данные с реплик (api_yamdb.routers).
+    Клиент, который только что изменил данные, REPLICA_PIN_SECONDS
+    секунд читает с default, чтобы увидеть свои изменения.
+    Клиент определяется по заголовку Authorization или по IP.
+
+    Реплика считается догнавшей default за REPLICA_PIN_SECONDS.
+    Ответ, который получит ETag и попадет в кэш, читается с реплики,
+    только если ресурс не менялся дольше этого времени, иначе -
+    с default, чтобы данные совпадали с версией ресурса.
+    """
+
+    @staticmethod
+    def _pin_key(request):
+        client = (request.META.get('HTTP_AUTHORIZATION')
+                  or request.META.get('REMOTE_ADDR', ''))
+        digest = hashlib.md5(client.encode()).hexdigest()
+        return f'{cache.CACHE_KEY_PREFIX}:replica-pin:{digest}'
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method not in permissions.SAFE_METHODS:
+            response = super().dispatch(request, *args, **kwargs)
+            if response.status_code < 400:
+                cache.get_cache().set(
+                    self._pin_key(request), True,
+                    settings.REPLICA_PIN_SECONDS,
+                )
+            return response
+        if (not settings.DATABASE_REPLICAS
+                or cache.get_cache().get(self._pin_key(request))):
+            return super().dispatch(request, *args, **kwargs)
+        with replica_reads():
+            return super().dispatch(request, *args, **kwargs)
+
+    def get_response(self, handler, versions, request, *args, **kwargs):
+        changed = time.time_ns() - max(versions.values())
+        if (reading_replicas()
+                and changed < settings.REPLICA_PIN_SECONDS * 10 ** 9):
+            with primary_reads():
+                return super().get_response(
+                    handler, versions, request, *args, **kwargs
+                )
+        return super().get_response(
+            handler, versions, request, *args, **kwargs
+        )
+
+
+class ConditionalGetMixin:
+    """
+    Отдает ETag и Last-Modified по версиям ресурса и отвечает 304
+    на If-None-Match/If-Modified-Since, не выполняя запрос к базе.
+    Версии обновляются сигналами моделей (см. api.signals).
+    """
+
+    cache_prefix = None
+
+    def get_version_prefixes(self):
+        return (self.cache_prefix,)
+
+    def get_response(self, handler, versions, request, *args, **kwargs):
+        return handler(request, *args, **kwargs)
+
+    def get_validators(self, request):
+        """Версии ресурса, ETag и Last-Modified ответа."""
+
+        versions = cache.get_versions(self.get_version_prefixes())
+        etag = cache.make_etag(request, versions)
+        # Last-Modified точен до секунды, поэтому отдается только после
+        # окончания секунды последнего изменения: иначе изменение в ту же
+        # секунду дало бы тот же заголовок и ошибочный 304.
+        last_modified = max(versions.values()) // 10 ** 9 + 1
+        if time.time() < last_modified:
+            last_modified = None
+        return versions, etag, last_modified
+
+    @staticmethod
+    def set_validators(response, etag, last_modified):
+        if response.status_code in (200, 304):
+            response['ETag'] = etag
+            if last_modified is not None:
+                response['Last-Modified'] = http_date(last_modified)
+        return response
+
+    def get_conditional_response(self, handler, request, *args, **kwargs):
+        versions, etag, last_modified = self.get_validators(request)
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = self.get_response(
+                handler, versions, request, *args, **kwargs
+            )
+        return self.set_validators(response, etag, last_modified)
+
+    def list(self, request, *args, **kwargs):
+        return self.get_conditional_response(
+            super().list, request, *args, **kwargs
+        )
+
+
+class CachedResponseMixin(ConditionalGetMixin):
+    """Дополнительно кэширует данные ответа на GET-запросы."""
+
+    def get_response(self, handler, versions, request, *args, **kwargs):
+        key = cache.make_key(self.cache_prefix, request, versions)
+        data = cache.get_cache().get(key)
+        if data is not None:
+            cache.count(self.cache_prefix, 'hits')
+            return Response(data, headers={'X-Cache': 'HIT'})
+        cache.count(self.cache_prefix, 'misses')
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.get_cache().set(
+                key, response.data, settings.API_CACHE_TIMEOUT
+            )
+        response['X-Cache'] = 'MISS'
+        return response
+
+
+class ValuesListMixin:
+    """
+    Список строится values_serializer_class по строкам queryset.values()
+    вместо serializer_class (при VALUES_LIST_SERIALIZERS = True).
+    Фильтры и пагинация те же, ответ совпадает побайтно.
+    """
+
+    values_serializer_class = None
+
+    def list(self, request, *args, **kwargs):
+        if not settings.VALUES_LIST_SERIALIZERS:
+            return super().list(request, *args, **kwargs)
+        serializer = self.values_serializer_class()
+        queryset = serializer.get_queryset(
+            self.filter_queryset(self.get_queryset())
+        )
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(
+                serializer.to_representation(page)
+            )
+        return Response(serializer.to_representation(queryset))
+
+
+class NestedResourceMixin:
+    """
+    Вложенный ресурс (отзывы произведения, комментарии отзыва).
+    Существование родителя проверяется одним запросом его pk,
+    найденный id переиспользуется до конца запроса. Для запросов
+    к одному объекту фильтр по родителю встраивается в запрос объекта.
+    """
+
+    parent_model = None
+    # {поле родителя: именованный параметр URL}
+    parent_lookups = {}
+    # Внешний ключ вложенной модели на родителя.
+    parent_field = None
+
+    def get_parent_id(self):
+        if not hasattr(self, '_parent_id'):
+            self._parent_id = self.parent_model.objects.filter(**{
+                field: self.kwargs.get(kwarg)
+                for field, kwarg in self.parent_lookups.items()
+            }).values_list('pk', flat=True).first()
+            if self._parent_id is None:
+                raise Http404
+        return self._parent_id
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if (self.lookup_url_kwarg or self.lookup_field) in self.kwargs:
+            return queryset.filter(**{
+                f'{self.parent_field}__{field}': self.kwargs.get(kwarg)
+                for field, kwarg in self.parent_lookups.items()
+            })
+        return queryset.filter(
+            **{f'{self.parent_field}_id': self.get_parent_id()}
+        )
+
+    def perform_create(self, serializer):
+        serializer.save(
+            author=self.request.user,
+            **{f'{self.parent_field}_id': self.get_parent_id()},
+        )
 
 
-class CreateListDestroyViewSet(mixins.CreateModelMixin,
+class CreateListDestroyViewSet(ReplicaReadMixin,
+                               CachedResponseMixin,
+                               mixins.CreateModelMixin,
                                mixins.ListModelMixin,
                                mixins.DestroyModelMixin,
                                viewsets.GenericViewSet):
@@ -0,0 +1,46 @@
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+class CursorOrPageNumberPagination(CursorPagination):
+    """
+    Курсорная пагинация по ключу (pub_date, id) для запросов
+    с ?pagination=cursor или ?cursor=..., в остальных случаях
+    обычная постраничная пагинация.
+    """
+
+    ordering = ('-pub_date', '-id')
+    mode_query_param = 'pagination'
+    mode_query_value = 'cursor'
+
+    def __init__(self):
+        self.page_number_pagination = PageNumberPagination()
+        self.cursor_mode = False
+
+    def use_cursor(self, request):
+        return (
+            request.query_params.get(self.mode_query_param)
+            == self.mode_query_value
+            or self.cursor_query_param in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_mode = self.use_cursor(request)
+        if self.cursor_mode:
+            return super().paginate_queryset(queryset, request, view)
+        page = self.page_number_pagination.paginate_queryset(
+            queryset, request, view
+        )
+        self.display_page_controls = (
+            self.page_number_pagination.display_page_controls
+        )
+        return page
+
+    def get_paginated_response(self, data):
+        if self.cursor_mode:
+            return super().get_paginated_response(data)
+        return self.page_number_pagination.get_paginated_response(data)
+
+    def to_html(self):
+        if self.cursor_mode:
+            return super().to_html()
+        return self.page_number_pagination.to_html()
@@ -1,29 +1,48 @@
 from rest_framework import permissions
 
 
+class Capabilities:
+    """Права пользователя, вычисленные один раз за запрос."""
+
+    __slots__ = ('user_id', 'is_authenticated', 'is_admin', 'is_moderator')
+
+    def __init__(self, user):
+        self.user_id = user.pk
+        self.is_authenticated = user.is_authenticated
+        self.is_admin = self.is_authenticated and user.is_admin
+        self.is_moderator = (
+            self.is_admin or self.is_authenticated and user.is_moderator
+        )
+
+
+def get_capabilities(request):
+    """
+    Права текущего пользователя запроса.
+    Считаются при первой проверке и переиспользуются всеми
+    permission-классами, пока request.user не сменится.
+    """
+
+    user = request.user
+    cached = getattr(request, '_capabilities', None)
+    if cached is None or cached[0] is not user:
+        cached = (user, Capabilities(user))
+        request._capabilities = cached
+    return cached[1]
+
+
 class AdminAuthorOrReadOnly(permissions.BasePermission):
     """Админ/автор или только чтение."""
 
     def has_object_permission(self, request, view, obj):
-        return (
-            request.user.is_superuser
-            or request.user.is_admin
-            or obj == request.user
-        )
+        capabilities = get_capabilities(request)
+        return capabilities.is_admin or obj.pk == capabilities.user_id
 
 
 class AdminOnly(permissions.BasePermission):
     """Только админ."""
 
     def has_permission(self, request, view):
-        return (
-            request.user.is_authenticated
-            and (
-                request.user.is_superuser
-                or request.user.is_admin
-                or request.user.is_staff
-            )
-        )
+        return get_capabilities(request).is_admin
 
 
 class AdminOrReadOnly(permissions.BasePermission):
@@ -32,8 +51,7 @@ class AdminOrReadOnly(permissions.BasePermission):
     def has_permission(self, request, view):
         return (
             request.method in permissions.SAFE_METHODS
-            or (request.user.is_authenticated
-                and (request.user.is_admin or request.user.is_superuser))
+            or get_capabilities(request).is_admin
         )
 
 
@@ -41,12 +59,12 @@ class AuthorOrModeratorsOrReadOnly(permissions.BasePermission):
     """Админ/модератор/автор или только чтение."""
 
     def has_object_permission(self, request, view, obj):
+        if request.method in permissions.SAFE_METHODS:
+            return True
+        capabilities = get_capabilities(request)
         return (
-            request.method in permissions.SAFE_METHODS
-            or request.user.is_superuser
-            or request.user.is_admin
-            or request.user.is_moderator
-            or obj.author == request.user
+            capabilities.is_moderator
+            or obj.author_id == capabilities.user_id
         )
 
 
@@ -64,12 +82,7 @@ class AdminOrSuperuserOnly(permissions.BasePermission):
 
     def has_permission(self, request, view):
         return (request.method in permissions.SAFE_METHODS
-                or request.user.is_superuser
-                or request.user.is_admin)
+                or get_capabilities(request).is_admin)
 
     def has_object_permission(self, request, view, obj):
-        return (
-            request.method in permissions.SAFE_METHODS
-            or request.user.is_superuser
-            or request.user.is_admin
-        )
+        return self.has_permission(request, view)
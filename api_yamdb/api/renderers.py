@@ -0,0 +1,61 @@
+import re
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+from rest_framework.renderers import JSONRenderer
+
+# Типы, которые orjson сериализует иначе, чем JSONEncoder DRF,
+# передаются в encoder_class().default.
+ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_NON_STR_KEYS
+) if orjson else 0
+
+# Числа, которые orjson записывает иначе, чем repr(): 1e16 и 1e-7
+# вместо 1e+16 и 1e-07, 0.00001 вместо 1e-05. Совпадение внутри
+# строки только лишний раз переключает на JSONRenderer.
+FLOAT_MISMATCH = re.compile(rb'[0-9]e|0\.0000')
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer на orjson. Результат совпадает с JSONRenderer:
+    Decimal, даты и время кодируются JSONEncoder DRF, U+2028/U+2029
+    экранируются, числа в экспоненциальной записи кодирует
+    JSONRenderer. Исключение - NaN и бесконечности: orjson записывает
+    их как null, а JSONRenderer (STRICT_JSON) выбрасывает ValueError.
+    С отступами, ensure_ascii, без COMPACT_JSON и без установленного
+    orjson работает JSONRenderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None or data is None
+            or self.ensure_ascii or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {})
+        ):
+            return super().render(
+                data, accepted_media_type, renderer_context
+            )
+        try:
+            ret = orjson.dumps(
+                data, default=self.encoder_class().default,
+                option=ORJSON_OPTIONS,
+            )
+        except orjson.JSONEncodeError:
+            # Целые больше 64 бит и прочее, что не поддерживает orjson.
+            return super().render(
+                data, accepted_media_type, renderer_context
+            )
+        if FLOAT_MISMATCH.search(ret):
+            return super().render(
+                data, accepted_media_type, renderer_context
+            )
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(
+                b'\xe2\x80\xa9', b'\\u2029'
+            )
+        return ret
@@ -1,7 +1,22 @@
-from django.db.models import Avg
+from collections import defaultdict
+
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 from rest_framework import serializers
+from rest_framework.settings import api_settings
 
 from reviews.models import Category, Genre, Title, Comment, Review, User
+from reviews.validators import me_validator
+
+
+def unique_error_message(field_name):
+    """Сообщение об ошибке уникальности, как у UniqueValidator."""
+
+    field = User._meta.get_field(field_name)
+    return field.error_messages['unique'] % {
+        'model_name': User._meta.verbose_name,
+        'field_label': field.verbose_name,
+    }
 
 
 class AdminUsersSerializer(serializers.ModelSerializer):
@@ -47,11 +62,41 @@ class TokenSerializer(serializers.ModelSerializer):
 
 
 class LoginSerializer(serializers.ModelSerializer):
-    """Сериализатор получения кода на почту пользователя."""
+    """
+    Сериализатор получения кода на почту пользователя.
+    Уникальность username и email проверяется одним запросом в validate,
+    найденный пользователь с той же парой username/email
+    сохраняется в self.user.
+    """
+
+    user = None
 
     class Meta:
         model = User
         fields = ('username', 'email')
+        extra_kwargs = {
+            'username': {
+                'validators': (me_validator, User.username_validator),
+            },
+            'email': {'validators': ()},
+        }
+
+    def validate(self, data):
+        errors = {}
+        for user in User.objects.filter(
+            Q(username=data['username']) | Q(email=data['email'])
+        )[:2]:
+            if (user.username, user.email) == (
+                data['username'], data['email']
+            ):
+                self.user = user
+                return data
+            for field in ('username', 'email'):
+                if getattr(user, field) == data[field]:
+                    errors[field] = unique_error_message(field)
+        if errors:
+            raise serializers.ValidationError(errors)
+        return data
 
 
 class ReviewSerializer(serializers.ModelSerializer):
@@ -72,16 +117,26 @@ class ReviewSerializer(serializers.ModelSerializer):
             'pub_date',
         )
 
-    def validate(self, data):
-        author = self.context['request'].user
-        title_id = self.context['view'].kwargs.get('title_id')
-        current_request = self.context['request'].method == 'POST'
-        if current_request and Review.objects.filter(
-            author=author, title=title_id
-        ).exists():
-            raise serializers.ValidationError(
-                'Вы уже оставили отзыв к этому произведению')
-        return data
+    def create(self, validated_data):
+        """
+        Повторный отзыв отсекает ограничение unique_review в базе,
+        без отдельного запроса перед вставкой.
+        """
+
+        try:
+            with transaction.atomic():
+                return super().create(validated_data)
+        except IntegrityError:
+            if not Review.objects.filter(
+                author=validated_data['author'],
+                title_id=validated_data['title_id'],
+            ).exists():
+                raise
+            raise serializers.ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: [
+                    'Вы уже оставили отзыв к этому произведению'
+                ]
+            })
 
 
 class CommentSerializer(serializers.ModelSerializer):
@@ -128,7 +183,7 @@ class TitleViewingSerializer(serializers.ModelSerializer):
         many=True,
         read_only=True,
     )
-    rating = serializers.SerializerMethodField(
+    rating = serializers.FloatField(
         read_only=True,
     )
 
@@ -144,10 +199,6 @@ class TitleViewingSerializer(serializers.ModelSerializer):
             'category'
         )
 
-    def get_rating(self, obj):
-        obj = obj.reviews.all().aggregate(rating=Avg('score'))
-        return obj['rating']
-
 
 class TitleEditingSerializer(serializers.ModelSerializer):
     """Сериализатор произведения в режиме создания/редактирования."""
@@ -169,3 +220,121 @@ class TitleEditingSerializer(serializers.ModelSerializer):
             'genre',
             'category'
         )
+
+
+class ValuesSerializer:
+    """
+    Сериализатор списков по строкам queryset.values(): без экземпляров
+    моделей и обхода полей DRF. Вывод совпадает с serializer_class,
+    значения formatted_fields форматируют поля serializer_class.
+    """
+
+    serializer_class = None
+    # {ключ ответа: поле queryset.values()}; вложенный объект задается
+    # словарем таких же пар и равен None, если все его поля пустые.
+    fields = {}
+    formatted_fields = ()
+
+    @classmethod
+    def get_formatters(cls):
+        """Поля serializer_class создаются один раз на класс."""
+
+        if '_formatters' not in cls.__dict__:
+            serializer_fields = cls.serializer_class().fields
+            cls._formatters = {
+                name: serializer_fields[name].to_representation
+                for name in cls.formatted_fields
+            }
+        return cls._formatters
+
+    def get_queryset(self, queryset):
+        paths = []
+        for path in self.fields.values():
+            paths.extend(path.values() if isinstance(path, dict) else (path,))
+        return queryset.prefetch_related(None).values(*dict.fromkeys(paths))
+
+    @staticmethod
+    def get_nested(row, fields):
+        item = {key: row[path] for key, path in fields}
+        if all(value is None for value in item.values()):
+            return None
+        return item
+
+    def to_representation(self, rows):
+        fields = tuple(
+            (key, tuple(path.items()) if isinstance(path, dict) else path)
+            for key, path in self.fields.items()
+        )
+        data = [
+            {
+                key: row[path] if isinstance(path, str)
+                else self.get_nested(row, path)
+                for key, path in fields
+            }
+            for row in rows
+        ]
+        for name, formatter in self.get_formatters().items():
+            for item in data:
+                if item[name] is not None:
+                    item[name] = formatter(item[name])
+        return data
+
+
+class ReviewValuesSerializer(ValuesSerializer):
+    """Список отзывов, как ReviewSerializer."""
+
+    serializer_class = ReviewSerializer
+    fields = {
+        'id': 'id',
+        'text': 'text',
+        'author': 'author__username',
+        'score': 'score',
+        'pub_date': 'pub_date',
+    }
+    formatted_fields = ('pub_date',)
+
+
+class CommentValuesSerializer(ValuesSerializer):
+    """Список комментариев, как CommentSerializer."""
+
+    serializer_class = CommentSerializer
+    fields = {
+        'id': 'id',
+        'text': 'text',
+        'author': 'author__username',
+        'pub_date': 'pub_date',
+    }
+    formatted_fields = ('pub_date',)
+
+
+class TitleValuesSerializer(ValuesSerializer):
+    """
+    Список произведений, как TitleViewingSerializer.
+    Жанры страницы выбираются одним запросом в порядке Genre.Meta.ordering,
+    как при prefetch_related('genre').
+    """
+
+    serializer_class = TitleViewingSerializer
+    fields = {
+        'id': 'id',
+        'name': 'name',
+        'year': 'year',
+        'rating': 'rating',
+        'description': 'description',
+        # Заменяется списком жанров произведения в to_representation.
+        'genre': 'id',
+        'category': {'name': 'category__name', 'slug': 'category__slug'},
+    }
+    formatted_fields = ('rating',)
+
+    def to_representation(self, rows):
+        data = super().to_representation(rows)
+        genres = defaultdict(list)
+        if data:
+            for title_id, name, slug in Genre.objects.filter(
+                titles__in=[item['id'] for item in data]
+            ).values_list('titles', 'name', 'slug'):
+                genres[title_id].append({'name': name, 'slug': slug})
+        for item in data:
+            item['genre'] = genres[item['genre']]
+        return data
@@ -0,0 +1,70 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from api.authentication import forget_user
+from api.cache import invalidate
+from reviews.models import (Category, Comment, Genre, GenreTitle, Review,
+                            Title, User)
+
+
+def invalidated_prefixes(instance):
+    """Версии ресурсов, которые показывают данный объект."""
+
+    if isinstance(instance, Category):
+        return ('categories', 'titles')
+    if isinstance(instance, Genre):
+        return ('genres', 'titles')
+    if isinstance(instance, Title):
+        return ('titles', f'reviews:{instance.pk}')
+    if isinstance(instance, GenreTitle):
+        return ('titles',)
+    if isinstance(instance, Review):
+        return (
+            'titles',
+            f'reviews:{instance.title_id}',
+            f'comments:{instance.pk}',
+        )
+    if isinstance(instance, Comment):
+        return (f'comments:{instance.review_id}',)
+    return ()
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_api_cache(sender, instance, **kwargs):
+    """Обновляет версии ресурсов, которые показывают измененный объект."""
+
+    prefixes = invalidated_prefixes(instance)
+    if prefixes:
+        invalidate(*prefixes)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_authors(sender, created=False, update_fields=None, **kwargs):
+    """
+    Имена авторов выводятся в отзывах и комментариях.
+    Новый пользователь еще ничего не написал, регистрация версию
+    не меняет.
+    """
+
+    if created:
+        return
+    if update_fields is None or 'username' in update_fields:
+        invalidate('authors')
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def forget_authenticated_user(sender, instance, **kwargs):
+    """Сбрасывает пользователя, закэшированного при аутентификации."""
+
+    forget_user(instance.pk)
+
+
+@receiver(m2m_changed, sender=Title.genre.through)
+def invalidate_title_genres(sender, action, **kwargs):
+    """Сбрасывает кэш произведений при изменении их жанров."""
+
+    if action.startswith('post_'):
+        invalidate('titles')
@@ -0,0 +1,93 @@
+import hashlib
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from rest_framework.settings import api_settings
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class SlidingWindowRateThrottle(SimpleRateThrottle):
+    """
+    Ограничение частоты запросов скользящим окном.
+    Вместо списка отметок времени в кэше хранится одна запись
+    (номер окна, счетчик текущего окна, счетчик предыдущего окна),
+    поэтому проверка стоит O(1): один get и один set в кэше
+    cache_alias.
+    """
+
+    cache_alias = DEFAULT_CACHE_ALIAS
+
+    def get_rate(self):
+        # Лимиты читаются при каждом запросе, чтобы работало
+        # переопределение REST_FRAMEWORK в тестах.
+        return api_settings.DEFAULT_THROTTLE_RATES.get(self.scope)
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        # Бэкенд берется один раз на проверку: прокси default_cache
+        # DRF ищет его заново при каждом обращении.
+        cache = caches[self.cache_alias]
+        self.now = self.timer()
+        window, self.elapsed = divmod(self.now, self.duration)
+        state = cache.get(self.key)
+        if state is None or state[0] < window - 1:
+            self.current = self.previous = 0
+        elif state[0] < window:
+            self.current, self.previous = 0, state[1]
+        else:
+            _, self.current, self.previous = state
+        weight = 1 - self.elapsed / self.duration
+        if self.previous * weight + self.current >= self.num_requests:
+            return self.throttle_failure()
+        cache.set(
+            self.key, (window, self.current + 1, self.previous),
+            self.duration * 2,
+        )
+        return True
+
+    def wait(self):
+        """Секунды до момента, когда оценка окна опустится ниже лимита."""
+
+        free = self.num_requests - self.current
+        if free > 0:
+            # Достаточно дождаться, пока вес предыдущего окна уменьшится.
+            return max(
+                0, self.duration * (1 - free / self.previous) - self.elapsed
+            )
+        # Текущее окно заполнено: после его смены оно станет предыдущим.
+        return (self.duration - self.elapsed
+                + self.duration * (1 - self.num_requests / self.current))
+
+
+class AuthIPThrottle(SlidingWindowRateThrottle):
+    """Лимит запросов к регистрации и получению токена с одного IP."""
+
+    scope = 'auth_ip'
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {
+            'scope': self.scope,
+            'ident': self.get_ident(request),
+        }
+
+
+class AuthUsernameThrottle(SlidingWindowRateThrottle):
+    """Лимит запросов к регистрации и получению токена на один username."""
+
+    scope = 'auth_username'
+
+    def get_cache_key(self, request, view):
+        username = request.data.get('username')
+        if not username or not isinstance(username, str):
+            return None
+        return self.cache_format % {
+            'scope': self.scope,
+            # username еще не провалидирован, в ключ кэша идет его хэш.
+            'ident': hashlib.blake2b(
+                username.lower().encode(), digest_size=8
+            ).hexdigest(),
+        }
@@ -1,8 +1,10 @@
+from django.conf import settings
 from django.urls import include, path
 from rest_framework.routers import SimpleRouter
 
+from api.async_views import async_read_urls
 from api.views import (CommentViewSet, ReviewViewSet,
-                       UserViewSet, ApiUserSignup,
+                       UserViewSet, ApiUserSignup, ApiCacheStats,
                        GetApiToken, CategoryViewSet,
                        GenreViewSet, TitleViewSet)
 
@@ -39,8 +41,15 @@ router.register(
     basename='titles'
 )
 
+router_urls = router.urls
+if settings.ASYNC_READ_VIEWS:
+    router_urls = async_read_urls(
+        router_urls, (TitleViewSet, ReviewViewSet, CommentViewSet)
+    )
+
 urlpatterns = [
     path('v1/auth/token/', GetApiToken.as_view(), name='get_token'),
     path('v1/auth/signup/', ApiUserSignup.as_view(), name='signup'),
-    path('v1/', include(router.urls)),
+    path('v1/cache-stats/', ApiCacheStats.as_view(), name='cache_stats'),
+    path('v1/', include(router_urls)),
 ]
@@ -1,23 +1,43 @@
+from django.conf import settings
 from django.core.mail import send_mail
-from django.shortcuts import get_object_or_404
 from django.contrib.auth.tokens import default_token_generator
+from django.utils.crypto import constant_time_compare
 
-from reviews.models import User
+from reviews.outbox import enqueue_mail
 from api_yamdb.settings import EMAIL_ADMIN
 
 
-def send_confirmation_code(request):
-    """Отправляет confirmation_code пользователю на почту."""
+def send_confirmation_code(user):
+    """
+    Отправляет confirmation_code пользователю на почту.
+    В режиме CONFIRMATION_CODE_STATELESS код не сохраняется в базе.
+    """
 
-    user = get_object_or_404(
-        User,
-        username=request.data.get('username'),
-    )
-    user.confirmation_code = default_token_generator.make_token(user)
-    user.save()
-    send_mail(
+    confirmation_code = default_token_generator.make_token(user)
+    if not settings.CONFIRMATION_CODE_STATELESS:
+        user.confirmation_code = confirmation_code
+        user.save(update_fields=('confirmation_code',))
+    mail = (
         'Код для получения токена к API',
-        f'Код подтверждения {user.confirmation_code}',
+        f'Код подтверждения {confirmation_code}',
         f'{EMAIL_ADMIN}',
-        [request.data.get('email')],
+    )
+    if settings.EMAIL_QUEUE:
+        enqueue_mail(*mail, user.email)
+        return
+    send_mail(*mail, [user.email])
+
+
+def check_confirmation_code(user, confirmation_code):
+    """
+    Проверяет код подтверждения: подписью и сроком действия
+    (PASSWORD_RESET_TIMEOUT) в режиме CONFIRMATION_CODE_STATELESS,
+    иначе сравнением с кодом, сохраненным в базе.
+    """
+
+    if settings.CONFIRMATION_CODE_STATELESS:
+        return default_token_generator.check_token(user, confirmation_code)
+    return (
+        user.confirmation_code is not None
+        and constant_time_compare(confirmation_code, user.confirmation_code)
     )
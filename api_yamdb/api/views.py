@@ -1,11 +1,11 @@
-from django.db.models import Avg
+from django.db.models import Prefetch
 from django_filters.rest_framework import DjangoFilterBackend
 
 from rest_framework import viewsets, status
 from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet
 from rest_framework_simplejwt.tokens import RefreshToken
-from rest_framework.filters import SearchFilter
+from rest_framework.filters import OrderingFilter, SearchFilter
 from rest_framework.permissions import (IsAuthenticated,
                                         AllowAny,
                                         IsAuthenticatedOrReadOnly)
@@ -13,20 +13,27 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
 
-from api.filters import TitleFilter
-from api.utils import send_confirmation_code
-from api.mixins import CreateListDestroyViewSet
+from api.filters import TitleFilter, TitleSearchFilter
+from api.pagination import CursorOrPageNumberPagination
+from api.utils import check_confirmation_code, send_confirmation_code
+from api.cache import get_stats
+from api.throttling import AuthIPThrottle, AuthUsernameThrottle
+from api.mixins import (CachedResponseMixin, ConditionalGetMixin,
+                        CreateListDestroyViewSet, NestedResourceMixin,
+                        ReplicaReadMixin, ValuesListMixin)
 from api.permissions import (AdminOnly,
                              AuthorOrModeratorsOrReadOnly,
                              AdminOrReadOnly,
-                             AdminOrReadOnly)
+                             get_capabilities)
 from api.serializers import (CategorySerializer, GenreSerializer,
                              TitleViewingSerializer, TitleEditingSerializer,
                              AnyUserSerializer, AdminUsersSerializer,
                              LoginSerializer, TokenSerializer,
-                             CommentSerializer, ReviewSerializer)
+                             CommentSerializer, ReviewSerializer,
+                             CommentValuesSerializer, ReviewValuesSerializer,
+                             TitleValuesSerializer)
 from api_yamdb.settings import USER_ME
-from reviews.models import Category, Genre, Title, User, Review
+from reviews.models import Category, Comment, Genre, Review, Title, User
 
 
 class CategoryViewSet(CreateListDestroyViewSet):
@@ -34,6 +41,7 @@ class CategoryViewSet(CreateListDestroyViewSet):
 
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
+    cache_prefix = 'categories'
 
 
 class GenreViewSet(CreateListDestroyViewSet):
@@ -41,15 +49,28 @@ class GenreViewSet(CreateListDestroyViewSet):
 
     queryset = Genre.objects.all()
     serializer_class = GenreSerializer
+    cache_prefix = 'genres'
 
 
-class TitleViewSet(viewsets.ModelViewSet):
+class TitleViewSet(ReplicaReadMixin, CachedResponseMixin, ValuesListMixin,
+                   viewsets.ModelViewSet):
     """Вьюсет для произведений."""
 
-    queryset = Title.objects.annotate(rating=Avg('reviews__score'))
+    queryset = Title.objects.select_related('category').prefetch_related(
+        Prefetch('genre', queryset=Genre.objects.only('name', 'slug'))
+    )
     permission_classes = (AdminOrReadOnly,)
-    filter_backends = (DjangoFilterBackend,)
+    filter_backends = (DjangoFilterBackend, TitleSearchFilter,
+                       OrderingFilter)
     filterset_class = TitleFilter
+    ordering_fields = ('rating', 'year', 'name')
+    values_serializer_class = TitleValuesSerializer
+    cache_prefix = 'titles'
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.get_conditional_response(
+            super().retrieve, request, *args, **kwargs
+        )
 
     def get_serializer_class(self):
         """Определяет сериализатор в зависимости от типа запроса."""
@@ -58,6 +79,22 @@ class TitleViewSet(viewsets.ModelViewSet):
         return TitleEditingSerializer
 
 
+class ApiCacheStats(APIView):
+    """Счетчики попаданий и промахов кэша ответов."""
+
+    permission_classes = (IsAuthenticated, AdminOnly)
+
+    def get(self, request):
+        """Метод GET."""
+
+        return Response(
+            get_stats((CategoryViewSet.cache_prefix,
+                       GenreViewSet.cache_prefix,
+                       TitleViewSet.cache_prefix)),
+            status=status.HTTP_200_OK,
+        )
+
+
 class UserViewSet(ModelViewSet):
     """ViewSet пользователей."""
 
@@ -92,7 +129,7 @@ class UserViewSet(ModelViewSet):
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     def get_serializer_class(self):
-        if self.request.user.is_admin:
+        if get_capabilities(self.request).is_admin:
             return AdminUsersSerializer
         return AnyUserSerializer
 
@@ -101,20 +138,15 @@ class ApiUserSignup(APIView):
     """Регистрация новых пользователей."""
 
     permission_classes = (AllowAny,)
+    throttle_classes = (AuthIPThrottle, AuthUsernameThrottle)
 
     def post(self, request):
         """Метод POST."""
 
         serializer = LoginSerializer(data=request.data)
-
-        if User.objects.filter(username=request.data.get('username'),
-                               email=request.data.get('email')).exists():
-            send_confirmation_code(request)
-            return Response(request.data, status=status.HTTP_200_OK)
-
         serializer.is_valid(raise_exception=True)
-        serializer.save()
-        send_confirmation_code(request)
+        user = serializer.user or serializer.save()
+        send_confirmation_code(user)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
@@ -122,6 +154,7 @@ class GetApiToken(APIView):
     """Создание токена по коду из письма."""
 
     permission_classes = (AllowAny,)
+    throttle_classes = (AuthIPThrottle, AuthUsernameThrottle)
 
     def post(self, request):
         """Метод POST."""
@@ -131,7 +164,7 @@ class GetApiToken(APIView):
         data = serializer.validated_data
         user = get_object_or_404(User, username=data['username'])
 
-        if data.get('confirmation_code') == user.confirmation_code:
+        if check_confirmation_code(user, data['confirmation_code']):
             api_token = RefreshToken.for_user(user).access_token
             return Response({'token': str(api_token)},
                             status=status.HTTP_201_CREATED)
@@ -140,47 +173,55 @@ class GetApiToken(APIView):
             status=status.HTTP_400_BAD_REQUEST)
 
 
-class ReviewViewSet(ModelViewSet):
+class ReviewViewSet(ReplicaReadMixin, ConditionalGetMixin, ValuesListMixin,
+                    NestedResourceMixin, ModelViewSet):
     """ViewSet отзывов."""
 
+    # Имя автора выбирается тем же запросом, что и страница,
+    # порядок совпадает с индексом и курсорной пагинацией.
+    queryset = Review.objects.select_related('author').order_by(
+        '-pub_date', '-id'
+    )
     serializer_class = ReviewSerializer
+    values_serializer_class = ReviewValuesSerializer
     permission_classes = (IsAuthenticatedOrReadOnly,
                           AuthorOrModeratorsOrReadOnly)
-
-    def get_queryset(self):
-        title = get_object_or_404(
-            Title,
-            id=self.kwargs.get('title_id')
+    pagination_class = CursorOrPageNumberPagination
+    parent_model = Title
+    parent_lookups = {'pk': 'title_id'}
+    parent_field = 'title'
+
+    def get_version_prefixes(self):
+        # Сигналы обновляют версии по pk, а в URL id может прийти
+        # с ведущими нулями.
+        return (f'reviews:{int(self.kwargs["title_id"])}', 'authors')
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.get_conditional_response(
+            super().retrieve, request, *args, **kwargs
         )
-        return title.reviews.all()
-
-    def perform_create(self, serializer):
-        title = get_object_or_404(
-            Title,
-            id=self.kwargs.get('title_id')
-        )
-        serializer.save(author=self.request.user, title=title)
 
 
-class CommentViewSet(ModelViewSet):
+class CommentViewSet(ReplicaReadMixin, ConditionalGetMixin,
+                     ValuesListMixin, NestedResourceMixin, ModelViewSet):
     """ViewSet комментариев."""
 
+    queryset = Comment.objects.select_related('author').order_by(
+        '-pub_date', '-id'
+    )
     serializer_class = CommentSerializer
+    values_serializer_class = CommentValuesSerializer
     permission_classes = (IsAuthenticatedOrReadOnly,
                           AuthorOrModeratorsOrReadOnly)
+    pagination_class = CursorOrPageNumberPagination
+    parent_model = Review
+    parent_lookups = {'pk': 'review_id', 'title_id': 'title_id'}
+    parent_field = 'review'
 
-    def get_queryset(self):
-        review = get_object_or_404(
-            Review,
-            id=self.kwargs.get('review_id'),
-            title_id=self.kwargs.get('title_id')
-        )
-        return review.comments.all()
+    def get_version_prefixes(self):
+        return (f'comments:{int(self.kwargs["review_id"])}', 'authors')
 
-    def perform_create(self, serializer):
-        review = get_object_or_404(
-            Review,
-            id=self.kwargs.get('review_id'),
-            title_id=self.kwargs.get('title_id')
+    def retrieve(self, request, *args, **kwargs):
+        return self.get_conditional_response(
+            super().retrieve, request, *args, **kwargs
         )
-        serializer.save(author=self.request.user, review=review)
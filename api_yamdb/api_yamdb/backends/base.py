@@ -0,0 +1,38 @@
+class HealthChecksMixin:
+    """
+    Проверка постоянного соединения перед первым использованием
+    в запросе (CONN_HEALTH_CHECKS, как в Django 4.1).
+    Разорванное соединение закрывается и открывается заново,
+    вместо ошибки в середине запроса.
+    """
+
+    health_check_done = False
+    # Соединение из пула могло быть закрыто сервером, пока лежало
+    # в пуле, поэтому проверяется, как постоянное.
+    pooled_connections = False
+
+    def connect(self):
+        # Новое соединение исправно и не проверяется. Проверка не
+        # должна выполняться и внутри connect(): set_autocommit()
+        # тоже вызывает ensure_connection().
+        self.health_check_done = True
+        super().connect()
+        self.health_check_done = not self.pooled_connections
+
+    def ensure_connection(self):
+        super().ensure_connection()
+        if not self.settings_dict.get('CONN_HEALTH_CHECKS'):
+            return
+        while not self.health_check_done:
+            self.health_check_done = True
+            if self.in_atomic_block or self.is_usable():
+                break
+            # Разорванное соединение закрывается (пул его отбрасывает),
+            # следующее тоже проверяется, если пришло из пула.
+            self.close()
+            super().ensure_connection()
+
+    def close_if_unusable_or_obsolete(self):
+        # Вызывается в начале и в конце каждого запроса.
+        super().close_if_unusable_or_obsolete()
+        self.health_check_done = False
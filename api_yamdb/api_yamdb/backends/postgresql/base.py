@@ -0,0 +1,152 @@
+import threading
+import time
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.postgresql import base, creation
+from psycopg2 import extras, pool
+
+from api_yamdb.backends.base import HealthChecksMixin
+
+POOL_MIN_SIZE = 1
+POOL_MAX_SIZE = 10
+POOL_TIMEOUT = 30
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+class BlockingConnectionPool(pool.ThreadedConnectionPool):
+    """
+    ThreadedConnectionPool, который при занятых max_size соединениях
+    ждет освобождения соединения до timeout секунд, а не сразу
+    выбрасывает PoolError.
+    """
+
+    def __init__(self, minconn, maxconn, *args, timeout=POOL_TIMEOUT,
+                 **kwargs):
+        self.timeout = timeout
+        self._released = threading.Condition()
+        super().__init__(minconn, maxconn, *args, **kwargs)
+
+    def getconn(self, key=None):
+        deadline = time.monotonic() + self.timeout
+        with self._released:
+            while True:
+                try:
+                    return super().getconn(key)
+                except pool.PoolError:
+                    remaining = deadline - time.monotonic()
+                    if self.closed or remaining <= 0:
+                        raise
+                    self._released.wait(remaining)
+
+    def putconn(self, conn=None, key=None, close=False):
+        super().putconn(conn, key, close)
+        with self._released:
+            self._released.notify()
+
+
+def close_pools(database):
+    """Закрывает пулы соединений с базой database во всех алиасах."""
+
+    with _pools_lock:
+        keys = [key for key in _pools if key[1] == database]
+        closing = [_pools.pop(key) for key in keys]
+    for connection_pool in closing:
+        connection_pool.closeall()
+
+
+class DatabaseCreation(creation.DatabaseCreation):
+
+    def _destroy_test_db(self, test_database_name, verbosity):
+        # Свободные соединения пула не дают удалить тестовую базу.
+        close_pools(test_database_name)
+        super()._destroy_test_db(test_database_name, verbosity)
+
+
+class DatabaseWrapper(HealthChecksMixin, base.DatabaseWrapper):
+    """
+    PostgreSQL с проверкой постоянных соединений (CONN_HEALTH_CHECKS)
+    и необязательным пулом соединений процесса (OPTIONS['pool']).
+    С пулом соединение в конце запроса возвращается в пул,
+    а не закрывается, поэтому CONN_MAX_AGE должен быть 0. Если все
+    соединения пула заняты дольше OPTIONS['pool']['timeout'] секунд,
+    подключение завершается OperationalError.
+    """
+
+    creation_class = DatabaseCreation
+
+    def check_settings(self):
+        super().check_settings()
+        if self.pool_options and self.settings_dict['CONN_MAX_AGE'] != 0:
+            raise ImproperlyConfigured(
+                'Пул соединений нельзя использовать вместе с CONN_MAX_AGE.'
+            )
+
+    @property
+    def pooled_connections(self):
+        return self.pool_options is not None
+
+    @property
+    def pool_options(self):
+        options = self.settings_dict['OPTIONS'].get('pool')
+        if options is True:
+            return {}
+        return options or None
+
+    def get_connection_params(self):
+        conn_params = super().get_connection_params()
+        conn_params.pop('pool', None)
+        return conn_params
+
+    def get_pool(self, conn_params):
+        """
+        Пул соединений алиаса с базой, создается при первом подключении.
+        У тестовой базы свой пул, даже если соединение к основной
+        базе было открыто раньше.
+        """
+
+        key = (self.alias, conn_params['database'])
+        with _pools_lock:
+            if key not in _pools:
+                options = self.pool_options
+                _pools[key] = BlockingConnectionPool(
+                    options.get('min_size', POOL_MIN_SIZE),
+                    options.get('max_size', POOL_MAX_SIZE),
+                    timeout=options.get('timeout', POOL_TIMEOUT),
+                    **conn_params,
+                )
+            return _pools[key]
+
+    def get_new_connection(self, conn_params):
+        if self.pool_options is None:
+            return super().get_new_connection(conn_params)
+        connection_pool = self.get_pool(conn_params)
+        try:
+            connection = connection_pool.getconn()
+        except pool.PoolError as error:
+            raise base.Database.OperationalError(
+                f'Нет свободного соединения в пуле {self.alias!r} '
+                f'(max_size={connection_pool.maxconn}) за '
+                f'{connection_pool.timeout} с: {error}'
+            ) from error
+        self.connection_pool = connection_pool
+        # Состояние, которое Django задает новому соединению.
+        options = self.settings_dict['OPTIONS']
+        self.isolation_level = options.get(
+            'isolation_level', connection.isolation_level
+        )
+        if self.isolation_level != connection.isolation_level:
+            connection.set_session(isolation_level=self.isolation_level)
+        extras.register_default_jsonb(
+            conn_or_curs=connection, loads=lambda x: x
+        )
+        return connection
+
+    def _close(self):
+        if self.pool_options is None or self.connection is None:
+            return super()._close()
+        # Пул откатывает незавершенную транзакцию и закрывает
+        # соединение, если оно разорвано.
+        with self.wrap_database_errors:
+            self.connection_pool.putconn(self.connection)
@@ -0,0 +1,30 @@
+import re
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.sqlite3 import base
+
+PRAGMA_VALUE = re.compile(r'^(-?\d+|\w+)$')
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    SQLite, которая выполняет PRAGMA из OPTIONS['pragmas']
+    при открытии каждого соединения, в порядке словаря.
+    """
+
+    def get_connection_params(self):
+        conn_params = super().get_connection_params()
+        conn_params.pop('pragmas', None)
+        return conn_params
+
+    def get_new_connection(self, conn_params):
+        connection = super().get_new_connection(conn_params)
+        for name, value in self.settings_dict['OPTIONS'].get(
+            'pragmas', {}
+        ).items():
+            if not name.isidentifier() or not PRAGMA_VALUE.match(str(value)):
+                raise ImproperlyConfigured(
+                    f'Недопустимая PRAGMA {name} = {value}.'
+                )
+            connection.execute(f'PRAGMA {name} = {value}')
+        return connection
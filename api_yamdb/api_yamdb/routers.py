@@ -0,0 +1,112 @@
+import itertools
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DatabaseError, connections
+
+# Состояние чтения с реплик текущего запроса: None - чтение с default,
+# иначе словарь, в котором запоминается выбранная реплика.
+_replica_reads = ContextVar('replica_reads', default=None)
+
+
+@contextmanager
+def replica_reads():
+    """
+    Чтения внутри блока направляются на одну из реплик
+    DATABASE_REPLICAS, выбранную при первом чтении: запросы одной
+    страницы (COUNT, строки, связанные объекты) видят одни данные.
+    """
+
+    token = _replica_reads.set({})
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+@contextmanager
+def primary_reads():
+    """Чтения внутри блока идут на default, даже внутри replica_reads()."""
+
+    token = _replica_reads.set(None)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+def reading_replicas():
+    """Идут ли чтения текущего запроса на реплики."""
+
+    return _replica_reads.get() is not None
+
+
+class ReplicaRouter:
+    """
+    Чтение внутри replica_reads() идет на реплику, выбранную по кругу
+    один раз на блок, все остальное - на default. Пользователи
+    (аутентификация по JWT) всегда читаются с default. Реплика,
+    к которой не удалось подключиться, пропускается
+    REPLICA_RETRY_SECONDS секунд.
+    """
+
+    def __init__(self):
+        self.counter = itertools.count()
+        self.unhealthy_until = {}
+
+    def is_healthy(self, alias):
+        if self.unhealthy_until.get(alias, 0) > time.monotonic():
+            return False
+        connection = connections[alias]
+        try:
+            if (connection.vendor == 'sqlite'
+                    and not connection.is_in_memory_db()
+                    and not os.path.exists(connection.settings_dict['NAME'])):
+                # SQLite создала бы вместо реплики пустую базу.
+                raise DatabaseError(
+                    f'Нет файла реплики {connection.settings_dict["NAME"]}.'
+                )
+            connection.ensure_connection()
+        except DatabaseError:
+            self.unhealthy_until[alias] = (
+                time.monotonic() + settings.REPLICA_RETRY_SECONDS
+            )
+            return False
+        return True
+
+    def choose_replica(self):
+        """Следующая по кругу исправная реплика или None."""
+
+        replicas = settings.DATABASE_REPLICAS
+        start = next(self.counter)
+        for offset in range(len(replicas)):
+            alias = replicas[(start + offset) % len(replicas)]
+            if self.is_healthy(alias):
+                return alias
+        return None
+
+    def db_for_read(self, model, **hints):
+        state = _replica_reads.get()
+        if state is None:
+            return None
+        if model._meta.label_lower == settings.AUTH_USER_MODEL.lower():
+            # Пользователь, зарегистрированный только что, может еще
+            # не дойти до реплики, и его токен не прошел бы проверку.
+            return None
+        if 'alias' not in state:
+            state['alias'] = self.choose_replica()
+        return state['alias']
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Реплики содержат те же данные, что и default.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Схема реплик приходит с репликацией.
+        return db not in settings.DATABASE_REPLICAS
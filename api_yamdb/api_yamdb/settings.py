@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from datetime import timedelta
 
@@ -62,13 +63,107 @@ WSGI_APPLICATION = 'api_yamdb.wsgi.application'
 
 # Database
 
-DATABASES = {
+# PRAGMA для каждого соединения с SQLite: WAL не блокирует читателей
+# при записи, synchronous=NORMAL достаточно для WAL, mmap_size (байт)
+# и cache_size (-КиБ) держат горячие страницы в памяти, busy_timeout (мс)
+# ждет блокировку вместо ошибки database is locked.
+# Пустой словарь оставляет настройки SQLite по умолчанию.
+SQLITE_PRAGMAS = {
+    'busy_timeout': 5000,
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'mmap_size': 256 * 1024 * 1024,
+    'cache_size': -64 * 1024,
+}
+
+# По умолчанию SQLite без настройки. DB_ENGINE=postgresql включает
+# PostgreSQL с постоянными соединениями и их проверкой перед запросом,
+# DB_POOL_MAX_SIZE - пул соединений процесса вместо CONN_MAX_AGE.
+
+DB_ENGINE = os.getenv('DB_ENGINE', 'sqlite3')
+
+if DB_ENGINE == 'postgresql':
+    DB_POOL_MAX_SIZE = int(os.getenv('DB_POOL_MAX_SIZE', 0))
+    DATABASES = {
+        'default': {
+            'ENGINE': 'api_yamdb.backends.postgresql',
+            'NAME': os.getenv('DB_NAME', 'api_yamdb'),
+            'USER': os.getenv('POSTGRES_USER', 'postgres'),
+            'PASSWORD': os.getenv('POSTGRES_PASSWORD', ''),
+            'HOST': os.getenv('DB_HOST', 'localhost'),
+            'PORT': os.getenv('DB_PORT', '5432'),
+            'CONN_MAX_AGE': (
+                0 if DB_POOL_MAX_SIZE
+                else int(os.getenv('DB_CONN_MAX_AGE', 60))
+            ),
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {
+                'pool': {
+                    'min_size': int(os.getenv('DB_POOL_MIN_SIZE', 1)),
+                    'max_size': DB_POOL_MAX_SIZE,
+                    'timeout': float(os.getenv('DB_POOL_TIMEOUT', 30)),
+                },
+            } if DB_POOL_MAX_SIZE else {},
+        }
+    }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'api_yamdb.backends.sqlite3',
+            'NAME': os.getenv('DB_NAME', BASE_DIR / 'db.sqlite3'),
+            'OPTIONS': {
+                'pragmas': SQLITE_PRAGMAS,
+            },
+        }
+    }
+
+
+# Реплики для чтения (api_yamdb.routers): DB_REPLICAS - хосты PostgreSQL
+# или пути к файлам SQLite через запятую. Безопасные запросы к каталогу,
+# отзывам и комментариям читают с реплик по кругу; после записи клиент
+# REPLICA_PIN_SECONDS секунд читает с default. Недоступная реплика
+# пропускается REPLICA_RETRY_SECONDS секунд.
+DATABASE_REPLICAS = []
+for index, replica in enumerate(
+    filter(None, os.getenv('DB_REPLICAS', '').split(','))
+):
+    alias = f'replica_{index}'
+    DATABASES[alias] = {
+        **DATABASES['default'],
+        'HOST' if DB_ENGINE == 'postgresql' else 'NAME': replica.strip(),
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ['api_yamdb.routers.ReplicaRouter']
+REPLICA_PIN_SECONDS = 5
+REPLICA_RETRY_SECONDS = 30
+
+# Асинхронные эндпоинты чтения произведений, отзывов и комментариев
+# (api.async_views). Включаются по умолчанию в asgi.py.
+ASYNC_READ_VIEWS = os.getenv('ASYNC_READ_VIEWS', 'False') == 'True'
+
+
+# Cache
+
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
     }
 }
 
+# Алиас кэша и время жизни (сек) закэшированных ответов API.
+# В кэше хранятся и версии ресурсов для ETag: при нескольких процессах
+# сервера нужен общий кэш, а не LocMemCache (проверка api.W001).
+API_CACHE_ALIAS = 'default'
+API_CACHE_TIMEOUT = 60 * 5
+# Время жизни (сек) пользователя, закэшированного при JWT-аутентификации
+USER_CACHE_TIMEOUT = 60
+
+# Списки произведений, отзывов и комментариев строятся по строкам
+# queryset.values() (api.serializers.ValuesSerializer)
+VALUES_LIST_SERIALIZERS = True
+
 
 # Password validation
 
@@ -113,13 +208,32 @@ AUTH_USER_MODEL = 'reviews.User'
 # DRF settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'api.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_FILTER_BACKENDS': (
         'django_filters.rest_framework.DjangoFilterBackend',
     ),
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    # JSON через orjson, без него - стандартный модуль json
+    'DEFAULT_RENDERER_CLASSES': (
+        'api.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'api.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
     'PAGE_SIZE': 5,
+    # Лимиты регистрации и получения токена (api.throttling)
+    'DEFAULT_THROTTLE_RATES': {
+        'auth_ip': '20/min',
+        'auth_username': '5/min',
+    },
+    # Число доверенных прокси перед приложением. С None DRF берет IP
+    # клиента из X-Forwarded-For целиком, и лимит по IP обходится
+    # подменой заголовка; 0 - учитывается только REMOTE_ADDR.
+    'NUM_PROXIES': int(os.getenv('NUM_PROXIES', 0)),
 }
 
 # Настройки JWT
@@ -133,5 +247,26 @@ EMAIL_BACKEND = 'django.core.mail.backends.filebased.EmailBackend'
 EMAIL_FILE_PATH = BASE_DIR / 'sent_emails'
 EMAIL_ADMIN = 'info@yamdb.ru'
 
+# Очередь исходящих писем: при EMAIL_QUEUE = True письма сохраняются
+# в базе и отправляются командой send_queued_mail
+EMAIL_QUEUE = False
+EMAIL_QUEUE_BATCH_SIZE = 100
+EMAIL_QUEUE_MAX_ATTEMPTS = 5
+EMAIL_QUEUE_RETRY_DELAY = 30
+EMAIL_QUEUE_MAX_RETRY_DELAY = 60 * 60
+# Время в секундах, на которое отправитель забирает пачку писем.
+# Письма упавшего отправителя снова попадают в очередь по его истечении.
+EMAIL_QUEUE_LEASE = 5 * 60
+
 # Константы API
 USER_ME = 'me'
+
+# Код подтверждения проверяется подписью без хранения в базе;
+# срок действия кода - PASSWORD_RESET_TIMEOUT
+CONFIRMATION_CODE_STATELESS = False
+PASSWORD_RESET_TIMEOUT = 60 * 60 * 24 * 3
+
+# Поиск категории и жанров произведений по слагу:
+# 'exact' или 'prefix' - через id по индексу слага,
+# 'icontains' - прежний поиск по подстроке без учета регистра
+TITLE_SLUG_LOOKUP = 'exact'
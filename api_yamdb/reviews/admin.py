@@ -1,7 +1,7 @@
 from django.contrib import admin
 
 from reviews.models import (
-    Category, Comment, Genre, GenreTitle, Review, Title, User
+    Category, Comment, Genre, GenreTitle, OutgoingEmail, Review, Title, User
 )
 
 
@@ -62,6 +62,7 @@ class TitleAdmin(admin.ModelAdmin):
         'year',
         'description',
         'category',
+        'rating',
     )
     list_filter = ('name',)
     search_fields = ('name', 'year', 'category')
@@ -112,3 +113,21 @@ class CommentAdmin(admin.ModelAdmin):
     search_fields = ('review', 'text')
     list_filter = ('pub_date', 'author')
     empty_value_display = '-пусто-'
+
+
+@admin.register(OutgoingEmail)
+class OutgoingEmailAdmin(admin.ModelAdmin):
+    """Настройка админ-панели для очереди писем."""
+
+    list_display = (
+        'pk',
+        'recipient',
+        'subject',
+        'status',
+        'attempts',
+        'next_attempt_at',
+        'sent_at',
+    )
+    search_fields = ('recipient',)
+    list_filter = ('status',)
+    empty_value_display = '-пусто-'
@@ -1,9 +1,16 @@
 import csv
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import connection, connections, transaction
 
 from reviews.models import (Category, Comment, Genre, GenreTitle, Review,
                             Title, User)
+from reviews.ratings import rebuild_ratings
+from reviews.search import rebuild_index
 
 model_csv_equal = {
     'static/data/category.csv': Category,
@@ -15,16 +22,38 @@ model_csv_equal = {
     'static/data/comments.csv': Comment,
 }
 
+CHUNK_SIZE = 1000
+
 
 class Command(BaseCommand):
     """
     Команда для импорта csv в базу.
     Вызов python3 manage.py csv_importer
     из терминала в соответствующей папке.
+    Ключ --bulk включает потоковый импорт пачками через bulk_create.
     """
 
     help = 'Импорт csv файлов в таблицы базы.'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--bulk',
+            action='store_true',
+            help='Потоковый импорт пачками через bulk_create.',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=CHUNK_SIZE,
+            help='Количество строк в одной пачке bulk-импорта.',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Количество файлов, импортируемых параллельно.',
+        )
+
     def _create_correct_row_fields(self, row):
         """Дополняет строку таблицы экземплярами модели."""
 
@@ -40,22 +69,182 @@ class Command(BaseCommand):
             if row.get('genre'):
                 row['genre'] = Genre.objects.get(pk=row['genre'])
         except Exception as error:
-            print(f'Ошибка в строке {row.get("id")}.\n'
-                  f'Текст - {error}')
+            self.stdout.write(f'Ошибка в строке {row.get("id")}.\n'
+                              f'Текст - {error}')
         return row
 
+    def _import_rows(self, path, model):
+        """Построчный импорт файла через get_or_create."""
+
+        with open(path, encoding='utf-8', mode='r') as file:
+            csv_read = csv.DictReader(file)
+            for row in csv_read:
+                row = self._create_correct_row_fields(row)
+                try:
+                    model.objects.get_or_create(**row)
+                except Exception as error:
+                    self.stdout.write(f'Ошибка в строке {row.get("id")}.\n'
+                                      f'Текст - {error}')
+
+    def _foreign_keys(self, model):
+        """Возвращает {колонка csv: (attname, модель)} для FK модели."""
+
+        foreign_keys = {}
+        for field in model._meta.concrete_fields:
+            if field.is_relation:
+                target = (field.attname, field.related_model)
+                foreign_keys[field.name] = target
+                foreign_keys[field.attname] = target
+        return foreign_keys
+
+    def _build_object(self, path, line, model, row, foreign_keys,
+                      known_pks):
+        """
+        Собирает экземпляр модели из строки csv.
+        Возвращает None, если строка ссылается на несуществующий объект.
+        Нечисловой внешний ключ прерывает импорт с CommandError.
+        """
+
+        values = {}
+        for column, value in row.items():
+            if column not in foreign_keys:
+                values[column] = value
+                continue
+            attname, related_model = foreign_keys[column]
+            if value == '':
+                values[attname] = None
+                continue
+            try:
+                value = int(value)
+            except ValueError:
+                raise CommandError(
+                    f'{path}, строка {line}: некорректное значение '
+                    f'{value!r} в колонке {column}.'
+                )
+            if value not in known_pks[related_model]:
+                self.stderr.write(
+                    f'Ошибка в строке {row.get("id")}.\n'
+                    f'Текст - {related_model.__name__} с pk={value} '
+                    f'не найден.'
+                )
+                return None
+            values[attname] = value
+        return model(**values)
+
+    def _bulk_import(self, path, model, chunk_size):
+        """
+        Потоковый импорт файла пачками по chunk_size строк.
+        Каждая пачка вставляется одним bulk_create в своей транзакции,
+        уже существующие строки пропускаются.
+        """
+
+        foreign_keys = self._foreign_keys(model)
+        known_pks = {
+            related_model: set(
+                related_model.objects.values_list('pk', flat=True)
+            )
+            for _, related_model in foreign_keys.values()
+        }
+        rows = 0
+        started = time.monotonic()
+        with open(path, encoding='utf-8', mode='r') as file:
+            csv_read = csv.DictReader(file)
+            numbered = ((csv_read.line_num, row) for row in csv_read)
+            while True:
+                chunk = list(islice(numbered, chunk_size))
+                if not chunk:
+                    break
+                rows += len(chunk)
+                objects = [
+                    obj for obj in (
+                        self._build_object(path, line, model, row,
+                                           foreign_keys, known_pks)
+                        for line, row in chunk
+                    ) if obj is not None
+                ]
+                with transaction.atomic():
+                    model.objects.bulk_create(objects, ignore_conflicts=True)
+                if model in known_pks:
+                    known_pks[model].update(
+                        model.objects.filter(
+                            pk__in=[obj.pk for obj in objects]
+                        ).values_list('pk', flat=True)
+                    )
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            f'{path}: {rows} строк за {elapsed:.2f} с '
+            f'({rows / elapsed if elapsed else rows:.0f} строк/с)'
+        )
+
+    def _dependencies(self):
+        """
+        Строит граф зависимостей файлов по внешним ключам моделей:
+        {путь: множество путей, которые нужно загрузить раньше}.
+        """
+
+        paths = {model: path for path, model in model_csv_equal.items()}
+        return {
+            path: {
+                paths[field.related_model]
+                for field in model._meta.concrete_fields
+                if field.is_relation
+                and field.related_model is not model
+                and field.related_model in paths
+            }
+            for path, model in model_csv_equal.items()
+        }
+
+    def _run_in_order(self, import_file, workers):
+        """
+        Импортирует файлы пулом из workers потоков.
+        Файл запускается, как только загружены все файлы,
+        от которых он зависит; независимые файлы грузятся параллельно.
+        """
+
+        def run(path):
+            try:
+                import_file(path, model_csv_equal[path])
+            finally:
+                connections.close_all()
+
+        pending = self._dependencies()
+        done = set()
+        running = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while pending or running:
+                for path in [path for path, required in pending.items()
+                             if required <= done]:
+                    del pending[path]
+                    running[executor.submit(run, path)] = path
+                if not running:
+                    raise CommandError(
+                        f'Циклическая зависимость файлов: {sorted(pending)}'
+                    )
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    future.result()
+                    done.add(running.pop(future))
+
+    def _reset_sequences(self, models):
+        """Сдвигает счетчики первичных ключей после вставки явных id."""
+
+        statements = connection.ops.sequence_reset_sql(no_style(), models)
+        if statements:
+            with connection.cursor() as cursor:
+                for sql in statements:
+                    cursor.execute(sql)
+
     def handle(self, *args, **options):
-        for i in model_csv_equal.items():
-            path, model = i
-            rows = 0
-
-            with open(path, encoding='utf-8', mode='r') as file:
-                csv_read = csv.DictReader(file)
-                for row in csv_read:
-                    rows += 1
-                    row = self._create_correct_row_fields(row)
-                    try:
-                        model.objects.get_or_create(**row)
-                    except Exception as error:
-                        print(f'Ошибка в строке {row.get("id")}.\n'
-                              f'Текст - {error}')
+        if not options['bulk']:
+            self._run_in_order(self._import_rows, options['workers'])
+            return
+
+        self._run_in_order(
+            lambda path, model: self._bulk_import(
+                path, model, options['chunk_size']
+            ),
+            options['workers'],
+        )
+        self._reset_sequences(list(model_csv_equal.values()))
+        rebuild_ratings()
+        rebuild_index()
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from reviews.ratings import rebuild_ratings
+
+
+class Command(BaseCommand):
+    """
+    Команда для пересчета рейтингов произведений.
+    Вызов python3 manage.py rebuild_ratings
+    из терминала в соответствующей папке.
+    """
+
+    help = 'Пересчет рейтингов произведений по таблице отзывов.'
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            updated = rebuild_ratings()
+        self.stdout.write(f'Пересчитан рейтинг {updated} произведений.')
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from reviews.search import rebuild_index
+
+
+class Command(BaseCommand):
+    """
+    Команда для перестроения поискового индекса произведений.
+    Вызов python3 manage.py rebuild_search_index
+    из терминала в соответствующей папке.
+    """
+
+    help = 'Перестроение поискового индекса произведений.'
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            rebuild_index()
+        self.stdout.write('Поисковый индекс перестроен.')
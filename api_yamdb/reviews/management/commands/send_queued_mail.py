@@ -0,0 +1,45 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from reviews.outbox import dispatch_pending
+
+
+class Command(BaseCommand):
+    """
+    Команда для отправки писем из очереди.
+    Вызов python3 manage.py send_queued_mail [--loop]
+    из терминала в соответствующей папке.
+    """
+
+    help = 'Отправка писем из очереди исходящих писем.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Работать постоянно, проверяя очередь с интервалом.',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=1.0,
+            help='Пауза в секундах, когда очередь пуста.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            help='Количество писем за одно соединение с сервером.',
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            sent, failed = dispatch_pending(options['batch_size'])
+            if sent or failed:
+                self.stdout.write(
+                    f'Отправлено писем: {sent}, ошибок: {failed}.'
+                )
+            if not options['loop']:
+                return
+            if not sent and not failed:
+                time.sleep(options['interval'])
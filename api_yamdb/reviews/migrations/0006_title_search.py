@@ -0,0 +1,93 @@
+# Generated by Django 3.2 on 2026-10-18 19:59
+
+import re
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+TERM_LENGTH = 64
+NAME_WEIGHT = 2
+DESCRIPTION_WEIGHT = 1
+
+
+def fts5_available(connection):
+    if connection.vendor != 'sqlite':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute('PRAGMA compile_options')
+        return ('ENABLE_FTS5',) in cursor.fetchall()
+
+
+def tokenize(text):
+    return [
+        word[:TERM_LENGTH] for word in re.findall(r'\w+', text.lower())
+    ]
+
+
+def create_search_index(apps, schema_editor):
+    """
+    Заполняет индекс того бэкенда, который выберет reviews.search:
+    FTS5 на SQLite, иначе таблицу TitleSearchTerm.
+    """
+
+    if fts5_available(schema_editor.connection):
+        schema_editor.execute(
+            'CREATE VIRTUAL TABLE IF NOT EXISTS reviews_title_fts '
+            'USING fts5(name, description, tokenize="unicode61")'
+        )
+        schema_editor.execute(
+            'INSERT INTO reviews_title_fts (rowid, name, description) '
+            'SELECT id, name, description FROM reviews_title'
+        )
+        return
+    alias = schema_editor.connection.alias
+    Title = apps.get_model('reviews', 'Title')
+    TitleSearchTerm = apps.get_model('reviews', 'TitleSearchTerm')
+    terms = []
+    for title in Title.objects.using(alias).only(
+        'name', 'description'
+    ).iterator():
+        weights = {}
+        for term in tokenize(title.name):
+            weights[term] = weights.get(term, 0) + NAME_WEIGHT
+        for term in tokenize(title.description):
+            weights[term] = weights.get(term, 0) + DESCRIPTION_WEIGHT
+        terms.extend(
+            TitleSearchTerm(title_id=title.pk, term=term, weight=weight)
+            for term, weight in weights.items()
+        )
+    TitleSearchTerm.objects.using(alias).bulk_create(terms, batch_size=1000)
+
+
+def drop_fts_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute('DROP TABLE IF EXISTS reviews_title_fts')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0005_review_comment_pub_date_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TitleSearchTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(db_index=True, max_length=64, verbose_name='Слово')),
+                ('weight', models.PositiveSmallIntegerField(verbose_name='Вес')),
+                ('title', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_terms', to='reviews.title', verbose_name='Произведение')),
+            ],
+            options={
+                'verbose_name': 'Поисковое слово',
+                'verbose_name_plural': 'Поисковые слова',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='titlesearchterm',
+            constraint=models.UniqueConstraint(fields=('term', 'title'), name='unique_search_term'),
+        ),
+        migrations.RunPython(create_search_index, drop_fts_index),
+    ]
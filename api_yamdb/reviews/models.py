@@ -1,6 +1,7 @@
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.contrib.auth.models import AbstractUser
+from django.utils import timezone
 
 from reviews.validators import me_validator, validate_year
 
@@ -17,6 +18,18 @@ CHOICE_ROLE = (
     (ADMIN, 'Администратор'),
 )
 
+PENDING = 'pending'
+SENDING = 'sending'
+SENT = 'sent'
+FAILED = 'failed'
+
+CHOICE_EMAIL_STATUS = (
+    (PENDING, 'Ожидает отправки'),
+    (SENDING, 'Отправляется'),
+    (SENT, 'Отправлено'),
+    (FAILED, 'Не отправлено'),
+)
+
 
 class User(AbstractUser):
     """Переопределяем модель пользователей."""
@@ -150,6 +163,22 @@ class Title(models.Model):
         related_name='titles',
         verbose_name='Жанр произведения',
     )
+    rating_sum = models.PositiveIntegerField(
+        verbose_name='Сумма оценок',
+        default=0,
+        editable=False,
+    )
+    rating_count = models.PositiveIntegerField(
+        verbose_name='Количество оценок',
+        default=0,
+        editable=False,
+    )
+    rating = models.FloatField(
+        verbose_name='Рейтинг',
+        null=True,
+        db_index=True,
+        editable=False,
+    )
 
     class Meta:
         verbose_name = 'Произведение'
@@ -160,6 +189,36 @@ class Title(models.Model):
         return self.name[:TEXT_LENGTH]
 
 
+class TitleSearchTerm(models.Model):
+    """Слово из названия или описания произведения для поиска."""
+
+    term = models.CharField(
+        max_length=64,
+        verbose_name='Слово',
+        db_index=True,
+    )
+    title = models.ForeignKey(
+        Title,
+        on_delete=models.CASCADE,
+        related_name='search_terms',
+        verbose_name='Произведение'
+    )
+    weight = models.PositiveSmallIntegerField(verbose_name='Вес')
+
+    class Meta:
+        verbose_name = 'Поисковое слово'
+        verbose_name_plural = 'Поисковые слова'
+        constraints = (
+            models.UniqueConstraint(
+                fields=('term', 'title'),
+                name='unique_search_term'
+            ),
+        )
+
+    def __str__(self):
+        return self.term
+
+
 class GenreTitle(models.Model):
     """Kласс, связывающий жанры и произведения."""
 
@@ -209,6 +268,15 @@ class Review(models.Model):
         verbose_name='Дата публикации'
     )
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_rating = (
+            instance.__dict__.get('title_id'),
+            instance.__dict__.get('score'),
+        )
+        return instance
+
     class Meta:
         verbose_name = 'Отзыв'
         verbose_name_plural = 'Отзывы'
@@ -218,6 +286,12 @@ class Review(models.Model):
                 name='unique_review'
             ),
         )
+        indexes = (
+            models.Index(
+                fields=('title', 'pub_date', 'id'),
+                name='review_title_pub_date_idx'
+            ),
+        )
 
     def __str__(self):
         return self.text[:TEXT_LENGTH]
@@ -248,6 +322,71 @@ class Comment(models.Model):
     class Meta:
         verbose_name = 'Комментарий'
         verbose_name_plural = 'Комментарии'
+        indexes = (
+            models.Index(
+                fields=('review', 'pub_date', 'id'),
+                name='comment_review_pub_date_idx'
+            ),
+        )
 
     def __str__(self):
         return self.text[:TEXT_LENGTH]
+
+
+class OutgoingEmail(models.Model):
+    """Письмо в очереди на отправку."""
+
+    subject = models.CharField(
+        verbose_name='Тема',
+        max_length=255,
+    )
+    message = models.TextField(verbose_name='Текст письма')
+    from_email = models.EmailField(
+        verbose_name='Отправитель',
+        max_length=254,
+    )
+    recipient = models.EmailField(
+        verbose_name='Получатель',
+        max_length=254,
+    )
+    status = models.CharField(
+        verbose_name='Статус',
+        max_length=16,
+        choices=CHOICE_EMAIL_STATUS,
+        default=PENDING,
+    )
+    attempts = models.PositiveSmallIntegerField(
+        verbose_name='Попыток отправки',
+        default=0,
+    )
+    next_attempt_at = models.DateTimeField(
+        verbose_name='Следующая попытка',
+        default=timezone.now,
+    )
+    last_error = models.TextField(
+        verbose_name='Последняя ошибка',
+        blank=True,
+    )
+    created_at = models.DateTimeField(
+        verbose_name='Дата создания',
+        auto_now_add=True,
+    )
+    sent_at = models.DateTimeField(
+        verbose_name='Дата отправки',
+        null=True,
+        blank=True,
+    )
+
+    class Meta:
+        verbose_name = 'Исходящее письмо'
+        verbose_name_plural = 'Исходящие письма'
+        ordering = ('next_attempt_at', 'id')
+        indexes = (
+            models.Index(
+                fields=('status', 'next_attempt_at'),
+                name='outgoing_email_queue_idx'
+            ),
+        )
+
+    def __str__(self):
+        return f'{self.recipient} {self.subject[:TEXT_LENGTH]}'
@@ -0,0 +1,127 @@
+from contextlib import nullcontext
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import connection, transaction
+from django.utils import timezone
+
+from reviews.models import FAILED, PENDING, SENDING, SENT, OutgoingEmail
+
+
+def enqueue_mail(subject, message, from_email, recipient):
+    """Ставит письмо в очередь вместо отправки в запросе."""
+
+    return OutgoingEmail.objects.create(
+        subject=subject,
+        message=message,
+        from_email=from_email,
+        recipient=recipient,
+    )
+
+
+def retry_delay(attempts):
+    """Экспоненциальная задержка перед следующей попыткой."""
+
+    return timedelta(seconds=min(
+        settings.EMAIL_QUEUE_RETRY_DELAY * 2 ** (attempts - 1),
+        settings.EMAIL_QUEUE_MAX_RETRY_DELAY,
+    ))
+
+
+def _fail(email, error, now):
+    email.attempts += 1
+    email.last_error = str(error)
+    if email.attempts >= settings.EMAIL_QUEUE_MAX_ATTEMPTS:
+        email.status = FAILED
+    else:
+        email.status = PENDING
+        email.next_attempt_at = now + retry_delay(email.attempts)
+
+
+def _lease(email, until):
+    """
+    Забирает письмо условным UPDATE: строка меняется, только если
+    ее еще никто не забрал. Возвращает True, если письмо досталось нам.
+    """
+
+    leased = OutgoingEmail.objects.filter(
+        pk=email.pk,
+        status=email.status,
+        next_attempt_at=email.next_attempt_at,
+    ).update(status=SENDING, next_attempt_at=until)
+    email.status, email.next_attempt_at = SENDING, until
+    return bool(leased)
+
+
+def _claim_pending(now, batch_size):
+    """
+    Забирает пачку писем на время EMAIL_QUEUE_LEASE в короткой
+    транзакции. Письма, аренда которых истекла (отправитель упал),
+    забираются снова. На PostgreSQL занятые строки пропускаются через
+    skip_locked, на SQLite, где блокировки строк нет, два отправителя
+    разделяют письма условными UPDATE.
+    """
+
+    queryset = OutgoingEmail.objects.filter(
+        status__in=(PENDING, SENDING), next_attempt_at__lte=now,
+    ).order_by('next_attempt_at', 'id')
+    skip_locked = connection.features.has_select_for_update_skip_locked
+    if skip_locked:
+        queryset = queryset.select_for_update(skip_locked=True)
+    until = now + timedelta(seconds=settings.EMAIL_QUEUE_LEASE)
+    # Без блокировок строк транзакция не нужна: на SQLite в WAL
+    # запись из транзакции, начатой чтением, падает, если другой
+    # отправитель успел зафиксировать свою аренду.
+    with transaction.atomic() if skip_locked else nullcontext():
+        return [
+            email for email in queryset[:batch_size]
+            if _lease(email, until)
+        ]
+
+
+def dispatch_pending(batch_size=None):
+    """
+    Отправляет пачку писем из очереди через одно соединение
+    с почтовым сервером. Письма забираются в короткой транзакции
+    и отправляются вне ее, поэтому блокировки не держатся во время
+    работы с почтовым сервером. Неотправленные письма откладываются
+    с экспоненциальной задержкой. Возвращает (отправлено, ошибок).
+    """
+
+    now = timezone.now()
+    emails = _claim_pending(
+        now, batch_size or settings.EMAIL_QUEUE_BATCH_SIZE
+    )
+    if not emails:
+        return 0, 0
+    mail_connection = get_connection()
+    try:
+        mail_connection.open()
+    except Exception as error:
+        for email in emails:
+            _fail(email, error, now)
+    else:
+        for email in emails:
+            try:
+                EmailMessage(
+                    email.subject,
+                    email.message,
+                    email.from_email,
+                    [email.recipient],
+                    connection=mail_connection,
+                ).send()
+            except Exception as error:
+                _fail(email, error, now)
+            else:
+                email.status = SENT
+                email.sent_at = timezone.now()
+                email.attempts += 1
+    finally:
+        mail_connection.close()
+    OutgoingEmail.objects.bulk_update(
+        emails,
+        ('status', 'attempts', 'next_attempt_at', 'last_error', 'sent_at'),
+    )
+    sent = sum(email.status == SENT for email in emails)
+    return sent, len(emails) - sent
@@ -0,0 +1,51 @@
+from django.db.models import (Count, F, FloatField, IntegerField, OuterRef,
+                              Subquery, Sum)
+from django.db.models.functions import Cast, Coalesce, NullIf
+
+from reviews.models import Review, Title
+
+
+def _rating(rating_sum, rating_count):
+    """Выражение среднего балла; NULL, если оценок нет."""
+
+    return Cast(rating_sum, FloatField()) / NullIf(rating_count, 0)
+
+
+def shift_rating(title_id, score, count):
+    """Атомарно сдвигает счетчики рейтинга произведения."""
+
+    rating_sum = F('rating_sum') + score
+    rating_count = F('rating_count') + count
+    Title.objects.filter(pk=title_id).update(
+        rating_sum=rating_sum,
+        rating_count=rating_count,
+        rating=_rating(rating_sum, rating_count),
+    )
+
+
+def rebuild_ratings(titles=None):
+    """
+    Пересчитывает счетчики рейтинга по таблице отзывов
+    одним UPDATE-запросом. Возвращает число обновленных произведений.
+    """
+
+    if titles is None:
+        titles = Title.objects.all()
+    reviews = Review.objects.filter(
+        title=OuterRef('pk')
+    ).order_by().values('title')
+    rating_sum = Coalesce(
+        Subquery(reviews.annotate(total=Sum('score')).values('total')),
+        0,
+        output_field=IntegerField(),
+    )
+    rating_count = Coalesce(
+        Subquery(reviews.annotate(total=Count('pk')).values('total')),
+        0,
+        output_field=IntegerField(),
+    )
+    return titles.update(
+        rating_sum=rating_sum,
+        rating_count=rating_count,
+        rating=_rating(rating_sum, rating_count),
+    )
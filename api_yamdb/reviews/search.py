@@ -0,0 +1,162 @@
+import re
+from functools import lru_cache, reduce
+from operator import or_
+
+from django.db import connections
+from django.db.models import (Exists, IntegerField, OuterRef, Q, Subquery,
+                              Sum)
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Coalesce
+
+from reviews.models import Title, TitleSearchTerm
+
+FTS_TABLE = 'reviews_title_fts'
+TERM_LENGTH = 64
+NAME_WEIGHT = 2
+DESCRIPTION_WEIGHT = 1
+
+
+def tokenize(text):
+    """Разбивает текст на слова в нижнем регистре."""
+
+    return [
+        word[:TERM_LENGTH] for word in re.findall(r'\w+', text.lower())
+    ]
+
+
+@lru_cache(maxsize=None)
+def fts5_available(alias='default'):
+    """Поддерживает ли база индекс SQLite FTS5."""
+
+    connection = connections[alias]
+    if connection.vendor != 'sqlite':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute('PRAGMA compile_options')
+        return ('ENABLE_FTS5',) in cursor.fetchall()
+
+
+class FTS5SearchBackend:
+    """
+    Полнотекстовый индекс произведений на SQLite FTS5.
+    Таблица индекса создается миграцией 0006_title_search.
+    """
+
+    def __init__(self, alias='default'):
+        self.alias = alias
+
+    def index(self, titles):
+        with connections[self.alias].cursor() as cursor:
+            cursor.executemany(
+                f'DELETE FROM {FTS_TABLE} WHERE rowid = %s',
+                [(title.pk,) for title in titles],
+            )
+            cursor.executemany(
+                f'INSERT INTO {FTS_TABLE} (rowid, name, description) '
+                'VALUES (%s, %s, %s)',
+                [(title.pk, title.name, title.description)
+                 for title in titles],
+            )
+
+    def remove(self, title_id):
+        with connections[self.alias].cursor() as cursor:
+            cursor.execute(
+                f'DELETE FROM {FTS_TABLE} WHERE rowid = %s', (title_id,)
+            )
+
+    def clear(self):
+        with connections[self.alias].cursor() as cursor:
+            cursor.execute(f'DELETE FROM {FTS_TABLE}')
+
+    def search(self, queryset, query):
+        terms = tokenize(query)
+        if not terms:
+            return queryset.none()
+        match = ' '.join(f'"{term}"*' for term in terms)
+        return queryset.filter(
+            pk__in=RawSQL(
+                f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s',
+                (match,),
+            )
+        ).annotate(
+            search_rank=RawSQL(
+                f'SELECT bm25({FTS_TABLE}, {NAME_WEIGHT}, '
+                f'{DESCRIPTION_WEIGHT}) FROM {FTS_TABLE} '
+                f'WHERE {FTS_TABLE} MATCH %s '
+                f'AND rowid = {queryset.model._meta.db_table}.id',
+                (match,),
+            )
+        ).order_by('search_rank', 'pk')
+
+
+class InvertedIndexSearchBackend:
+    """Переносимый инвертированный индекс в таблице TitleSearchTerm."""
+
+    def index(self, titles):
+        terms = []
+        for title in titles:
+            weights = {}
+            for term in tokenize(title.name):
+                weights[term] = weights.get(term, 0) + NAME_WEIGHT
+            for term in tokenize(title.description):
+                weights[term] = weights.get(term, 0) + DESCRIPTION_WEIGHT
+            terms.extend(
+                TitleSearchTerm(title_id=title.pk, term=term, weight=weight)
+                for term, weight in weights.items()
+            )
+        TitleSearchTerm.objects.filter(
+            title_id__in=[title.pk for title in titles]
+        ).delete()
+        TitleSearchTerm.objects.bulk_create(terms)
+
+    def remove(self, title_id):
+        TitleSearchTerm.objects.filter(title_id=title_id).delete()
+
+    def clear(self):
+        TitleSearchTerm.objects.all().delete()
+
+    def search(self, queryset, query):
+        terms = tokenize(query)
+        if not terms:
+            return queryset.none()
+        for term in terms:
+            queryset = queryset.filter(Exists(
+                TitleSearchTerm.objects.filter(
+                    title=OuterRef('pk'), term__startswith=term
+                )
+            ))
+        rank = TitleSearchTerm.objects.filter(
+            reduce(or_, (Q(term__startswith=term) for term in terms)),
+            title=OuterRef('pk'),
+        ).order_by().values('title').annotate(
+            total=Sum('weight')
+        ).values('total')
+        return queryset.annotate(
+            search_rank=Coalesce(
+                Subquery(rank), 0, output_field=IntegerField()
+            )
+        ).order_by('-search_rank', 'pk')
+
+
+def get_search_backend(alias='default'):
+    """FTS5 на SQLite, иначе переносимый инвертированный индекс."""
+
+    if fts5_available(alias):
+        return FTS5SearchBackend(alias)
+    return InvertedIndexSearchBackend()
+
+
+def rebuild_index(chunk_size=1000):
+    """Перестраивает поисковый индекс по всем произведениям."""
+
+    backend = get_search_backend()
+    backend.clear()
+    titles = Title.objects.only('name', 'description').order_by('pk')
+    chunk = []
+    for title in titles.iterator(chunk_size=chunk_size):
+        chunk.append(title)
+        if len(chunk) == chunk_size:
+            backend.index(chunk)
+            chunk = []
+    if chunk:
+        backend.index(chunk)
@@ -0,0 +1,48 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from reviews.models import Review, Title
+from reviews.ratings import rebuild_ratings, shift_rating
+from reviews.search import get_search_backend
+
+
+@receiver(post_save, sender=Review)
+def review_saved(sender, instance, created, raw=False, **kwargs):
+    """Учитывает оценку нового или измененного отзыва в рейтинге."""
+
+    if raw:
+        return
+    loaded = getattr(instance, '_loaded_rating', None)
+    if created:
+        shift_rating(instance.title_id, instance.score, 1)
+    elif loaded is None:
+        rebuild_ratings(Title.objects.filter(pk=instance.title_id))
+    else:
+        old_title_id, old_score = loaded
+        if old_title_id != instance.title_id:
+            shift_rating(old_title_id, -old_score, -1)
+            shift_rating(instance.title_id, instance.score, 1)
+        elif old_score != instance.score:
+            shift_rating(instance.title_id, instance.score - old_score, 0)
+    instance._loaded_rating = (instance.title_id, instance.score)
+
+
+@receiver(post_delete, sender=Review)
+def review_deleted(sender, instance, **kwargs):
+    """Исключает оценку удаленного отзыва из рейтинга."""
+
+    shift_rating(instance.title_id, -instance.score, -1)
+
+
+@receiver(post_save, sender=Title)
+def title_saved(sender, instance, **kwargs):
+    """Обновляет произведение в поисковом индексе."""
+
+    get_search_backend().index([instance])
+
+
+@receiver(post_delete, sender=Title)
+def title_deleted(sender, instance, **kwargs):
+    """Удаляет произведение из поискового индекса."""
+
+    get_search_backend().remove(instance.pk)
@@ -0,0 +1,134 @@
+"""
+Бенчмарк эндпоинтов API: задержка (p50/p95), запросы к базе
+и пиковая память на запрос при разных объемах данных.
+
+Запуск из корня репозитория:
+    python -m benchmarks.api --scale 1k --output benchmarks/reports/1k.json
+Сравнение двух отчетов:
+    python -m benchmarks.api --compare old.json new.json
+"""
+
+import argparse
+from pathlib import Path
+
+from benchmarks.utils import (ROOT_DIR, compare_reports, measure,
+                              setup_django, write_report)
+
+DATA_DIR = ROOT_DIR / 'benchmarks' / 'data'
+
+
+def prepare_database(reviews):
+    """Применяет миграции и заполняет базу, если она пуста."""
+
+    from django.core.management import call_command
+
+    from benchmarks.seed import seed
+    from reviews.models import Review
+
+    call_command('migrate', verbosity=0)
+    count = Review.objects.count()
+    if count == reviews:
+        return
+    if count:
+        raise SystemExit(
+            f'В базе уже {count} отзывов. Удалите файл базы '
+            'или выберите другой масштаб.'
+        )
+    seed(reviews)
+
+
+def endpoints():
+    """Эндпоинты и клиенты, от имени которых выполняются запросы."""
+
+    from rest_framework.test import APIClient
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    from benchmarks.seed import ADMIN_USERNAME
+    from reviews.models import Comment, Review, User
+
+    anonymous = APIClient()
+    admin = APIClient()
+    admin.credentials(HTTP_AUTHORIZATION='Bearer ' + str(
+        AccessToken.for_user(User.objects.get(username=ADMIN_USERNAME))
+    ))
+    review = Review.objects.filter(title_id=1).order_by('pk').first()
+    comment = Comment.objects.order_by('pk').first()
+    reviews_url = f'/api/v1/titles/{review.title_id}/reviews/'
+    comments_url = (f'/api/v1/titles/{comment.review.title_id}/reviews/'
+                    f'{comment.review_id}/comments/')
+    return {
+        'categories-list': (anonymous, '/api/v1/categories/'),
+        'genres-list': (anonymous, '/api/v1/genres/'),
+        'titles-list': (anonymous, '/api/v1/titles/'),
+        'titles-list-deep': (anonymous, '/api/v1/titles/?page=20'),
+        'titles-filter': (anonymous, '/api/v1/titles/?genre=drama'),
+        'titles-search': (anonymous, '/api/v1/titles/?search=побег'),
+        'titles-order-rating': (anonymous,
+                                '/api/v1/titles/?ordering=-rating'),
+        'title-detail': (anonymous, f'/api/v1/titles/{review.title_id}/'),
+        'reviews-list': (anonymous, reviews_url),
+        'reviews-list-cursor': (anonymous,
+                                f'{reviews_url}?pagination=cursor'),
+        'review-detail': (anonymous, f'{reviews_url}{review.pk}/'),
+        'comments-list': (anonymous, comments_url),
+        'comment-detail': (anonymous, f'{comments_url}{comment.pk}/'),
+        'users-list': (admin, '/api/v1/users/'),
+        'users-me': (admin, '/api/v1/users/me/'),
+    }
+
+
+def run(iterations):
+    results = {}
+    for name, (client, url) in endpoints().items():
+        response = client.get(url)
+        assert response.status_code == 200, (name, response.status_code)
+        results[name] = {
+            'url': url,
+            **measure(lambda: client.get(url), iterations),
+        }
+    return results
+
+
+def main():
+    from benchmarks.seed import SCALES
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--scale', choices=SCALES, default='1k')
+    parser.add_argument(
+        '--reviews', type=int,
+        help='Количество отзывов вместо предустановленного масштаба.',
+    )
+    parser.add_argument('--iterations', type=int, default=50)
+    parser.add_argument('--output', help='Путь к JSON-отчету.')
+    parser.add_argument(
+        '--cache', action='store_true',
+        help='Включить кэш ответов (LocMemCache).',
+    )
+    parser.add_argument('--compare', nargs=2, metavar=('BASE', 'NEW'))
+    args = parser.parse_args()
+
+    if args.compare:
+        compare_reports(*args.compare)
+        return
+
+    reviews = args.reviews or SCALES[args.scale]
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    setup_django(
+        db_name=DATA_DIR / f'db_{reviews}.sqlite3',
+        cache_backend=(
+            'django.core.cache.backends.locmem.LocMemCache'
+            if args.cache else None
+        ),
+    )
+    prepare_database(reviews)
+    write_report(
+        Path(args.output) if args.output else None,
+        'api',
+        {'reviews': reviews, 'iterations': args.iterations,
+         'cache': args.cache},
+        run(args.iterations),
+    )
+
+
+if __name__ == '__main__':
+    main()
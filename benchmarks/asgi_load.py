@@ -0,0 +1,296 @@
+"""
+Нагрузочный тест чтения произведений, отзывов и комментариев: WSGI
+(api_yamdb.wsgi, поток на запрос) против ASGI (api_yamdb.asgi,
+асинхронные эндпоинты api.async_views) при одинаковом числе
+одновременных запросов. Сервер не нужен: приложения вызываются
+в процессе, каждый режим - в отдельном процессе.
+
+Запуск из корня репозитория:
+    python -m benchmarks.asgi_load --concurrency 64 --requests 2000 --cache
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from benchmarks.api import DATA_DIR, prepare_database
+from benchmarks.utils import percentile, setup_django, write_report
+
+MODES = ('wsgi', 'asgi')
+
+
+def read_urls():
+    from reviews.models import Comment
+
+    comment = Comment.objects.select_related('review').order_by('pk').first()
+    title_url = f'/api/v1/titles/{comment.review.title_id}/'
+    reviews_url = f'{title_url}reviews/'
+    comments_url = f'{reviews_url}{comment.review_id}/comments/'
+    return [
+        '/api/v1/titles/',
+        '/api/v1/titles/?page=2',
+        title_url,
+        reviews_url,
+        f'{reviews_url}{comment.review_id}/',
+        comments_url,
+        f'{comments_url}{comment.pk}/',
+    ]
+
+
+class ThreadMonitor(threading.Thread):
+    """Пиковое число потоков процесса за время нагрузки."""
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.peak = threading.active_count()
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(0.005):
+            self.peak = max(self.peak, threading.active_count())
+
+
+def wsgi_client():
+    from django.core.wsgi import get_wsgi_application
+    from django.test import RequestFactory
+
+    application = get_wsgi_application()
+    factory = RequestFactory()
+
+    def request(url, headers):
+        path, _, query = url.partition('?')
+        environ = factory._base_environ(
+            PATH_INFO=path, QUERY_STRING=query, REQUEST_METHOD='GET',
+            **{f'HTTP_{name.upper().replace("-", "_")}': value
+               for name, value in headers.items()},
+        )
+        started = []
+        b''.join(application(
+            environ, lambda status, headers: started.append((status, headers))
+        ))
+        status, headers = started[0]
+        return int(status.split()[0]), {
+            name.lower(): value for name, value in headers
+        }
+
+    return request
+
+
+def asgi_client():
+    from django.core.asgi import get_asgi_application
+
+    application = get_asgi_application()
+
+    async def request(url, headers):
+        path, _, query = url.partition('?')
+        scope = {
+            'type': 'http', 'asgi': {'version': '3.0'},
+            'http_version': '1.1', 'method': 'GET', 'scheme': 'http',
+            'path': path, 'raw_path': path.encode(),
+            'query_string': query.encode(),
+            'headers': [(b'host', b'testserver')] + [
+                (name.encode(), value.encode())
+                for name, value in headers.items()
+            ],
+            'server': ('testserver', 80), 'client': ('127.0.0.1', 0),
+        }
+        messages = []
+
+        async def receive():
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+        async def send(message):
+            messages.append(message)
+
+        await application(scope, receive, send)
+        return messages[0]['status'], {
+            name.decode().lower(): value.decode()
+            for name, value in messages[0]['headers']
+        }
+
+    return request
+
+
+def make_plan(urls, etags, total, revalidate):
+    """Список запросов: часть клиентов повторяет запрос с If-None-Match."""
+
+    rng = random.Random(0)
+    plan = []
+    for _ in range(total):
+        url = rng.choice(urls)
+        headers = {}
+        if url in etags and rng.random() < revalidate:
+            headers['if-none-match'] = etags[url]
+        plan.append((url, headers))
+    return plan
+
+
+def run_wsgi(request, plan, concurrency):
+    """Поток на одновременный запрос, как у WSGI-сервера с потоками."""
+
+    latencies = []
+    etags = {}
+
+    def timed(item):
+        started = time.perf_counter()
+        status, headers = request(*item)
+        latencies.append((time.perf_counter() - started) * 1000)
+        etags[item[0]] = headers.get('etag')
+        return status
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        statuses = list(executor.map(timed, plan))
+    return statuses, latencies, etags
+
+
+def run_asgi(request, plan, concurrency):
+    """Одновременные запросы - задачи одного цикла событий."""
+
+    latencies = []
+    etags = {}
+
+    async def worker(queue, statuses):
+        while queue:
+            item = queue.pop()
+            started = time.perf_counter()
+            status, headers = await request(*item)
+            latencies.append((time.perf_counter() - started) * 1000)
+            etags[item[0]] = headers.get('etag')
+            statuses.append(status)
+
+    async def main():
+        queue = list(reversed(plan))
+        statuses = []
+        await asyncio.gather(*(
+            worker(queue, statuses) for _ in range(concurrency)
+        ))
+        return statuses
+
+    return asyncio.run(main()), latencies, etags
+
+
+def run_mode(mode, concurrency, total, revalidate):
+    from django.db import connections
+
+    if mode == 'wsgi':
+        request, runner = wsgi_client(), run_wsgi
+    else:
+        request, runner = asgi_client(), run_asgi
+    urls = read_urls()
+    connections.close_all()
+    # Прогрев: ответы попадают в кэш, ETag запоминаются для повторных
+    # запросов клиентов.
+    statuses, _, etags = runner(request, [(url, {}) for url in urls], 1)
+    assert statuses == [200] * len(urls), statuses
+    etags = {url: etag for url, etag in etags.items() if etag}
+    plan = make_plan(urls, etags, total, revalidate)
+
+    monitor = ThreadMonitor()
+    monitor.start()
+    started = time.perf_counter()
+    statuses, latencies, _ = runner(request, plan, concurrency)
+    elapsed = time.perf_counter() - started
+    monitor.stopped.set()
+    monitor.join()
+
+    # Память на одновременный запрос: отдельный короткий прогон
+    # под tracemalloc, чтобы он не влиял на время.
+    tracemalloc.start()
+    runner(request, plan[:concurrency * 2], concurrency)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'requests': total,
+        'requests_per_sec': round(total / elapsed, 1),
+        'p50_ms': round(percentile(latencies, 50), 3),
+        'p95_ms': round(percentile(latencies, 95), 3),
+        'mean_ms': round(statistics.fmean(latencies), 3),
+        'not_modified': statuses.count(304),
+        'errors': sum(status >= 400 for status in statuses),
+        'peak_threads': monitor.peak,
+        'peak_kib_per_request': round(peak / 1024 / concurrency, 1),
+    }
+
+
+def child(args):
+    """Один режим в текущем процессе, результат - JSON в stdout."""
+
+    setup_django(
+        db_name=DATA_DIR / f'db_{args.reviews}.sqlite3',
+        cache_backend=(
+            'django.core.cache.backends.locmem.LocMemCache'
+            if args.cache else None
+        ),
+    )
+    prepare_database(args.reviews)
+    print(json.dumps(run_mode(
+        args.mode, args.concurrency, args.requests, args.revalidate
+    )))
+
+
+def main():
+    from benchmarks.seed import SCALES
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--scale', choices=SCALES, default='1k')
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument(
+        '--revalidate', type=float, default=0.5,
+        help='Доля запросов с If-None-Match от прошлого ответа.',
+    )
+    parser.add_argument(
+        '--cache', action='store_true',
+        help='Включить кэш ответов (LocMemCache).',
+    )
+    parser.add_argument('--mode', choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument('--reviews', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--output', help='Путь к JSON-отчету.')
+    args = parser.parse_args()
+
+    args.reviews = args.reviews or SCALES[args.scale]
+    if args.mode:
+        child(args)
+        return
+
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    params = {
+        'reviews': args.reviews, 'concurrency': args.concurrency,
+        'requests': args.requests, 'revalidate': args.revalidate,
+        'cache': args.cache,
+    }
+    results = {}
+    for mode in MODES:
+        # Набор маршрутов выбирается при импорте api.urls,
+        # поэтому каждый режим запускается в своем процессе.
+        output = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.asgi_load', '--mode', mode,
+             '--reviews', str(args.reviews),
+             '--concurrency', str(args.concurrency),
+             '--requests', str(args.requests),
+             '--revalidate', str(args.revalidate)]
+            + (['--cache'] if args.cache else []),
+            env={**os.environ,
+                 'ASYNC_READ_VIEWS': str(mode == 'asgi')},
+            capture_output=True, text=True, check=True,
+        ).stdout
+        results[mode] = json.loads(output.splitlines()[-1])
+    setup_django()
+    write_report(
+        Path(args.output) if args.output else None,
+        'asgi_load', params, results,
+    )
+
+
+if __name__ == '__main__':
+    main()
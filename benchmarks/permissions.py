@@ -0,0 +1,97 @@
+"""
+Микробенчмарк проверки прав: время всех permission-классов
+эндпоинта на один запрос (мкс) для каждой роли, без обращений к базе.
+
+Запуск из корня репозитория:
+    python -m benchmarks.permissions --output benchmarks/reports/perms.json
+"""
+
+import argparse
+from pathlib import Path
+
+from benchmarks.utils import measure_us, setup_django, write_report
+
+
+def users():
+    from django.contrib.auth.models import AnonymousUser
+
+    from reviews.models import ADMIN, MODERATOR, USER, User
+
+    return {
+        'anonymous': AnonymousUser(),
+        'user': User(pk=2, username='user', role=USER),
+        'moderator': User(pk=3, username='moderator', role=MODERATOR),
+        'admin': User(pk=4, username='admin', role=ADMIN),
+    }
+
+
+def endpoints():
+    """Метод и permission-классы эндпоинтов, объект для проверки."""
+
+    from rest_framework.permissions import (IsAuthenticated,
+                                            IsAuthenticatedOrReadOnly)
+
+    from api.permissions import (AdminOnly, AdminOrReadOnly,
+                                 AuthorOrModeratorsOrReadOnly)
+    from reviews.models import Review
+
+    # Автор отзыва не загружен: проверка идет по author_id.
+    review = Review(pk=1, title_id=1, author_id=2, score=5)
+    return {
+        'title-create': ('post', (AdminOrReadOnly,), None),
+        'review-update': (
+            'patch',
+            (IsAuthenticatedOrReadOnly, AuthorOrModeratorsOrReadOnly),
+            review,
+        ),
+        'review-detail': (
+            'get',
+            (IsAuthenticatedOrReadOnly, AuthorOrModeratorsOrReadOnly),
+            review,
+        ),
+        'users-list': ('get', (IsAuthenticated, AdminOnly), None),
+    }
+
+
+def run(iterations):
+    from rest_framework.request import Request
+    from rest_framework.test import APIRequestFactory, force_authenticate
+
+    factory = APIRequestFactory()
+    results = {}
+    for endpoint, (method, classes, obj) in endpoints().items():
+        permissions = [permission() for permission in classes]
+        for role, user in users().items():
+            django_request = getattr(factory, method)('/')
+            force_authenticate(django_request, user=user)
+
+            def check():
+                # Новый Request на каждую итерацию: права считаются заново.
+                request = Request(django_request)
+                request.user
+                for permission in permissions:
+                    permission.has_permission(request, None)
+                    if obj is not None:
+                        permission.has_object_permission(request, None, obj)
+
+            results[f'{endpoint}:{role}'] = measure_us(check, iterations)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--iterations', type=int, default=10000)
+    parser.add_argument('--output', help='Путь к JSON-отчету.')
+    args = parser.parse_args()
+
+    setup_django()
+    write_report(
+        Path(args.output) if args.output else None,
+        'permissions',
+        {'iterations': args.iterations},
+        run(args.iterations),
+    )
+
+
+if __name__ == '__main__':
+    main()
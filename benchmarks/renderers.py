@@ -0,0 +1,78 @@
+"""
+Микробенчмарк JSON-рендереров: время кодирования (мкс) и пропускная
+способность (МиБ/с) списков TitleViewingSerializer через JSONRenderer
+DRF и api.renderers.ORJSONRenderer. Базу заполняет benchmarks.api.
+
+Запуск из корня репозитория:
+    python -m benchmarks.renderers --scale 100k --sizes 5 100 1000
+"""
+
+import argparse
+from pathlib import Path
+
+from benchmarks.api import DATA_DIR, prepare_database
+from benchmarks.utils import measure_us, setup_django, write_report
+
+
+def title_lists(sizes):
+    """Данные ответа списка произведений для каждого размера."""
+
+    from api.serializers import TitleViewingSerializer
+    from api.views import TitleViewSet
+
+    titles = list(TitleViewSet.queryset.order_by('pk')[:max(sizes)])
+    return {
+        size: TitleViewingSerializer(titles[:size], many=True).data
+        for size in sizes if size <= len(titles)
+    }
+
+
+def run(sizes, iterations):
+    from rest_framework.renderers import JSONRenderer
+
+    from api.renderers import ORJSONRenderer
+
+    results = {}
+    for size, data in title_lists(sizes).items():
+        expected = JSONRenderer().render(data)
+        for renderer in (JSONRenderer(), ORJSONRenderer()):
+            assert renderer.render(data) == expected, type(renderer)
+            stats = measure_us(
+                lambda: renderer.render(data), iterations, warmup=10
+            )
+            stats['bytes'] = len(expected)
+            stats['mib_per_sec'] = round(
+                len(expected) / stats['mean_us'] * 10 ** 6 / 2 ** 20, 1
+            )
+            results[f'titles-{size}:{type(renderer).__name__}'] = stats
+    return results
+
+
+def main():
+    from benchmarks.seed import SCALES
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--scale', choices=SCALES, default='1k')
+    parser.add_argument(
+        '--sizes', type=int, nargs='+', default=[5, 100, 1000],
+        help='Количество произведений в списке.',
+    )
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--output', help='Путь к JSON-отчету.')
+    args = parser.parse_args()
+
+    reviews = SCALES[args.scale]
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    setup_django(db_name=DATA_DIR / f'db_{reviews}.sqlite3')
+    prepare_database(reviews)
+    write_report(
+        Path(args.output) if args.output else None,
+        'renderers',
+        {'reviews': reviews, 'sizes': args.sizes,
+         'iterations': args.iterations},
+        run(args.sizes, args.iterations),
+    )
+
+
+if __name__ == '__main__':
+    main()
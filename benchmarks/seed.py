@@ -0,0 +1,137 @@
+"""
+Генератор данных для бенчмарков по образцу static/data/*.csv.
+Категории, жанры, названия и тексты отзывов берутся из csv,
+объемы задаются количеством отзывов.
+"""
+
+import csv
+import math
+import random
+
+from benchmarks.utils import PROJECT_DIR
+
+DATA_DIR = PROJECT_DIR / 'static' / 'data'
+SCALES = {
+    '1k': 1_000,
+    '100k': 100_000,
+    '1m': 1_000_000,
+}
+BATCH_SIZE = 5000
+REVIEWS_PER_USER = 500
+GENRES_PER_TITLE = 2
+COMMENTS_PER_REVIEW = 0.1
+ADMIN_USERNAME = 'bench_admin'
+
+
+def read_csv(name):
+    with open(DATA_DIR / name, encoding='utf-8') as file:
+        return list(csv.DictReader(file))
+
+
+def batched(iterable, size=BATCH_SIZE):
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def plan(reviews):
+    """Размеры таблиц для заданного количества отзывов."""
+
+    users = max(4, math.ceil(reviews / REVIEWS_PER_USER))
+    titles = max(30, math.ceil(reviews / users))
+    return {
+        'reviews': reviews,
+        'users': users,
+        'titles': titles,
+        'comments': int(reviews * COMMENTS_PER_REVIEW),
+    }
+
+
+def seed(reviews, seed_value=0, stdout=print):
+    """Заполняет пустую базу данными заданного масштаба."""
+
+    from django.db import transaction
+
+    from reviews.models import (ADMIN, USER, Category, Comment, Genre,
+                                GenreTitle, Review, Title, User)
+    from reviews.ratings import rebuild_ratings
+    from reviews.search import rebuild_index
+
+    rng = random.Random(seed_value)
+    sizes = plan(reviews)
+    categories = read_csv('category.csv')
+    genres = read_csv('genre.csv')
+    titles = read_csv('titles.csv')
+    texts = [row['text'] for row in read_csv('review.csv')]
+    comments = [row['text'] for row in read_csv('comments.csv')]
+
+    with transaction.atomic():
+        Category.objects.bulk_create(
+            Category(pk=int(row['id']), name=row['name'], slug=row['slug'])
+            for row in categories
+        )
+        Genre.objects.bulk_create(
+            Genre(pk=int(row['id']), name=row['name'], slug=row['slug'])
+            for row in genres
+        )
+        for batch in batched(
+            Title(
+                pk=idx,
+                name=f'{titles[idx % len(titles)]["name"]} {idx}',
+                year=int(titles[idx % len(titles)]['year']),
+                category_id=int(categories[idx % len(categories)]['id']),
+                description=rng.choice(texts)[:200],
+            )
+            for idx in range(1, sizes['titles'] + 1)
+        ):
+            Title.objects.bulk_create(batch)
+        for batch in batched(
+            GenreTitle(title_id=title_id, genre_id=int(genre['id']))
+            for title_id in range(1, sizes['titles'] + 1)
+            for genre in rng.sample(genres, GENRES_PER_TITLE)
+        ):
+            GenreTitle.objects.bulk_create(batch)
+        for batch in batched(
+            User(
+                pk=idx,
+                username=ADMIN_USERNAME if idx == 1 else f'user{idx}',
+                email=f'user{idx}@yamdb.fake',
+                role=ADMIN if idx == 1 else USER,
+            )
+            for idx in range(1, sizes['users'] + 1)
+        ):
+            User.objects.bulk_create(batch)
+        stdout(f'Каталог: {sizes}')
+
+        for batch in batched(
+            Review(
+                pk=idx + 1,
+                title_id=idx % sizes['titles'] + 1,
+                author_id=idx // sizes['titles'] + 1,
+                text=rng.choice(texts),
+                score=rng.randint(1, 10),
+            )
+            for idx in range(reviews)
+        ):
+            Review.objects.bulk_create(batch)
+        stdout(f'Отзывы: {reviews}')
+
+        for batch in batched(
+            Comment(
+                review_id=idx % reviews + 1,
+                author_id=rng.randint(1, sizes['users']),
+                text=rng.choice(comments),
+            )
+            for idx in range(sizes['comments'])
+        ):
+            Comment.objects.bulk_create(batch)
+        stdout(f'Комментарии: {sizes["comments"]}')
+
+        rebuild_ratings()
+        rebuild_index()
+    return sizes
@@ -0,0 +1,106 @@
+"""
+Бенчмарк сериализации списков: выборка и сериализация страницы
+произведений, отзывов и комментариев через ModelSerializer
+и через ValuesSerializer (строки queryset.values()), объектов в секунду.
+
+Запуск из корня репозитория:
+    python -m benchmarks.serializers --scale 100k --sizes 5 100
+"""
+
+import argparse
+from pathlib import Path
+
+from benchmarks.api import DATA_DIR, prepare_database
+from benchmarks.utils import measure, setup_django, write_report
+
+
+def lists():
+    """Queryset, сериализатор DRF и ValuesSerializer каждого списка."""
+
+    from django.db.models import Count
+
+    from api import serializers
+    from api.views import CommentViewSet, ReviewViewSet, TitleViewSet
+    from reviews.models import Review
+
+    # Отзыв с наибольшим числом комментариев.
+    review = Review.objects.values('pk', 'title_id').annotate(
+        comment_count=Count('comments')
+    ).order_by('-comment_count', 'pk').first()
+    return {
+        'titles': (
+            TitleViewSet.queryset.order_by('-year', 'name'),
+            serializers.TitleViewingSerializer,
+            serializers.TitleValuesSerializer,
+        ),
+        'reviews': (
+            ReviewViewSet.queryset.filter(title_id=review['title_id']),
+            serializers.ReviewSerializer,
+            serializers.ReviewValuesSerializer,
+        ),
+        'comments': (
+            CommentViewSet.queryset.filter(review_id=review['pk']),
+            serializers.CommentSerializer,
+            serializers.CommentValuesSerializer,
+        ),
+    }
+
+
+def run(sizes, iterations):
+    from rest_framework.renderers import JSONRenderer
+
+    results = {}
+    for name, (queryset, serializer_class, values_class) in lists().items():
+        for size in sizes:
+
+            def model_serializer():
+                return serializer_class(queryset[:size], many=True).data
+
+            def values_serializer():
+                serializer = values_class()
+                return serializer.to_representation(
+                    serializer.get_queryset(queryset)[:size]
+                )
+
+            expected = JSONRenderer().render(model_serializer())
+            assert JSONRenderer().render(values_serializer()) == expected
+            count = len(model_serializer())
+            for label, func in (('ModelSerializer', model_serializer),
+                                ('ValuesSerializer', values_serializer)):
+                stats = measure(func, iterations)
+                stats['objects'] = count
+                stats['objects_per_sec'] = round(
+                    count / stats['mean_ms'] * 1000
+                )
+                results[f'{name}-{size}:{label}'] = stats
+    return results
+
+
+def main():
+    from benchmarks.seed import SCALES
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--scale', choices=SCALES, default='1k')
+    parser.add_argument(
+        '--sizes', type=int, nargs='+', default=[5, 100],
+        help='Размер страницы списка.',
+    )
+    parser.add_argument('--iterations', type=int, default=100)
+    parser.add_argument('--output', help='Путь к JSON-отчету.')
+    args = parser.parse_args()
+
+    reviews = SCALES[args.scale]
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    setup_django(db_name=DATA_DIR / f'db_{reviews}.sqlite3')
+    prepare_database(reviews)
+    write_report(
+        Path(args.output) if args.output else None,
+        'serializers',
+        {'reviews': reviews, 'sizes': args.sizes,
+         'iterations': args.iterations},
+        run(args.sizes, args.iterations),
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+"""Настройки проекта для бенчмарков: отдельная база на каждый масштаб."""
+
+import os
+
+from api_yamdb.settings import *  # noqa: F401,F403
+from api_yamdb.settings import BASE_DIR, SQLITE_PRAGMAS
+
+BENCHMARK_DIR = BASE_DIR.parent / 'benchmarks'
+
+DEBUG = False
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'api_yamdb.backends.sqlite3',
+        'NAME': os.environ.get(
+            'BENCHMARK_DB', str(BENCHMARK_DIR / 'db.sqlite3')
+        ),
+        'OPTIONS': {
+            'pragmas': dict(SQLITE_PRAGMAS),
+        },
+    }
+}
+
+# Кэш ответов отключен, чтобы измерять работу с базой;
+# включается ключом --cache.
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get(
+            'BENCHMARK_CACHE_BACKEND',
+            'django.core.cache.backends.dummy.DummyCache',
+        ),
+    }
+}
+
+EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
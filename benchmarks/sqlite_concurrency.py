@@ -0,0 +1,166 @@
+"""
+Бенчмарк конкурентного доступа к SQLite: пропускная способность чтения
+списков отзывов, пока другой поток пишет новые отзывы, с PRAGMA
+из SQLITE_PRAGMAS и с журналом отката по умолчанию.
+
+Запуск из корня репозитория:
+    python -m benchmarks.sqlite_concurrency --readers 4 --duration 10
+"""
+
+import argparse
+import random
+import statistics
+import threading
+import time
+from pathlib import Path
+
+from benchmarks.api import DATA_DIR, prepare_database
+from benchmarks.utils import percentile, setup_django, write_report
+
+PROFILES = {
+    # Настройки SQLite по умолчанию: журнал отката, synchronous=FULL.
+    'rollback-journal': {
+        'journal_mode': 'DELETE',
+        'synchronous': 'FULL',
+    },
+    'tuned': None,
+}
+
+
+def reader(client, urls, stop, stats):
+    from django.db import connection
+
+    rng = random.Random()
+    while not stop.is_set():
+        started = time.perf_counter()
+        response = client.get(rng.choice(urls))
+        elapsed = (time.perf_counter() - started) * 1000
+        if response.status_code == 200:
+            stats['latencies'].append(elapsed)
+        else:
+            stats['errors'] += 1
+    connection.close()
+
+
+def writer(titles, write_rate, stop, stats):
+    from django.db import DatabaseError, connection
+
+    from reviews.models import Review, User
+
+    title_ids = list(range(1, titles + 1))
+    while not stop.is_set():
+        author = User.objects.create(
+            username=f'writer{time.time_ns()}',
+            email=f'writer{time.time_ns()}@yamdb.fake',
+        )
+        for title_id in title_ids:
+            if stop.is_set():
+                break
+            # Постоянный темп записи, чтобы профили сравнивались
+            # при одинаковой нагрузке, а не при одинаковом GIL.
+            stop.wait(1 / write_rate)
+            try:
+                Review.objects.create(
+                    title_id=title_id, author=author, text='Текст', score=7
+                )
+                stats['writes'] += 1
+            except DatabaseError:
+                stats['errors'] += 1
+    connection.close()
+
+
+def run_profile(pragmas, readers, write_rate, duration, titles):
+    from django.db import connections
+    from rest_framework.test import APIClient
+
+    connections.close_all()
+    connections.settings['default']['OPTIONS']['pragmas'] = pragmas
+    # Новое соединение переключает режим журнала файла базы.
+    connections['default'].ensure_connection()
+    connections.close_all()
+
+    urls = [f'/api/v1/titles/{idx}/reviews/' for idx in range(1, titles + 1)]
+    stop = threading.Event()
+    reader_stats = [{'latencies': [], 'errors': 0} for _ in range(readers)]
+    writer_stats = {'writes': 0, 'errors': 0}
+    threads = [
+        threading.Thread(target=reader, args=(APIClient(), urls, stop, stats))
+        for stats in reader_stats
+    ]
+    threads.append(threading.Thread(
+        target=writer, args=(titles, write_rate, stop, writer_stats)
+    ))
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    latencies = [ms for stats in reader_stats for ms in stats['latencies']]
+    return {
+        'readers': readers,
+        'reads_per_sec': round(len(latencies) / duration, 1),
+        'read_p50_ms': round(percentile(latencies, 50), 3),
+        'read_p95_ms': round(percentile(latencies, 95), 3),
+        'read_mean_ms': round(statistics.fmean(latencies), 3),
+        'read_errors': sum(stats['errors'] for stats in reader_stats),
+        'writes_per_sec': round(writer_stats['writes'] / duration, 1),
+        'write_errors': writer_stats['errors'],
+    }
+
+
+def prepare_database_once(reviews):
+    """Заполняет базу при первом запуске, дальше только дописывает."""
+
+    from django.core.management import call_command
+
+    from reviews.models import Review
+
+    call_command('migrate', verbosity=0)
+    if not Review.objects.exists():
+        prepare_database(reviews)
+
+
+def main():
+    from benchmarks.seed import SCALES
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--scale', choices=SCALES, default='1k')
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument(
+        '--write-rate', type=float, default=50,
+        help='Отзывов в секунду, которые пишет фоновый поток.',
+    )
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--output', help='Путь к JSON-отчету.')
+    args = parser.parse_args()
+
+    reviews = SCALES[args.scale]
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    # Отдельная копия базы: бенчмарк дописывает в нее отзывы.
+    setup_django(db_name=DATA_DIR / f'db_concurrency_{reviews}.sqlite3')
+    prepare_database_once(reviews)
+
+    from django.conf import settings
+
+    from benchmarks.seed import plan
+
+    titles = plan(reviews)['titles']
+    results = {}
+    for name, pragmas in PROFILES.items():
+        results[name] = run_profile(
+            pragmas or dict(settings.SQLITE_PRAGMAS),
+            args.readers, args.write_rate, args.duration, titles,
+        )
+    write_report(
+        Path(args.output) if args.output else None,
+        'sqlite_concurrency',
+        {'reviews': reviews, 'readers': args.readers,
+         'write_rate': args.write_rate, 'duration': args.duration},
+        results,
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Бенчмарк ограничения частоты запросов к регистрации и токену:
+время проверки лимитов на один запрос (мкс), бюджет - 100 мкс по p95.
+Замеры на LocMemCache (Python 3.11): скользящее окно p50 ~50 мкс,
+p95 ~60-80 мкс на оба лимита. На загруженной машине p95 может выйти
+за бюджет, тогда within_budget в отчете будет false.
+
+Запуск из корня репозитория:
+    python -m benchmarks.throttling --output benchmarks/reports/throttling.json
+"""
+
+import argparse
+from pathlib import Path
+
+from benchmarks.utils import measure_us, setup_django, write_report
+
+BUDGET_US = 100
+
+
+def make_request():
+    from django.test import RequestFactory
+    from rest_framework.parsers import JSONParser
+    from rest_framework.request import Request
+
+    request = Request(
+        RequestFactory().post(
+            '/api/v1/auth/token/',
+            data={'username': 'bench', 'confirmation_code': 'code'},
+            content_type='application/json',
+        ),
+        parsers=[JSONParser()],
+    )
+    request.data
+    return request
+
+
+def timing(throttles, request, iterations):
+    """Время проверки всех throttles на один запрос (мкс)."""
+
+    def check():
+        for throttle in throttles:
+            throttle().allow_request(request, None)
+
+    result = measure_us(check, iterations)
+    result['within_budget'] = result['p95_us'] < BUDGET_US
+    return result
+
+
+def run(iterations):
+    from unittest import mock
+
+    from django.core.cache import cache
+    from django.test.utils import override_settings
+    from rest_framework.throttling import AnonRateThrottle
+
+    from api.throttling import AuthIPThrottle, AuthUsernameThrottle
+
+    request = make_request()
+    scenarios = {
+        'sliding-window-allowed': ((AuthIPThrottle, AuthUsernameThrottle),
+                                   '1000000/min'),
+        'sliding-window-throttled': ((AuthIPThrottle, AuthUsernameThrottle),
+                                     '10/min'),
+        # Стандартный throttle DRF хранит список отметок времени.
+        'drf-anon-rate': ((AnonRateThrottle,), '1000/min'),
+    }
+    results = {}
+    for name, (throttles, rate) in scenarios.items():
+        cache.clear()
+        rates = {'auth_ip': rate, 'auth_username': rate, 'anon': rate}
+        # AnonRateThrottle читает лимиты из атрибута класса,
+        # заполненного при импорте DRF.
+        with override_settings(REST_FRAMEWORK={
+            'DEFAULT_THROTTLE_RATES': rates,
+        }), mock.patch.object(AnonRateThrottle, 'THROTTLE_RATES', rates):
+            results[name] = timing(throttles, request, iterations)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--iterations', type=int, default=10000)
+    parser.add_argument('--output', help='Путь к JSON-отчету.')
+    args = parser.parse_args()
+
+    setup_django(
+        cache_backend='django.core.cache.backends.locmem.LocMemCache'
+    )
+    write_report(
+        Path(args.output) if args.output else None,
+        'throttling',
+        {'iterations': args.iterations, 'budget_p95_us': BUDGET_US},
+        run(args.iterations),
+    )
+
+
+if __name__ == '__main__':
+    main()
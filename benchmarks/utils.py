@@ -0,0 +1,143 @@
+"""Общие функции бенчмарков: настройка Django, замеры и отчет."""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+PROJECT_DIR = ROOT_DIR / 'api_yamdb'
+
+
+def setup_django(db_name=None, cache_backend=None):
+    """Подключает проект и настройки бенчмарков."""
+
+    sys.path.insert(0, str(PROJECT_DIR))
+    sys.path.insert(0, str(ROOT_DIR))
+    os.environ['DJANGO_SETTINGS_MODULE'] = 'benchmarks.settings'
+    if db_name:
+        os.environ['BENCHMARK_DB'] = str(db_name)
+    if cache_backend:
+        os.environ['BENCHMARK_CACHE_BACKEND'] = cache_backend
+
+    import django
+
+    django.setup()
+
+
+def percentile(samples, percent):
+    """Процентиль выборки (интерполяция, как в statistics.quantiles)."""
+
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method='inclusive')[
+        percent - 1
+    ]
+
+
+def measure(func, iterations, warmup=3):
+    """
+    Вызывает func iterations раз и возвращает статистику времени (мс),
+    количества запросов к базе и пикового потребления памяти (КиБ).
+    """
+
+    from django.db import connection, reset_queries
+    from django.test.utils import CaptureQueriesContext
+
+    for _ in range(warmup):
+        func()
+    timings = []
+    queries = []
+    for _ in range(iterations):
+        with CaptureQueriesContext(connection) as context:
+            started = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - started) * 1000)
+        queries.append(len(context.captured_queries))
+    reset_queries()
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'iterations': iterations,
+        'mean_ms': round(statistics.fmean(timings), 3),
+        'p50_ms': round(percentile(timings, 50), 3),
+        'p95_ms': round(percentile(timings, 95), 3),
+        'queries': max(queries),
+        'peak_kib': round(peak / 1024, 1),
+    }
+
+
+def measure_us(func, iterations, warmup=100):
+    """Статистика времени вызова func (мкс) для микробенчмарков."""
+
+    for _ in range(warmup):
+        func()
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter_ns()
+        func()
+        timings.append((time.perf_counter_ns() - started) / 1000)
+    return {
+        'iterations': iterations,
+        'mean_us': round(statistics.fmean(timings), 2),
+        'p50_us': round(percentile(timings, 50), 2),
+        'p95_us': round(percentile(timings, 95), 2),
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ('git', 'rev-parse', '--short', 'HEAD'),
+            cwd=ROOT_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_report(path, name, params, results):
+    """Сохраняет отчет в JSON со стабильным порядком ключей."""
+
+    import django
+
+    report = {
+        'benchmark': name,
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'params': params,
+        'results': results,
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2, sort_keys=True)
+    if path:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text(text + '\n', encoding='utf-8')
+    print(text)
+    return report
+
+
+def compare_reports(base_path, new_path,
+                    metrics=('p50_ms', 'p95_ms', 'queries', 'peak_kib')):
+    """Печатает изменение метрик между двумя отчетами."""
+
+    base = json.loads(Path(base_path).read_text(encoding='utf-8'))
+    new = json.loads(Path(new_path).read_text(encoding='utf-8'))
+    print(f'{base["commit"]} -> {new["commit"]}')
+    for name in sorted(set(base['results']) & set(new['results'])):
+        changes = []
+        for metric in metrics:
+            old = base['results'][name].get(metric)
+            value = new['results'][name].get(metric)
+            if old is None or value is None:
+                continue
+            delta = f'{(value - old) / old * 100:+.1f}%' if old else 'n/a'
+            changes.append(f'{metric} {old} -> {value} ({delta})')
+        print(f'{name}: ' + '; '.join(changes))
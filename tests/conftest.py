@@ -1,6 +1,9 @@
 import os
 import sys
+import time
+from types import SimpleNamespace
 
+import pytest
 from django.utils.version import get_version
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -33,3 +36,24 @@ assert get_version() < '4.0.0', 'Пожалуйста, используйте в
 pytest_plugins = [
     'tests.fixtures.fixture_user',
 ]
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    from django.core.cache import cache
+
+    cache.clear()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Часы версий ресурсов и Last-Modified, секунды задаются тестом."""
+
+    now = SimpleNamespace(value=time.time())
+    fake = SimpleNamespace(
+        time=lambda: now.value,
+        time_ns=lambda: int(now.value * 10 ** 9),
+    )
+    monkeypatch.setattr('api.cache.time', fake)
+    monkeypatch.setattr('api.mixins.time', fake)
+    return now
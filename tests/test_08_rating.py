@@ -0,0 +1,95 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.management import call_command
+
+from tests.utils import create_single_review, create_titles, migrate
+
+
+@pytest.mark.django_db(transaction=True)
+class Test08TitleRating:
+
+    def test_01_rating_follows_reviews(self, admin_client, user_client,
+                                       moderator_client):
+        titles, _, _ = create_titles(admin_client)
+        url = f'/api/v1/titles/{titles[0]["id"]}/'
+        reviews_url = f'/api/v1/titles/{titles[0]["id"]}/reviews/'
+
+        first = create_single_review(user_client, titles[0]['id'], 'a', 4)
+        create_single_review(moderator_client, titles[0]['id'], 'b', 7)
+        assert admin_client.get(url).json()['rating'] == 5.5, (
+            'Проверьте, что рейтинг произведения обновляется при '
+            'создании отзыва.'
+        )
+
+        response = user_client.patch(
+            f'{reviews_url}{first.json()["id"]}/', data={'score': 10}
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert admin_client.get(url).json()['rating'] == 8.5, (
+            'Проверьте, что рейтинг произведения обновляется при '
+            'изменении оценки отзыва.'
+        )
+
+        user_client.delete(f'{reviews_url}{first.json()["id"]}/')
+        assert admin_client.get(url).json()['rating'] == 7, (
+            'Проверьте, что рейтинг произведения обновляется при '
+            'удалении отзыва.'
+        )
+
+    def test_02_rebuild_ratings_command(self, admin_client, user_client):
+        from reviews.models import Title
+
+        titles, _, _ = create_titles(admin_client)
+        create_single_review(user_client, titles[0]['id'], 'a', 3)
+        Title.objects.update(rating_sum=0, rating_count=0, rating=None)
+
+        call_command('rebuild_ratings')
+
+        title = Title.objects.get(pk=titles[0]['id'])
+        assert (title.rating_sum, title.rating_count, title.rating) == (
+            3, 1, 3
+        ), 'Проверьте, что команда rebuild_ratings пересчитывает рейтинг.'
+        title = Title.objects.get(pk=titles[1]['id'])
+        assert (title.rating_count, title.rating) == (0, None)
+
+    def test_03_order_by_rating(self, admin_client, user_client):
+        titles, _, _ = create_titles(admin_client)
+        create_single_review(user_client, titles[0]['id'], 'a', 2)
+        create_single_review(user_client, titles[1]['id'], 'b', 9)
+
+        response = admin_client.get('/api/v1/titles/?ordering=-rating')
+        ids = [title['id'] for title in response.json()['results']]
+        assert ids == [titles[1]['id'], titles[0]['id']], (
+            'Проверьте, что список произведений сортируется по рейтингу.'
+        )
+
+    def test_04_migration_fills_ratings(self):
+        from django.db.migrations.loader import MigrationLoader
+
+        latest = MigrationLoader(None).graph.leaf_nodes('reviews')[0][1]
+        apps = migrate('reviews', '0003_alter_title_year')
+        try:
+            Title = apps.get_model('reviews', 'Title')
+            Review = apps.get_model('reviews', 'Review')
+            User = apps.get_model('reviews', 'User')
+            rated = Title.objects.create(name='С отзывами', year=2000)
+            empty = Title.objects.create(name='Без отзывов', year=2000)
+            for idx, score in enumerate((4, 9)):
+                Review.objects.create(
+                    title=rated, text='a', score=score,
+                    author=User.objects.create(
+                        username=f'author{idx}', email=f'a{idx}@yamdb.fake'
+                    ),
+                )
+            apps = migrate('reviews', '0004_title_rating')
+            Title = apps.get_model('reviews', 'Title')
+            assert Title.objects.filter(pk=rated.pk).values_list(
+                'rating_sum', 'rating_count', 'rating'
+            ).get() == (13, 2, 6.5), (
+                'Проверьте, что миграция 0004 заполняет рейтинг '
+                'существующих произведений.'
+            )
+            assert Title.objects.get(pk=empty.pk).rating is None
+        finally:
+            migrate('reviews', latest)
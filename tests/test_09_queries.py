@@ -0,0 +1,187 @@
+import pytest
+
+from tests.utils import create_titles
+
+
+def create_many_titles(count):
+    from reviews.models import Category, Genre, GenreTitle, Title
+
+    category = Category.objects.create(name='Сериалы', slug='series')
+    genres = [
+        Genre.objects.create(name=f'Жанр {idx}', slug=f'genre-{idx}')
+        for idx in range(3)
+    ]
+    Title.objects.bulk_create(
+        Title(name=f'Сериал {idx}', year=2000, category=category)
+        for idx in range(count)
+    )
+    titles = Title.objects.filter(category=category)
+    GenreTitle.objects.bulk_create(
+        GenreTitle(genre=genre, title=title)
+        for title in titles for genre in genres
+    )
+    return titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test09QueryCount:
+
+    @pytest.mark.parametrize('titles_count', (1, 5, 20))
+    def test_01_title_list(self, client, django_assert_num_queries,
+                           titles_count):
+        create_many_titles(titles_count)
+
+        # COUNT для пагинации, страница произведений с категориями, жанры.
+        with django_assert_num_queries(3):
+            response = client.get('/api/v1/titles/')
+        assert len(response.json()['results']) == min(titles_count, 5)
+        assert all(
+            title['genre'] and title['category']
+            for title in response.json()['results']
+        )
+
+    def test_02_title_detail(self, admin_client, client,
+                             django_assert_num_queries):
+        titles, _, _ = create_titles(admin_client)
+
+        with django_assert_num_queries(2):
+            response = client.get(f'/api/v1/titles/{titles[0]["id"]}/')
+        assert len(response.json()['genre']) == 2
+
+    def test_03_signup(self, client, django_assert_num_queries):
+        data = {'email': 'signup@yamdb.fake', 'username': 'signup'}
+
+        # Поиск пользователя, INSERT нового, UPDATE confirmation_code.
+        with django_assert_num_queries(3) as context:
+            response = client.post('/api/v1/auth/signup/', data=data)
+        assert response.status_code == 200
+        update = context.captured_queries[-1]['sql']
+        assert update.startswith('UPDATE') and 'username' not in update, (
+            'Проверьте, что при регистрации confirmation_code сохраняется '
+            'обновлением одного поля.'
+        )
+
+        # Повторная регистрация: поиск пользователя и UPDATE кода.
+        with django_assert_num_queries(2):
+            response = client.post('/api/v1/auth/signup/', data=data)
+        assert response.status_code == 200
+
+    def test_04_object_permission(self, user, moderator, django_user_model,
+                                  django_assert_num_queries):
+        from rest_framework.request import Request
+        from rest_framework.test import APIRequestFactory, force_authenticate
+
+        from api.permissions import AuthorOrModeratorsOrReadOnly
+        from reviews.models import Review
+
+        titles = create_many_titles(1)
+        Review.objects.create(
+            title=titles[0], author=user, text='Текст', score=5
+        )
+        review = Review.objects.get()
+        other = django_user_model.objects.create_user(
+            username='other', email='other@yamdb.fake'
+        )
+        permission = AuthorOrModeratorsOrReadOnly()
+        for author, expected in ((user, True), (moderator, True),
+                                 (other, False)):
+            django_request = APIRequestFactory().patch('/')
+            force_authenticate(django_request, user=author)
+            request = Request(django_request)
+            request.user
+            with django_assert_num_queries(0):
+                assert permission.has_object_permission(
+                    request, None, review
+                ) is expected, (
+                    'Проверьте, что автор объекта сравнивается по author_id '
+                    'без загрузки пользователя из базы.'
+                )
+
+    def test_05_nested_parent(self, user_client,
+                              django_assert_max_num_queries):
+        title = create_many_titles(1)[0]
+        url = f'/api/v1/titles/{title.pk}/reviews/'
+        with django_assert_max_num_queries(20) as context:
+            response = user_client.post(url, data={'text': 'Текст',
+                                                   'score': 5})
+        assert response.status_code == 201
+        title_selects = [
+            query['sql'] for query in context.captured_queries
+            if query['sql'].startswith('SELECT')
+            and 'FROM "reviews_title"' in query['sql']
+        ]
+        assert len(title_selects) == 1 and title_selects[0].startswith(
+            'SELECT "reviews_title"."id" FROM'
+        ), (
+            'Проверьте, что при создании отзыва произведение '
+            'проверяется одним запросом его id.'
+        )
+        assert not any(
+            query['sql'].startswith('SELECT')
+            and 'FROM "reviews_review"' in query['sql']
+            for query in context.captured_queries
+        ), (
+            'Проверьте, что повторный отзыв отсекается ограничением '
+            'unique_review, а не запросом перед вставкой.'
+        )
+        review_id = response.json()['id']
+        duplicate = user_client.post(url, data={'text': 'Текст', 'score': 5})
+        assert duplicate.status_code == 400
+        assert duplicate.json() == {
+            'non_field_errors': ['Вы уже оставили отзыв к этому произведению']
+        }
+
+        assert user_client.get(
+            f'/api/v1/titles/{title.pk}/reviews/{review_id + 1}/comments/'
+        ).status_code == 404
+        assert user_client.get(
+            f'/api/v1/titles/{title.pk + 1}/reviews/{review_id}/comments/'
+        ).status_code == 404, (
+            'Проверьте, что отзыв ищется с учетом произведения из адреса.'
+        )
+
+    @pytest.mark.parametrize('page_size', (2, 5, 20))
+    @pytest.mark.parametrize('pagination', ('', '?pagination=cursor'))
+    def test_06_review_comment_lists(self, client, monkeypatch,
+                                     django_user_model,
+                                     django_assert_num_queries,
+                                     page_size, pagination):
+        from rest_framework.pagination import (CursorPagination,
+                                               PageNumberPagination)
+
+        from reviews.models import Comment, Review
+
+        monkeypatch.setattr(PageNumberPagination, 'page_size', page_size)
+        monkeypatch.setattr(CursorPagination, 'page_size', page_size)
+        title = create_many_titles(1)[0]
+        django_user_model.objects.bulk_create(
+            django_user_model(username=f'author{idx}',
+                              email=f'author{idx}@yamdb.fake')
+            for idx in range(20)
+        )
+        authors = list(django_user_model.objects.all())
+        Review.objects.bulk_create(
+            Review(title=title, author=author, text='Текст', score=5)
+            for author in authors
+        )
+        review = Review.objects.first()
+        Comment.objects.bulk_create(
+            Comment(review=review, author=author, text='Текст')
+            for author in authors
+        )
+        urls = (
+            f'/api/v1/titles/{title.pk}/reviews/',
+            f'/api/v1/titles/{title.pk}/reviews/{review.pk}/comments/',
+        )
+        # Проверка родителя, (COUNT для постраничной пагинации),
+        # страница вместе с авторами.
+        queries = 2 if pagination else 3
+        for url in urls:
+            with django_assert_num_queries(queries):
+                response = client.get(url + pagination)
+            results = response.json()['results']
+            assert len(results) == page_size
+            assert all(item['author'] for item in results), (
+                'Проверьте, что имена авторов загружаются тем же запросом, '
+                'что и страница отзывов и комментариев.'
+            )
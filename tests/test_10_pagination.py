@@ -0,0 +1,56 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.utils import check_pagination, create_titles
+
+
+def create_many_reviews(title_id, count):
+    from reviews.models import Review, User
+
+    for idx in range(count):
+        author = User.objects.create_user(
+            username=f'reviewer{idx}', email=f'reviewer{idx}@yamdb.fake'
+        )
+        Review.objects.create(
+            title_id=title_id, author=author, text=f'review {idx}', score=5
+        )
+
+
+@pytest.mark.django_db(transaction=True)
+class Test10CursorPagination:
+
+    def test_01_page_number_by_default(self, admin_client, client):
+        titles, _, _ = create_titles(admin_client)
+        create_many_reviews(titles[0]['id'], 3)
+        url = f'/api/v1/titles/{titles[0]["id"]}/reviews/'
+
+        check_pagination(url, client.get(url).json(), 3)
+
+    def test_02_review_cursor(self, admin_client, client):
+        titles, _, _ = create_titles(admin_client)
+        create_many_reviews(titles[0]['id'], 12)
+        url = (f'/api/v1/titles/{titles[0]["id"]}/reviews/'
+               '?pagination=cursor')
+
+        seen = []
+        while url:
+            with CaptureQueriesContext(connection) as context:
+                response = client.get(url)
+            assert response.status_code == 200
+            data = response.json()
+            assert 'count' not in data, (
+                'Проверьте, что курсорная пагинация не считает '
+                'общее количество объектов.'
+            )
+            assert not any(
+                'COUNT(' in query['sql'] for query in context.captured_queries
+            )
+            seen.extend(review['id'] for review in data['results'])
+            url = data['next']
+
+        assert len(seen) == len(set(seen)) == 12
+        assert seen == sorted(seen, reverse=True), (
+            'Проверьте, что курсорная пагинация упорядочивает отзывы '
+            'от новых к старым.'
+        )
@@ -0,0 +1,189 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test11ResponseCache:
+
+    def test_01_cached_list_is_invalidated(self, admin_client, client,
+                                           django_assert_num_queries):
+        create_titles(admin_client)
+        url = '/api/v1/categories/'
+
+        response = client.get(url)
+        assert response['X-Cache'] == 'MISS'
+        with django_assert_num_queries(0):
+            response = client.get(url)
+        assert response['X-Cache'] == 'HIT'
+        assert response.json()['count'] == 2
+
+        admin_client.post(url, data={'name': 'Музыка', 'slug': 'music'})
+        response = client.get(url)
+        assert response['X-Cache'] == 'MISS'
+        assert response.json()['count'] == 3, (
+            'Проверьте, что кэш категорий сбрасывается при создании '
+            'категории.'
+        )
+
+    def test_02_title_cache_follows_related_models(self, admin_client,
+                                                   client, user_client):
+        titles, _, _ = create_titles(admin_client)
+        url = f'/api/v1/titles/{titles[0]["id"]}/'
+
+        assert client.get(url).json()['rating'] is None
+        assert client.get(url)['X-Cache'] == 'HIT'
+
+        create_single_review(user_client, titles[0]['id'], 'text', 8)
+        assert client.get(url).json()['rating'] == 8, (
+            'Проверьте, что кэш произведения сбрасывается при '
+            'добавлении отзыва.'
+        )
+
+        admin_client.patch(url, data={'genre': ['drama']})
+        genres = [genre['slug'] for genre in client.get(url).json()['genre']]
+        assert genres == ['drama'], (
+            'Проверьте, что кэш произведения сбрасывается при '
+            'изменении жанров.'
+        )
+
+        admin_client.delete('/api/v1/categories/films/')
+        assert client.get(url).json()['category'] is None, (
+            'Проверьте, что кэш произведения сбрасывается при '
+            'удалении категории.'
+        )
+
+    def test_03_cache_stats(self, admin_client, client, user_client):
+        client.get('/api/v1/genres/')
+        client.get('/api/v1/genres/')
+
+        response = user_client.get('/api/v1/cache-stats/')
+        assert response.status_code == HTTPStatus.FORBIDDEN
+        response = admin_client.get('/api/v1/cache-stats/')
+        assert response.json()['genres'] == {'hits': 1, 'misses': 1}
+
+    def test_04_conditional_get(self, admin_client, client, user_client,
+                                django_assert_num_queries, clock):
+        titles, _, _ = create_titles(admin_client)
+        review = create_single_review(user_client, titles[0]['id'], 'a', 5)
+        url = f'/api/v1/titles/{titles[0]["id"]}/reviews/'
+
+        # Первый запрос заводит версии ресурсов, Last-Modified
+        # отдается после окончания их секунды.
+        client.get(url)
+        clock.value += 1
+        response = client.get(url)
+        etag = response['ETag']
+        last_modified = response['Last-Modified']
+        assert etag and last_modified, (
+            f'Проверьте, что ответ на GET-запрос к `{url}` содержит '
+            'заголовки ETag и Last-Modified.'
+        )
+        with django_assert_num_queries(0):
+            response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+        response = client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+        comments_url = f'{url}{review.json()["id"]}/comments/'
+        comments_etag = client.get(comments_url)['ETag']
+        user_client.post(comments_url, data={'text': 'comment'})
+        response = client.get(comments_url, HTTP_IF_NONE_MATCH=comments_etag)
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что ETag списка комментариев меняется при '
+            'добавлении комментария.'
+        )
+        assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == (
+            HTTPStatus.NOT_MODIFIED
+        )
+
+        user_client.patch(f'{url}{review.json()["id"]}/', data={'score': 9})
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что ETag списка отзывов меняется при '
+            'изменении отзыва.'
+        )
+        assert response['ETag'] != etag
+
+    def test_05_last_modified_in_same_second(self, admin_client, client,
+                                             clock):
+        clock.value = 1000.2
+        titles, _, _ = create_titles(admin_client)
+        url = f'/api/v1/titles/{titles[0]["id"]}/'
+
+        assert 'Last-Modified' not in client.get(url), (
+            'Проверьте, что Last-Modified не отдается до окончания '
+            'секунды последнего изменения.'
+        )
+        clock.value = 1001.5
+        last_modified = client.get(url)['Last-Modified']
+        assert client.get(
+            url, HTTP_IF_MODIFIED_SINCE=last_modified
+        ).status_code == HTTPStatus.NOT_MODIFIED
+
+        clock.value = 1001.6
+        admin_client.patch(url, data={'name': 'Терминатор 2'})
+        for clock.value in (1001.7, 1002.5):
+            response = client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+            assert response.status_code == HTTPStatus.OK, (
+                'Проверьте, что изменение в ту же секунду, что и прошлый '
+                'ответ, не дает 304 по If-Modified-Since.'
+            )
+            assert response.json()['name'] == 'Терминатор 2'
+
+    def test_06_process_local_cache_warning(self, settings):
+        from api.checks import check_api_cache_shared
+
+        settings.DEBUG = False
+        assert [warning.id for warning in check_api_cache_shared(None)] == [
+            'api.W001'
+        ], 'Проверьте предупреждение о кэше версий в памяти процесса.'
+        settings.CACHES = {'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'api_cache',
+        }}
+        assert check_api_cache_shared(None) == []
+
+    def test_07_signup_keeps_authors_version(self, client, admin,
+                                             clock):
+        from api.cache import get_versions
+
+        versions = get_versions(('authors',))
+        clock.value += 1
+        client.post('/api/v1/auth/signup/', data={
+            'username': 'newcomer', 'email': 'newcomer@yamdb.fake',
+        })
+        assert get_versions(('authors',)) == versions, (
+            'Проверьте, что регистрация пользователя не сбрасывает '
+            'кэш отзывов и комментариев всех произведений.'
+        )
+        admin.username = 'renamed'
+        admin.save()
+        assert get_versions(('authors',)) != versions, (
+            'Проверьте, что смена username сбрасывает кэш отзывов '
+            'и комментариев.'
+        )
+
+    def test_08_padded_ids_share_versions(self, admin_client, client,
+                                          user_client):
+        titles, _, _ = create_titles(admin_client)
+        review = create_single_review(user_client, titles[0]['id'], 'a', 5)
+        url = f'/api/v1/titles/0{titles[0]["id"]}/reviews/'
+        comments_url = f'{url}0{review.json()["id"]}/comments/'
+
+        etag = client.get(url)['ETag']
+        comments_etag = client.get(comments_url)['ETag']
+        admin_client.post(url, data={'text': 'b', 'score': 7})
+        user_client.post(comments_url, data={'text': 'comment'})
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что ETag списка отзывов меняется и для id '
+            'произведения с ведущими нулями в URL.'
+        )
+        response = client.get(comments_url, HTTP_IF_NONE_MATCH=comments_etag)
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что ETag списка комментариев меняется и для id '
+            'отзыва с ведущими нулями в URL.'
+        )
@@ -0,0 +1,91 @@
+import importlib
+
+import pytest
+
+from tests.utils import create_titles, migrate
+
+
+@pytest.fixture(params=('fts5', 'inverted_index'))
+def search_backend(request, monkeypatch):
+    if request.param == 'inverted_index':
+        monkeypatch.setattr(
+            'reviews.search.fts5_available', lambda alias='default': False
+        )
+    return request.param
+
+
+def search(client, query):
+    response = client.get('/api/v1/titles/', {'search': query})
+    assert response.status_code == 200
+    return [title['name'] for title in response.json()['results']]
+
+
+@pytest.mark.django_db(transaction=True)
+class Test12TitleSearch:
+
+    def test_01_search_name_and_description(self, search_backend,
+                                            admin_client, client):
+        create_titles(admin_client)
+
+        assert search(client, 'ТЕРМИН') == ['Терминатор'], (
+            'Проверьте, что поиск находит произведение по началу слова '
+            'из названия без учета регистра.'
+        )
+        assert search(client, 'yippie') == ['Крепкий орешек'], (
+            'Проверьте, что поиск находит произведение по описанию.'
+        )
+        assert search(client, 'крепкий терминатор') == []
+        assert search(client, '%') == []
+
+    def test_02_search_ranking(self, search_backend, admin_client, client):
+        titles, _, _ = create_titles(admin_client)
+        admin_client.patch(
+            f'/api/v1/titles/{titles[1]["id"]}/',
+            data={'description': 'Не Терминатор'}
+        )
+
+        assert search(client, 'терминатор') == [
+            'Терминатор', 'Крепкий орешек'
+        ], (
+            'Проверьте, что совпадение в названии ранжируется выше '
+            'совпадения в описании.'
+        )
+
+    def test_03_index_follows_titles(self, search_backend, admin_client,
+                                     client):
+        titles, _, _ = create_titles(admin_client)
+        url = f'/api/v1/titles/{titles[0]["id"]}/'
+
+        admin_client.patch(url, data={'name': 'Чужой'})
+        assert search(client, 'терминатор') == []
+        assert search(client, 'чужой') == ['Чужой']
+
+        admin_client.delete(url)
+        assert search(client, 'чужой') == []
+
+    def test_04_migration_fills_index(self, search_backend, client,
+                                      monkeypatch):
+        from django.db.migrations.loader import MigrationLoader
+
+        latest = MigrationLoader(None).graph.leaf_nodes('reviews')[0][1]
+        apps = migrate('reviews', '0005_review_comment_pub_date_index')
+        try:
+            apps.get_model('reviews', 'Title').objects.create(
+                name='Терминатор', year=1984, description='I`ll be back'
+            )
+            if search_backend == 'inverted_index':
+                monkeypatch.setattr(
+                    importlib.import_module(
+                        'reviews.migrations.0006_title_search'
+                    ),
+                    'fts5_available', lambda connection: False,
+                )
+            migrate('reviews', latest)
+            assert search(client, 'терминатор') == ['Терминатор'], (
+                'Проверьте, что миграция 0006 заполняет поисковый индекс '
+                'существующих произведений.'
+            )
+        finally:
+            migrate('reviews', '0005_review_comment_pub_date_index')
+            monkeypatch.undo()
+            migrate('reviews', latest)
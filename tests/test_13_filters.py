@@ -0,0 +1,65 @@
+import pytest
+
+from tests.utils import create_titles
+
+
+def filter_titles(client, **params):
+    response = client.get('/api/v1/titles/', params)
+    assert response.status_code == 200
+    return sorted(title['name'] for title in response.json()['results'])
+
+
+@pytest.mark.django_db(transaction=True)
+class Test13SlugFilters:
+
+    def test_01_exact_slug(self, admin_client, client):
+        create_titles(admin_client)
+
+        assert filter_titles(client, category='films') == ['Терминатор']
+        assert filter_titles(client, category='film') == [], (
+            'Проверьте, что по умолчанию категория фильтруется по '
+            'точному совпадению слага.'
+        )
+        assert filter_titles(client, genre='horror') == ['Терминатор']
+
+    def test_02_several_genres(self, admin_client, client):
+        create_titles(admin_client)
+
+        assert filter_titles(client, genre='horror,drama') == [
+            'Крепкий орешек', 'Терминатор'
+        ], 'Проверьте, что несколько жанров объединяются через ИЛИ.'
+        assert filter_titles(
+            client, genre=['horror', 'comedy'], genre_mode='all'
+        ) == ['Терминатор']
+        assert filter_titles(
+            client, genre='horror,drama', genre_mode='all'
+        ) == [], (
+            'Проверьте, что при genre_mode=all произведение должно '
+            'относиться ко всем жанрам.'
+        )
+
+    def test_03_prefix_and_legacy_lookup(self, admin_client, client,
+                                         settings):
+        create_titles(admin_client)
+
+        settings.TITLE_SLUG_LOOKUP = 'prefix'
+        assert filter_titles(client, category='fil') == ['Терминатор']
+        assert filter_titles(client, category='ilm') == []
+
+        settings.TITLE_SLUG_LOOKUP = 'icontains'
+        assert filter_titles(client, category='ILM') == ['Терминатор']
+
+    def test_04_slug_cache_invalidation(self, admin_client, client):
+        create_titles(admin_client)
+        assert filter_titles(client, category='music') == []
+
+        admin_client.post(
+            '/api/v1/categories/', data={'name': 'Музыка', 'slug': 'music'}
+        )
+        admin_client.post('/api/v1/titles/', data={
+            'name': 'Сюита', 'year': 1720, 'genre': ['drama'],
+            'category': 'music'
+        })
+        assert filter_titles(client, category='music') == ['Сюита'], (
+            'Проверьте, что кэш слагов сбрасывается при создании категории.'
+        )
@@ -0,0 +1,127 @@
+from http import HTTPStatus
+
+import pytest
+from django.core import mail
+from django.core.management import call_command
+
+
+@pytest.mark.django_db(transaction=True)
+class Test14MailQueue:
+    url_signup = '/api/v1/auth/signup/'
+
+    def test_01_signup_enqueues_mail(self, client, settings):
+        from reviews.models import SENT, OutgoingEmail
+
+        settings.EMAIL_QUEUE = True
+        outbox_before_count = len(mail.outbox)
+        data = {'email': 'queued@yamdb.fake', 'username': 'queued'}
+
+        response = client.post(self.url_signup, data=data)
+        assert response.status_code == HTTPStatus.OK
+        assert len(mail.outbox) == outbox_before_count, (
+            'Проверьте, что при включенной очереди письмо не отправляется '
+            'во время запроса.'
+        )
+        assert OutgoingEmail.objects.filter(
+            recipient=data['email']
+        ).count() == 1
+
+        call_command('send_queued_mail')
+        assert len(mail.outbox) == outbox_before_count + 1
+        assert data['email'] in mail.outbox[-1].to
+        email = OutgoingEmail.objects.get(recipient=data['email'])
+        assert (email.status, email.attempts) == (SENT, 1)
+
+    def test_02_retry_with_backoff(self, settings, monkeypatch):
+        from django.utils import timezone
+
+        from reviews.models import FAILED, PENDING, OutgoingEmail
+        from reviews.outbox import dispatch_pending, enqueue_mail
+
+        def broken_send(self, *args, **kwargs):
+            raise ConnectionError('SMTP недоступен')
+
+        settings.EMAIL_QUEUE_MAX_ATTEMPTS = 2
+        monkeypatch.setattr(
+            'django.core.mail.EmailMessage.send', broken_send
+        )
+        enqueue_mail('Тема', 'Текст', 'info@yamdb.ru', 'retry@yamdb.fake')
+
+        assert dispatch_pending() == (0, 1)
+        email = OutgoingEmail.objects.get()
+        assert (email.status, email.attempts) == (PENDING, 1)
+        assert email.next_attempt_at > timezone.now()
+        assert 'SMTP' in email.last_error
+        assert dispatch_pending() == (0, 0), (
+            'Проверьте, что повторная попытка откладывается.'
+        )
+
+        OutgoingEmail.objects.update(next_attempt_at=timezone.now())
+        dispatch_pending()
+        assert OutgoingEmail.objects.get().status == FAILED
+
+    def test_03_concurrent_dispatchers(self, monkeypatch):
+        from django.db import transaction
+
+        from reviews.models import SENDING, SENT, OutgoingEmail
+        from reviews.outbox import dispatch_pending, enqueue_mail
+
+        for idx in range(3):
+            enqueue_mail('Тема', 'Текст', 'info@yamdb.ru',
+                         f'user{idx}@yamdb.fake')
+        outbox_before_count = len(mail.outbox)
+        send = mail.EmailMessage.send
+        nested = []
+
+        def send_and_dispatch(self, *args, **kwargs):
+            assert not transaction.get_connection().in_atomic_block, (
+                'Проверьте, что письма отправляются вне транзакции.'
+            )
+            assert set(OutgoingEmail.objects.values_list(
+                'status', flat=True
+            )) == {SENDING}
+            if not nested:
+                # Второй отправитель запускается, пока первый шлет письма.
+                nested.append(dispatch_pending())
+            return send(self, *args, **kwargs)
+
+        monkeypatch.setattr(mail.EmailMessage, 'send', send_and_dispatch)
+        assert dispatch_pending() == (3, 0)
+        assert nested == [(0, 0)], (
+            'Проверьте, что второй отправитель не получает письма, '
+            'уже забранные первым.'
+        )
+        recipients = [
+            message.to[0] for message in mail.outbox[outbox_before_count:]
+        ]
+        assert sorted(recipients) == [
+            f'user{idx}@yamdb.fake' for idx in range(3)
+        ]
+        assert set(OutgoingEmail.objects.values_list(
+            'status', flat=True
+        )) == {SENT}
+
+    def test_04_expired_lease(self):
+        from datetime import timedelta
+
+        from django.utils import timezone
+
+        from reviews.models import SENDING, SENT, OutgoingEmail
+        from reviews.outbox import dispatch_pending, enqueue_mail
+
+        enqueue_mail('Тема', 'Текст', 'info@yamdb.ru', 'lease@yamdb.fake')
+        OutgoingEmail.objects.update(
+            status=SENDING,
+            next_attempt_at=timezone.now() + timedelta(minutes=1),
+        )
+        assert dispatch_pending() == (0, 0), (
+            'Проверьте, что письмо под арендой не отправляется повторно.'
+        )
+        OutgoingEmail.objects.update(
+            next_attempt_at=timezone.now() - timedelta(seconds=1),
+        )
+        assert dispatch_pending() == (1, 0), (
+            'Проверьте, что письмо упавшего отправителя отправляется '
+            'после истечения аренды.'
+        )
+        assert OutgoingEmail.objects.get().status == SENT
@@ -0,0 +1,53 @@
+from http import HTTPStatus
+
+import pytest
+from django.core import mail
+
+
+@pytest.mark.django_db(transaction=True)
+class Test15StatelessConfirmationCode:
+    url_signup = '/api/v1/auth/signup/'
+    url_token = '/api/v1/auth/token/'
+    data = {'email': 'stateless@yamdb.fake', 'username': 'stateless'}
+
+    def get_code(self):
+        return mail.outbox[-1].body.split()[-1]
+
+    def test_01_signup_does_not_store_code(self, client, settings,
+                                           django_user_model,
+                                           django_assert_num_queries):
+        settings.CONFIRMATION_CODE_STATELESS = True
+        client.post(self.url_signup, data=self.data)
+        user = django_user_model.objects.get(username=self.data['username'])
+        assert user.confirmation_code is None, (
+            'Проверьте, что в режиме CONFIRMATION_CODE_STATELESS код '
+            'подтверждения не сохраняется в базе.'
+        )
+
+        with django_assert_num_queries(1):
+            response = client.post(self.url_signup, data=self.data)
+        assert response.status_code == HTTPStatus.OK
+
+    def test_02_token_by_signed_code(self, client, settings):
+        settings.CONFIRMATION_CODE_STATELESS = True
+        client.post(self.url_signup, data=self.data)
+        data = {
+            'username': self.data['username'],
+            'confirmation_code': self.get_code(),
+        }
+
+        response = client.post(
+            self.url_token,
+            data={**data, 'confirmation_code': 'wrong-code'}
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+        response = client.post(self.url_token, data=data)
+        assert response.status_code == HTTPStatus.CREATED
+        assert 'token' in response.json()
+
+        settings.PASSWORD_RESET_TIMEOUT = -1
+        response = client.post(self.url_token, data=data)
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что просроченный код подтверждения не принимается.'
+        )
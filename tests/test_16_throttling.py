@@ -0,0 +1,96 @@
+from http import HTTPStatus
+
+import pytest
+
+
+@pytest.mark.django_db(transaction=True)
+class Test16Throttling:
+    url_signup = '/api/v1/auth/signup/'
+    url_token = '/api/v1/auth/token/'
+
+    @pytest.fixture(autouse=True)
+    def rates(self, settings):
+        settings.REST_FRAMEWORK = {
+            **settings.REST_FRAMEWORK,
+            'DEFAULT_THROTTLE_RATES': {
+                'auth_ip': '5/min',
+                'auth_username': '2/min',
+            },
+        }
+
+    def signup(self, client, username):
+        return client.post(self.url_signup, data={
+            'username': username, 'email': f'{username}@yamdb.fake'
+        })
+
+    def test_01_username_limit(self, client):
+        for _ in range(2):
+            assert self.signup(client, 'limited').status_code == HTTPStatus.OK
+        response = self.signup(client, 'Limited')
+        assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS, (
+            'Проверьте, что число запросов на один username ограничено.'
+        )
+        assert 0 < int(response['Retry-After']) <= 60, (
+            'Проверьте, что при превышении лимита возвращается '
+            'заголовок Retry-After.'
+        )
+        response = client.post(self.url_token, data={
+            'username': 'limited', 'confirmation_code': 'code'
+        })
+        assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+        assert self.signup(client, 'other').status_code == HTTPStatus.OK
+
+    def test_02_ip_limit(self, client):
+        for idx in range(5):
+            assert self.signup(client, f'user{idx}').status_code == (
+                HTTPStatus.OK
+            )
+        response = self.signup(client, 'user5')
+        assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS, (
+            'Проверьте, что число запросов с одного IP ограничено.'
+        )
+        assert 'Retry-After' in response
+
+    def test_03_sliding_window(self, monkeypatch):
+        from django.test import RequestFactory
+        from rest_framework.request import Request
+
+        from api.throttling import AuthIPThrottle
+
+        now = [90.0]
+        monkeypatch.setattr(AuthIPThrottle, 'timer', lambda self: now[0])
+        request = Request(RequestFactory().post('/'))
+
+        def allow():
+            return AuthIPThrottle().allow_request(request, None)
+
+        assert all(allow() for _ in range(5))
+        assert not allow()
+        # Середина следующего окна: учтена половина прошлых запросов (2.5).
+        now[0] = 150.0
+        assert all(allow() for _ in range(3))
+        assert not allow(), (
+            'Проверьте, что запросы предыдущего окна учитываются '
+            'пропорционально оставшейся доле окна.'
+        )
+        now[0] = 240.0
+        assert all(allow() for _ in range(5))
+
+    def test_04_forwarded_for_is_not_trusted(self, client):
+        for idx in range(5):
+            response = client.post(
+                self.url_signup,
+                data={'username': f'user{idx}',
+                      'email': f'user{idx}@yamdb.fake'},
+                HTTP_X_FORWARDED_FOR=f'10.0.0.{idx}',
+            )
+            assert response.status_code == HTTPStatus.OK
+        response = client.post(
+            self.url_signup,
+            data={'username': 'user5', 'email': 'user5@yamdb.fake'},
+            HTTP_X_FORWARDED_FOR='10.0.0.5',
+        )
+        assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS, (
+            'Проверьте, что лимит по IP нельзя обойти подменой '
+            'заголовка X-Forwarded-For.'
+        )
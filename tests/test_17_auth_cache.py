@@ -0,0 +1,48 @@
+from http import HTTPStatus
+
+import pytest
+
+
+@pytest.mark.django_db(transaction=True)
+class Test17AuthenticatedUserCache:
+    url_me = '/api/v1/users/me/'
+
+    def test_01_user_is_cached(self, user_client, django_assert_num_queries):
+        assert user_client.get(self.url_me).status_code == HTTPStatus.OK
+        with django_assert_num_queries(0):
+            response = user_client.get(self.url_me)
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что повторный запрос с тем же токеном '
+            'не загружает пользователя из базы.'
+        )
+
+    def test_02_cache_is_reset_on_save(self, admin_client, user_client,
+                                       user):
+        url = f'/api/v1/users/{user.username}/'
+        assert user_client.get('/api/v1/users/').status_code == (
+            HTTPStatus.FORBIDDEN
+        )
+        response = admin_client.patch(url, data={'role': 'admin'})
+        assert response.status_code == HTTPStatus.OK
+        assert user_client.get('/api/v1/users/').status_code == (
+            HTTPStatus.OK
+        ), 'Проверьте, что смена роли сбрасывает кэш пользователя.'
+
+        admin_client.delete(url)
+        assert user_client.get(self.url_me).status_code == (
+            HTTPStatus.UNAUTHORIZED
+        ), 'Проверьте, что удаление пользователя сбрасывает кэш.'
+
+    def test_03_patch_me_keeps_secrets(self, user_client, user):
+        user.confirmation_code = 'code'
+        user.save()
+        user_client.get(self.url_me)
+        response = user_client.patch(self.url_me, data={'bio': 'new bio'})
+        assert response.status_code == HTTPStatus.OK
+        assert user_client.get(self.url_me).json()['bio'] == 'new bio'
+        user.refresh_from_db()
+        assert user.confirmation_code == 'code'
+        assert user.check_password('1234567'), (
+            'Проверьте, что сохранение закэшированного пользователя '
+            'не перезаписывает пароль и код подтверждения.'
+        )
@@ -0,0 +1,197 @@
+import threading
+from unittest import mock
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.db import OperationalError, connections
+
+from api_yamdb.backends.base import HealthChecksMixin
+from api_yamdb.backends.sqlite3 import base
+from tests.utils import sqlite_settings
+
+
+class DatabaseWrapper(HealthChecksMixin, base.DatabaseWrapper):
+    pass
+
+
+def make_wrapper(tmp_path, **settings):
+    return DatabaseWrapper(
+        dict(sqlite_settings(str(tmp_path / 'test.sqlite3')), **settings),
+        alias='file',
+    )
+
+
+@pytest.fixture
+def postgresql_backend(monkeypatch):
+    """Бэкенд PostgreSQL, у которого psycopg2.connect выдает заглушки."""
+
+    psycopg2 = pytest.importorskip('psycopg2')
+    from psycopg2 import extensions
+
+    from api_yamdb.backends.postgresql import base as backend
+
+    def connect(*args, **kwargs):
+        return mock.MagicMock(
+            closed=0, isolation_level=extensions.ISOLATION_LEVEL_DEFAULT,
+            info=mock.Mock(
+                transaction_status=extensions.TRANSACTION_STATUS_IDLE
+            ),
+        )
+
+    monkeypatch.setattr(psycopg2, 'connect', connect)
+    monkeypatch.setattr(backend.extras, 'register_default_jsonb', mock.Mock())
+    monkeypatch.setattr(backend, '_pools', {})
+    return backend
+
+
+@pytest.fixture
+def wrapper(tmp_path):
+    wrapper = make_wrapper(
+        tmp_path, CONN_MAX_AGE=None, CONN_HEALTH_CHECKS=True
+    )
+    yield wrapper
+    wrapper.close()
+
+
+@pytest.mark.django_db(transaction=True)
+class Test18HealthChecks:
+
+    def test_01_usable_connection_is_reused(self, wrapper, monkeypatch):
+        checks = []
+        monkeypatch.setattr(
+            wrapper, 'is_usable', lambda: checks.append(1) or True
+        )
+        wrapper.ensure_connection()
+        connection = wrapper.connection
+        wrapper.close_if_unusable_or_obsolete()
+        wrapper.ensure_connection()
+        wrapper.ensure_connection()
+        assert wrapper.connection is connection
+        assert len(checks) == 1, (
+            'Проверьте, что постоянное соединение проверяется один раз '
+            'за запрос.'
+        )
+
+    def test_02_broken_connection_is_replaced(self, wrapper, monkeypatch):
+        wrapper.ensure_connection()
+        connection = wrapper.connection
+        wrapper.close_if_unusable_or_obsolete()
+        monkeypatch.setattr(wrapper, 'is_usable', lambda: False)
+        wrapper.ensure_connection()
+        assert wrapper.connection is not None
+        assert wrapper.connection is not connection, (
+            'Проверьте, что разорванное соединение открывается заново.'
+        )
+
+
+@pytest.mark.django_db(transaction=True)
+class Test18SQLitePragmas:
+
+    def test_01_pragmas_are_applied(self, wrapper, settings):
+        expected = {
+            'journal_mode': 'wal',
+            'synchronous': 1,
+            'busy_timeout': settings.SQLITE_PRAGMAS['busy_timeout'],
+            'mmap_size': settings.SQLITE_PRAGMAS['mmap_size'],
+            'cache_size': settings.SQLITE_PRAGMAS['cache_size'],
+        }
+        with wrapper.cursor() as cursor:
+            for name, value in expected.items():
+                cursor.execute(f'PRAGMA {name}')
+                assert cursor.fetchone()[0] == value, (
+                    f'Проверьте, что PRAGMA {name} задается '
+                    'для каждого соединения с SQLite.'
+                )
+
+    def test_02_invalid_pragma(self, tmp_path):
+        wrapper = make_wrapper(
+            tmp_path, OPTIONS={'pragmas': {'cache_size': '1; DROP'}}
+        )
+        with pytest.raises(ImproperlyConfigured):
+            wrapper.ensure_connection()
+
+
+@pytest.mark.django_db(transaction=True)
+class Test18PostgreSQLPool:
+
+    @staticmethod
+    def make_wrapper(backend, timeout):
+        return backend.DatabaseWrapper(
+            dict(connections['default'].settings_dict, NAME='api_yamdb',
+                 ENGINE='api_yamdb.backends.postgresql', CONN_MAX_AGE=0,
+                 CONN_HEALTH_CHECKS=True,
+                 OPTIONS={'pool': {'max_size': 1, 'timeout': timeout}}),
+            alias='pooled',
+        )
+
+    def test_01_exhausted_pool_fails_after_timeout(self, postgresql_backend):
+        first = self.make_wrapper(postgresql_backend, 0.05)
+        first.ensure_connection()
+        second = self.make_wrapper(postgresql_backend, 0.05)
+        with pytest.raises(OperationalError, match='Нет свободного'):
+            second.ensure_connection()
+        first.close()
+        second.ensure_connection()
+        assert second.connection is not None, (
+            'Проверьте, что соединение возвращается в пул при закрытии.'
+        )
+
+    def test_02_waits_for_released_connection(self, postgresql_backend):
+        first = self.make_wrapper(postgresql_backend, 5)
+        first.ensure_connection()
+        acquired = threading.Event()
+        errors = []
+
+        def connect():
+            second = self.make_wrapper(postgresql_backend, 5)
+            try:
+                second.ensure_connection()
+            except Exception as error:
+                errors.append(error)
+            acquired.set()
+
+        thread = threading.Thread(target=connect)
+        thread.start()
+        assert not acquired.wait(0.1)
+        first.close()
+        thread.join(5)
+        assert acquired.is_set() and errors == [], (
+            'Проверьте, что пул ждет освобождения соединения, '
+            'а не сразу выбрасывает PoolError.'
+        )
+
+    def test_03_closed_pool_is_recreated(self, postgresql_backend):
+        wrapper = self.make_wrapper(postgresql_backend, 0.05)
+        wrapper.ensure_connection()
+        connection_pool = wrapper.connection_pool
+        wrapper.close()
+        postgresql_backend.close_pools('api_yamdb')
+        assert connection_pool.closed, (
+            'Проверьте, что close_pools закрывает пул базы.'
+        )
+        wrapper.ensure_connection()
+        assert wrapper.connection_pool is not connection_pool
+        wrapper.close()
+
+    def test_04_pooled_connection_is_checked(self, postgresql_backend):
+        import psycopg2
+
+        wrapper = self.make_wrapper(postgresql_backend, 0.05)
+        wrapper.ensure_connection()
+        broken = wrapper.connection
+        wrapper.close()
+
+        def execute(sql, *args):
+            if sql == 'SELECT 1':
+                # Так psycopg2 помечает соединение, закрытое сервером.
+                broken.closed = 2
+                raise psycopg2.OperationalError('server closed the connection')
+
+        cursor = broken.cursor.return_value.__enter__.return_value
+        cursor.execute.side_effect = execute
+        wrapper.ensure_connection()
+        assert wrapper.connection is not broken, (
+            'Проверьте, что соединение из пула проверяется перед '
+            'первым запросом и разорванное заменяется.'
+        )
+        wrapper.close()
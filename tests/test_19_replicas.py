@@ -0,0 +1,174 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.management import call_command
+from django.db import connections, router
+
+from tests.utils import sqlite_settings
+
+
+def add_database(alias, name):
+    connections.settings[alias] = sqlite_settings(name)
+
+
+def remove_database(alias):
+    if hasattr(connections._connections, alias):
+        connections[alias].close()
+        delattr(connections._connections, alias)
+    del connections.settings[alias]
+
+
+@pytest.fixture
+def replica(tmp_path, settings):
+    add_database('replica', str(tmp_path / 'replica.sqlite3'))
+    call_command('migrate', database='replica', verbosity=0)
+    settings.DATABASE_REPLICAS = ['replica']
+    yield 'replica'
+    remove_database('replica')
+
+
+def category_slugs(client):
+    response = client.get('/api/v1/categories/')
+    assert response.status_code == HTTPStatus.OK
+    return [category['slug'] for category in response.json()['results']]
+
+
+@pytest.mark.django_db(transaction=True)
+class Test19ReplicaRouting:
+
+    def test_01_safe_requests_read_replica(self, client, replica, clock,
+                                           settings):
+        from reviews.models import Category
+
+        Category.objects.using(replica).create(name='Реплика', slug='replica')
+        clock.value += settings.REPLICA_PIN_SECONDS
+        assert category_slugs(client) == ['replica'], (
+            'Проверьте, что безопасные запросы читают данные с реплики.'
+        )
+
+    def test_02_read_your_writes(self, admin_client, client, replica):
+        from reviews.models import Category
+
+        Category.objects.using(replica).create(name='Реплика', slug='replica')
+        response = admin_client.post(
+            '/api/v1/categories/', data={'name': 'Новая', 'slug': 'new'}
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        assert not Category.objects.using(replica).filter(
+            slug='new'
+        ).exists()
+        assert category_slugs(admin_client) == ['new'], (
+            'Проверьте, что после записи клиент читает с основной базы.'
+        )
+
+    def test_03_unhealthy_replica_is_skipped(self, client, replica,
+                                             settings, tmp_path, clock):
+        from reviews.models import Category
+
+        add_database('broken', str(tmp_path / 'missing' / 'db.sqlite3'))
+        settings.DATABASE_REPLICAS = ['broken', replica]
+        settings.API_CACHE_TIMEOUT = 0
+        Category.objects.using(replica).create(name='Реплика', slug='replica')
+        clock.value += settings.REPLICA_PIN_SECONDS
+        try:
+            for _ in range(2):
+                assert category_slugs(client) == ['replica']
+        finally:
+            remove_database('broken')
+        assert 'broken' in router.routers[0].unhealthy_until, (
+            'Проверьте, что недоступная реплика исключается из ротации.'
+        )
+
+    def test_04_recent_changes_read_primary(self, admin_client, client,
+                                            replica, clock, settings):
+        from reviews.models import Category
+
+        response = admin_client.post(
+            '/api/v1/categories/', data={'name': 'Новая', 'slug': 'new'}
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        response = client.get('/api/v1/categories/')
+        assert [category['slug'] for category in response.json()['results']
+                ] == ['new'], (
+            'Проверьте, что ответ на ресурс, измененный позже '
+            'REPLICA_PIN_SECONDS назад, читается с основной базы.'
+        )
+        assert response['X-Cache'] == 'MISS' and 'ETag' in response
+
+        clock.value += settings.REPLICA_PIN_SECONDS
+        response = client.get('/api/v1/categories/')
+        assert response['X-Cache'] == 'HIT', (
+            'Проверьте, что ответы при чтении с реплик кэшируются.'
+        )
+        Category.objects.using(replica).create(name='Реплика', slug='replica')
+        clock.value += settings.REPLICA_PIN_SECONDS
+        response = client.get('/api/v1/categories/')
+        assert response['X-Cache'] == 'MISS' and 'ETag' in response, (
+            'Проверьте, что ответ с реплики получает ETag, если ресурс '
+            'не менялся дольше REPLICA_PIN_SECONDS.'
+        )
+        assert [category['slug'] for category in response.json()['results']
+                ] == ['replica']
+
+    def test_05_one_replica_per_request(self, client, replica, settings,
+                                        tmp_path, clock):
+        from reviews.models import Category
+
+        add_database('second', str(tmp_path / 'second.sqlite3'))
+        try:
+            call_command('migrate', database='second', verbosity=0)
+            settings.DATABASE_REPLICAS = [replica, 'second']
+            settings.API_CACHE_TIMEOUT = 0
+            Category.objects.using(replica).create(name='Одна', slug='one')
+            for slug in ('first', 'second'):
+                Category.objects.using('second').create(name=slug, slug=slug)
+            clock.value += settings.REPLICA_PIN_SECONDS
+            pages = set()
+            for _ in range(4):
+                data = client.get('/api/v1/categories/').json()
+                slugs = tuple(
+                    category['slug'] for category in data['results']
+                )
+                assert (data['count'], slugs) in (
+                    (1, ('one',)), (2, ('first', 'second')),
+                ), (
+                    'Проверьте, что все запросы страницы читают '
+                    'с одной реплики.'
+                )
+                pages.add(slugs)
+            assert len(pages) == 2, (
+                'Проверьте, что запросы распределяются по репликам.'
+            )
+        finally:
+            remove_database('second')
+
+    def test_06_users_read_primary(self, user_client, replica, clock,
+                                   settings):
+        clock.value += settings.REPLICA_PIN_SECONDS
+        response = user_client.get('/api/v1/categories/')
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что пользователь для JWT-аутентификации читается '
+            'с основной базы: на реплике его еще может не быть.'
+        )
+
+    def test_07_process_local_pin_warning(self, replica, settings):
+        from api.checks import check_replica_pin_shared
+
+        settings.DEBUG = False
+        assert [warning.id for warning in check_replica_pin_shared(None)] == [
+            'api.W002'
+        ], 'Проверьте предупреждение об отметке записи в памяти процесса.'
+        settings.DATABASE_REPLICAS = []
+        assert check_replica_pin_shared(None) == []
+
+    def test_08_missing_sqlite_replica_is_unhealthy(self, replica, tmp_path):
+        path = tmp_path / 'absent.sqlite3'
+        add_database('absent', str(path))
+        try:
+            assert not router.routers[0].is_healthy('absent')
+        finally:
+            remove_database('absent')
+        assert not path.exists(), (
+            'Проверьте, что вместо отсутствующей реплики SQLite '
+            'не создается пустая база.'
+        )
@@ -0,0 +1,134 @@
+from http import HTTPStatus
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from django.urls import include, path
+
+from api.async_views import async_read_urls
+from api.urls import router
+from api.views import CommentViewSet, ReviewViewSet, TitleViewSet
+from tests.utils import (create_single_comment, create_single_review,
+                         create_titles)
+
+urlpatterns = [
+    path('api/v1/', include(async_read_urls(
+        router.urls, (TitleViewSet, ReviewViewSet, CommentViewSet)
+    ))),
+    path('api/', include('api.urls')),
+]
+
+# Last-Modified зависит от времени запроса, см. test_11.
+HEADERS = ('Content-Type', 'ETag', 'Allow', 'Vary')
+
+
+@async_to_sync
+async def get(url, **headers):
+    return await AsyncClient().get(url, **headers)
+
+
+@pytest.fixture
+def async_get(settings):
+    settings.ROOT_URLCONF = __name__
+    return get
+
+
+@pytest.fixture
+def urls(admin_client, user_client):
+    titles, _, _ = create_titles(admin_client)
+    title_id = titles[0]['id']
+    review = create_single_review(
+        user_client, title_id, 'Отзыв', 7
+    ).json()
+    create_single_comment(user_client, title_id, review['id'], 'Комментарий')
+    return [
+        '/api/v1/titles/',
+        f'/api/v1/titles/{title_id}/',
+        f'/api/v1/titles/{title_id}/reviews/',
+        f'/api/v1/titles/{title_id}/reviews/{review["id"]}/',
+        f'/api/v1/titles/{title_id}/reviews/{review["id"]}/comments/',
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+class Test20AsyncReadViews:
+
+    def test_01_responses_match_sync_views(self, client, urls, settings):
+        expected = {}
+        for url in urls:
+            response = client.get(url)
+            assert response.status_code == HTTPStatus.OK
+            expected[url] = response
+        settings.ROOT_URLCONF = __name__
+        for url in urls:
+            response = get(url)
+            assert response.status_code == HTTPStatus.OK
+            assert response.json() == expected[url].json(), (
+                f'Проверьте, что асинхронный `{url}` возвращает те же '
+                'данные, что и синхронный.'
+            )
+            for header in HEADERS:
+                assert response.get(header) == expected[url].get(header), (
+                    f'Проверьте заголовок {header} ответа `{url}`.'
+                )
+
+    def test_02_cache_hit_and_not_modified(self, client, urls, async_get):
+        url = urls[0]
+        response = async_get(url)
+        assert response['X-Cache'] == 'MISS'
+        response = async_get(url)
+        assert response['X-Cache'] == 'HIT', (
+            'Проверьте, что асинхронный список произведений '
+            'отдается из кэша.'
+        )
+        assert response.json()['count'] == 2
+
+        response = async_get(url, **{'if-none-match': response['ETag']})
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+        response = async_get(urls[2], **{'if-none-match': 'stale'})
+        assert response.status_code == HTTPStatus.OK
+        response = async_get(urls[2], **{'if-none-match': response['ETag']})
+        assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+            'Проверьте, что асинхронный список отзывов отвечает 304 '
+            'на совпадающий If-None-Match.'
+        )
+
+    def test_03_writes_and_auth(self, user_client, urls, async_get,
+                                admin_client):
+        title_url = urls[1]
+        response = async_get(title_url, authorization='Bearer invalid')
+        assert response.status_code == HTTPStatus.UNAUTHORIZED
+        response = user_client.post(f'{title_url}reviews/', data={
+            'text': 'Еще отзыв', 'score': 9,
+        })
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        response = admin_client.post(f'{title_url}reviews/', data={
+            'text': 'Отзыв администратора', 'score': 9,
+        })
+        assert response.status_code == HTTPStatus.CREATED
+        assert async_get(urls[2]).json()['count'] == 2, (
+            'Проверьте, что асинхронный список отзывов видит '
+            'новые отзывы.'
+        )
+
+    def test_04_pool_closes_connections(self, urls, async_get, monkeypatch):
+        import threading
+
+        from django.db import connections
+
+        wrapper = type(connections['default'])
+        close = wrapper.close_if_unusable_or_obsolete
+        threads = []
+
+        def record(self):
+            threads.append(threading.get_ident())
+            close(self)
+
+        monkeypatch.setattr(wrapper, 'close_if_unusable_or_obsolete', record)
+        assert async_get(urls[0])['X-Cache'] == 'MISS'
+        pooled = [ident for ident in threads
+                  if ident != threading.get_ident()]
+        assert len(pooled) == 2 * len(connections.all()), (
+            'Проверьте, что поток пула закрывает устаревшие соединения '
+            'с базой до и после запроса.'
+        )
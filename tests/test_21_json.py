@@ -0,0 +1,97 @@
+import datetime
+import io
+import uuid
+from collections import OrderedDict
+from decimal import Decimal
+from http import HTTPStatus
+
+import pytest
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from api import parsers, renderers
+
+UTC = datetime.timezone.utc
+MSK = datetime.timezone(datetime.timedelta(hours=3))
+
+DATA = [
+    OrderedDict([('id', 1), ('name', 'Побег из Шоушенка'), ('rating', 7.5)]),
+    {'price': Decimal('10.50'), 'nothing': None, 'flags': [True, False]},
+    {'utc': datetime.datetime(2023, 1, 2, 3, 4, 5, 600, tzinfo=UTC),
+     'msk': datetime.datetime(2023, 1, 2, 3, 4, 5, tzinfo=MSK),
+     'naive': datetime.datetime(2023, 1, 2, 3, 4, 5),
+     'date': datetime.date(2023, 1, 2),
+     'time': datetime.time(3, 4, 5, 123456)},
+    {'uuid': uuid.UUID(int=1), 'duration': datetime.timedelta(hours=1)},
+    {1: 'ключ-число', 'text': 'строка\u2028с\u2029разделителями'},
+    {'big': 2 ** 70, 'tuple': (1, 2)},
+    {'large': 1e16, 'small': 1e-7, 'tiny': 0.00001, 'rating': 6.5},
+    {'name': '1e5 и 0.00001 в строке', 'rating': 10.0},
+    [],
+]
+
+
+class Test21JSON:
+
+    @pytest.mark.parametrize('data', DATA)
+    def test_01_renderer_matches_json_renderer(self, data):
+        assert renderers.ORJSONRenderer().render(data) == (
+            JSONRenderer().render(data)
+        ), 'Проверьте, что ORJSONRenderer выдает те же байты, что и DRF.'
+
+    def test_02_renderer_fallbacks(self, monkeypatch):
+        data = {'name': 'Фильм', 'year': 1994}
+        renderer = renderers.ORJSONRenderer()
+        assert renderer.render(None) == b''
+        assert renderer.render(data, 'application/json; indent=4') == (
+            JSONRenderer().render(data, 'application/json; indent=4')
+        )
+        monkeypatch.setattr(renderers, 'orjson', None)
+        assert renderer.render(data) == JSONRenderer().render(data)
+
+    def test_03_parser_matches_json_parser(self, monkeypatch):
+        body = '{"text": "Отзыв", "score": 7, "rate": 0.5, "tags": []}'
+        assert parsers.ORJSONParser().parse(io.BytesIO(body.encode())) == (
+            JSONParser().parse(io.BytesIO(body.encode()))
+        )
+        for body in (b'{"text": ', b'{"score": NaN}'):
+            with pytest.raises(Exception) as expected:
+                JSONParser().parse(io.BytesIO(body))
+            with pytest.raises(Exception) as error:
+                parsers.ORJSONParser().parse(io.BytesIO(body))
+            assert str(error.value) == str(expected.value), (
+                'Проверьте, что ошибка разбора JSON не изменилась.'
+            )
+        monkeypatch.setattr(parsers, 'orjson', None)
+        assert parsers.ORJSONParser().parse(io.BytesIO(b'[1]')) == [1]
+
+    @pytest.mark.django_db(transaction=True)
+    def test_04_api_uses_orjson(self, admin_client):
+        response = admin_client.post(
+            '/api/v1/categories/', data='{"name": "Фильм", "slug": "film"}',
+            content_type='application/json',
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        assert response.content == (
+            '{"name":"Фильм","slug":"film"}'.encode()
+        )
+        assert isinstance(
+            response.renderer_context['view'].get_renderers()[0],
+            renderers.ORJSONRenderer,
+        )
+        response = admin_client.post(
+            '/api/v1/categories/', data='{"name": ',
+            content_type='application/json',
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert response.json()['detail'].startswith('JSON parse error')
+
+    def test_05_non_finite_floats(self):
+        # orjson не поддерживает NaN в JSON и записывает null,
+        # JSONRenderer со STRICT_JSON отказывается их кодировать.
+        for value in (float('nan'), float('inf'), float('-inf')):
+            with pytest.raises(ValueError):
+                JSONRenderer().render({'rating': value})
+            assert renderers.ORJSONRenderer().render(
+                {'rating': value}
+            ) == b'{"rating":null}'
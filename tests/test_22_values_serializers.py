@@ -0,0 +1,91 @@
+import pytest
+from django.core.cache import cache
+
+from tests.utils import create_comments, create_single_review
+
+
+def get_both(client, settings, url):
+    """Ответы со списками через сериализаторы DRF и через values()."""
+
+    responses = []
+    for values in (False, True):
+        settings.VALUES_LIST_SERIALIZERS = values
+        cache.clear()
+        responses.append(client.get(url))
+    return responses
+
+
+@pytest.mark.django_db(transaction=True)
+class Test22ValuesSerializers:
+
+    @pytest.fixture
+    def urls(self, admin_client, user_client, moderator_client, admin,
+             user, moderator):
+        comments, reviews, titles = create_comments(admin_client, {
+            admin: admin_client, user: user_client,
+            moderator: moderator_client,
+        })
+        create_single_review(user_client, titles[1]['id'], 'Отзыв', 10)
+        admin_client.delete('/api/v1/categories/books/')
+        title_url = f'/api/v1/titles/{titles[0]["id"]}/'
+        reviews_url = f'{title_url}reviews/'
+        comments_url = f'{reviews_url}{reviews[0]["id"]}/comments/'
+        return (
+            '/api/v1/titles/',
+            '/api/v1/titles/?page=2',
+            '/api/v1/titles/?genre=comedy',
+            '/api/v1/titles/?category=films&year=1984',
+            '/api/v1/titles/?ordering=-rating',
+            '/api/v1/titles/?search=орешек',
+            '/api/v1/titles/?name=нет такого',
+            reviews_url,
+            f'{reviews_url}?pagination=cursor',
+            comments_url,
+            f'{comments_url}?pagination=cursor',
+        )
+
+    def test_01_responses_are_identical(self, client, settings, urls,
+                                        monkeypatch):
+        from rest_framework.pagination import (CursorPagination,
+                                               PageNumberPagination)
+
+        monkeypatch.setattr(PageNumberPagination, 'page_size', 2)
+        monkeypatch.setattr(CursorPagination, 'page_size', 2)
+        for url in urls:
+            while url:
+                expected, response = get_both(client, settings, url)
+                assert response.status_code == expected.status_code
+                assert response.content == expected.content, (
+                    f'Проверьте, что список `{url}` через values() '
+                    'совпадает побайтно со списком через сериализатор.'
+                )
+                url = response.json().get('next')
+
+    def test_02_list_reads_only_output_columns(
+            self, client, settings, urls, django_assert_max_num_queries):
+        settings.VALUES_LIST_SERIALIZERS = True
+        with django_assert_max_num_queries(3) as context:
+            client.get(urls[0])
+        page_sql = context.captured_queries[1]['sql']
+        assert 'rating_sum' not in page_sql, (
+            'Проверьте, что список произведений выбирает только поля '
+            'ответа через values().'
+        )
+
+    def test_03_title_rating_is_formatted(self):
+        from api.serializers import TitleValuesSerializer
+
+        row = {
+            'id': 0, 'name': 'Без жанров', 'year': 2000, 'rating': 8,
+            'description': '', 'category__name': None,
+            'category__slug': None,
+        }
+        data = TitleValuesSerializer().to_representation([row])
+        assert data == [{
+            'id': 0, 'name': 'Без жанров', 'year': 2000, 'rating': 8.0,
+            'description': '', 'genre': [], 'category': None,
+        }]
+        assert isinstance(data[0]['rating'], float), (
+            'Проверьте, что рейтинг форматируется полем FloatField '
+            'TitleViewingSerializer.'
+        )
@@ -0,0 +1,211 @@
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import models
+
+
+def import_csv(*args):
+    """Запускает csv_importer и возвращает его stdout."""
+
+    from io import StringIO
+
+    stdout = StringIO()
+    call_command('csv_importer', *args, stdout=stdout)
+    return stdout.getvalue()
+
+
+def snapshot():
+    """Строки импортированных таблиц без дат, выставляемых при вставке."""
+
+    from reviews.management.commands.csv_importer import model_csv_equal
+
+    rows = {}
+    for model in model_csv_equal.values():
+        dates = {
+            field.attname for field in model._meta.concrete_fields
+            if isinstance(field, models.DateTimeField)
+        }
+        rows[model.__name__] = [
+            {key: value for key, value in row.items() if key not in dates}
+            for row in model.objects.order_by('pk').values()
+        ]
+    return rows
+
+
+def clear_imported():
+    from reviews.management.commands.csv_importer import model_csv_equal
+
+    for model in reversed(list(model_csv_equal.values())):
+        model.objects.all().delete()
+
+
+@pytest.mark.django_db(transaction=True)
+class Test23CsvImporter:
+
+    @pytest.fixture(autouse=True)
+    def data_dir(self, settings, monkeypatch):
+        monkeypatch.chdir(settings.BASE_DIR)
+
+    @pytest.mark.parametrize('options', (
+        ('--bulk',),
+        ('--bulk', '--chunk-size=7'),
+    ))
+    def test_01_bulk_matches_row_by_row(self, options):
+        import_csv()
+        expected = snapshot()
+        assert all(expected.values()), (
+            'Проверьте, что построчный импорт загружает все файлы.'
+        )
+        clear_imported()
+        import_csv(*options)
+        assert snapshot() == expected, (
+            f'Проверьте, что импорт с {options} загружает те же строки, '
+            'что и построчный импорт.'
+        )
+
+    def test_02_chunk_size(self, monkeypatch):
+        from reviews.management.commands.csv_importer import model_csv_equal
+        from reviews.models import GenreTitle
+
+        batches = []
+        bulk_create = models.QuerySet.bulk_create
+
+        def spy(queryset, objs, *args, **kwargs):
+            if queryset.model in model_csv_equal.values():
+                batches.append((queryset.model, len(objs)))
+            return bulk_create(queryset, objs, *args, **kwargs)
+
+        monkeypatch.setattr(models.QuerySet, 'bulk_create', spy)
+        import_csv('--bulk', '--chunk-size=7')
+        assert all(size <= 7 for _, size in batches), (
+            'Проверьте, что `--chunk-size` ограничивает размер пачки.'
+        )
+        genre_titles = [size for model, size in batches if model is GenreTitle]
+        assert genre_titles == [7] * 6, (
+            'Проверьте, что файл вставляется пачками по `--chunk-size` '
+            'строк.'
+        )
+
+    def test_03_malformed_foreign_key(self, tmp_path, monkeypatch):
+        from reviews.management.commands import csv_importer
+        from reviews.models import Title
+
+        path = tmp_path / 'titles.csv'
+        path.write_text(
+            'id,name,year,category\n'
+            '1,Побег из Шоушенка,1994,\n'
+            '2,Крестный отец,1972,фильм\n',
+            encoding='utf-8',
+        )
+        monkeypatch.setattr(
+            csv_importer, 'model_csv_equal', {str(path): Title}
+        )
+        with pytest.raises(CommandError) as error:
+            import_csv('--bulk')
+        assert f'{path}, строка 3' in str(error.value), (
+            'Проверьте, что некорректный внешний ключ приводит к '
+            'CommandError с именем файла и номером строки.'
+        )
+
+    def test_04_row_by_row_errors_go_to_stdout(self, tmp_path, monkeypatch):
+        from reviews.management.commands import csv_importer
+        from reviews.models import Title
+
+        path = tmp_path / 'titles.csv'
+        path.write_text(
+            'id,name,year,category\n'
+            '2,Крестный отец,1972,фильм\n',
+            encoding='utf-8',
+        )
+        monkeypatch.setattr(
+            csv_importer, 'model_csv_equal', {str(path): Title}
+        )
+        assert 'Ошибка в строке 2.' in import_csv(), (
+            'Проверьте, что построчный импорт пишет ошибки '
+            'в stdout команды.'
+        )
+
+    @pytest.mark.parametrize('options', (
+        ('--workers=3',),
+        ('--bulk', '--workers=3'),
+    ))
+    def test_05_workers_match_sequential(self, options):
+        from django.db import connection
+
+        if connection.vendor == 'sqlite' and connection.is_in_memory_db():
+            pytest.skip(
+                'В общей памяти SQLite параллельные записи сразу '
+                'получают "database table is locked".'
+            )
+        import_csv('--bulk')
+        expected = snapshot()
+        clear_imported()
+        import_csv(*options)
+        assert snapshot() == expected, (
+            f'Проверьте, что импорт с {options} загружает те же строки, '
+            'что и последовательный импорт.'
+        )
+
+
+class Test23CsvImporterOrder:
+
+    def test_01_dependencies(self):
+        from reviews.management.commands.csv_importer import Command
+
+        assert Command()._dependencies() == {
+            'static/data/category.csv': set(),
+            'static/data/genre.csv': set(),
+            'static/data/users.csv': set(),
+            'static/data/titles.csv': {'static/data/category.csv'},
+            'static/data/genre_title.csv': {
+                'static/data/titles.csv', 'static/data/genre.csv',
+            },
+            'static/data/review.csv': {
+                'static/data/titles.csv', 'static/data/users.csv',
+            },
+            'static/data/comments.csv': {
+                'static/data/review.csv', 'static/data/users.csv',
+            },
+        }, 'Проверьте граф зависимостей файлов по внешним ключам.'
+
+    def test_02_run_in_order(self):
+        import threading
+        import time
+
+        from reviews.management.commands.csv_importer import Command
+
+        command = Command()
+        lock = threading.Lock()
+        events = []
+        threads = set()
+
+        def import_file(path, model):
+            with lock:
+                events.append(('start', path))
+                threads.add(threading.get_ident())
+            time.sleep(0.02)
+            with lock:
+                events.append(('finish', path))
+
+        command._run_in_order(import_file, workers=3)
+        dependencies = command._dependencies()
+        assert {path for _, path in events} == set(dependencies)
+        for path, required in dependencies.items():
+            started = events.index(('start', path))
+            for dependency in required:
+                assert events.index(('finish', dependency)) < started, (
+                    f'Проверьте, что `{path}` загружается только после '
+                    f'`{dependency}`.'
+                )
+        assert len(threads) > 1, (
+            'Проверьте, что независимые файлы загружаются параллельно.'
+        )
+
+    def test_03_cyclic_dependencies(self, monkeypatch):
+        from reviews.management.commands.csv_importer import Command
+
+        monkeypatch.setattr(Command, '_dependencies', lambda self: {
+            'a.csv': {'b.csv'}, 'b.csv': {'a.csv'},
+        })
+        with pytest.raises(CommandError, match='Циклическая зависимость'):
+            Command()._run_in_order(lambda path, model: None, workers=2)
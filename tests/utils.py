@@ -1,5 +1,9 @@
 from http import HTTPStatus
 
+from django.conf import settings
+from django.db import connection, connections
+from django.db.migrations.executor import MigrationExecutor
+
 
 check_name_and_slug_patterns = (
     (
@@ -305,3 +309,24 @@ def check_fields(obj_type, url_pattern, obj, expected_data, detail=False):
         f'данные {obj_types[obj_type]}{results_in_msg}. Поле `id` не '
         'найдено или не является целым числом.'
     )
+
+
+def migrate(app_label, migration):
+    """Переводит схему app_label на миграцию, возвращает ее apps."""
+
+    executor = MigrationExecutor(connection)
+    target = [(app_label, migration)]
+    executor.migrate(target)
+    executor.loader.build_graph()
+    return executor.loader.project_state(target).apps
+
+
+def sqlite_settings(name, **options):
+    """Настройки базы SQLite проекта, при любом DB_ENGINE."""
+
+    return {
+        **connections.settings['default'],
+        'ENGINE': 'api_yamdb.backends.sqlite3',
+        'NAME': name,
+        'OPTIONS': {'pragmas': settings.SQLITE_PRAGMAS, **options},
+    }